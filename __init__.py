@@ -1,6 +1,6 @@
-import utils
-import world
-import bundle
-
-__all__ = world.__all__ + utils.__all__ + bundle.__all__
-
+import utils
+import world
+import bundle
+
+__all__ = world.__all__ + utils.__all__ + bundle.__all__
+
@@ -1,4 +1,4 @@
-from main import main
-
-if __name__ == "__main__":
+from main import main
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,18 +1,18 @@
-from bundle import *
-from bundle import __all__ as allbundle
-
-from utils import *
-from utils import __all__ as allutils
-
-from world import *
-from world import __all__ as allworld
-
-from tests import *
-from tests import __all__ as alltests
-
-
-__all__ = [] + allbundle + allutils + allworld + alltests
-
-print(f"Loaded ALL with {len(__all__)} items.")
-for name in __all__:
-    print(f" - {name}")
+from bundle import *
+from bundle import __all__ as allbundle
+
+from utils import *
+from utils import __all__ as allutils
+
+from world import *
+from world import __all__ as allworld
+
+from tests import *
+from tests import __all__ as alltests
+
+
+__all__ = [] + allbundle + allutils + allworld + alltests
+
+print(f"Loaded ALL with {len(__all__)} items.")
+for name in __all__:
+    print(f" - {name}")
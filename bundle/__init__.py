@@ -1,7 +1,7 @@
-from .bundle import *
-from .github import *
-
-__all__ = [
-    "Bundle",
-    "GitHub",
+from .bundle import *
+from .github import *
+
+__all__ = [
+    "Bundle",
+    "GitHub",
 ]
\ No newline at end of file
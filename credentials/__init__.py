@@ -1,5 +1,5 @@
-from .environ import Environ
-
-__all__ = [
-    "Environ"
+from .environ import Environ
+
+__all__ = [
+    "Environ"
 ]   
\ No newline at end of file
@@ -1,8 +1,8 @@
-from all import *
-
-
-
-
-rows = ROWS()
-if __name__ == "__main__":
+from all import *
+
+
+
+
+rows = ROWS()
+if __name__ == "__main__":
     tests(tests=[test8])
\ No newline at end of file
@@ -1,26 +1,72 @@
-
-from .test1 import test1
-from .test2 import test2
-from .test3 import test3
-from .test4 import test4
-from .test5 import test5
-from .test6 import test6
-from .test7 import test7
-from .test8 import test8
-from .test9 import test9
-from .test10 import test10
-from .tests import tests
-
-__all__ = [
-    "test1",
-    "test2",
-    "test3",
-    "test4",
-    "test5",
-    "test6",
-    "test7",
-    "test8",
-    "test9",
-    "test10",
-    "tests",
+
+from .test1 import test1
+from .test2 import test2
+from .test3 import test3
+from .test4 import test4
+from .test5 import test5
+from .test6 import test6
+from .test7 import test7
+from .test8 import test8
+from .test9 import test9
+from .test10 import test10
+from .test11 import test11
+from .test12 import test12
+from .test13 import test13
+from .test14 import test14
+from .test15 import test15
+from .test16 import test16
+from .test17 import test17
+from .test18 import test18
+from .test19 import test19
+from .test20 import test20
+from .test21 import test21
+from .test22 import test22
+from .test23 import test23
+from .test24 import test24
+from .test25 import test25
+from .test26 import test26
+from .test27 import test27
+from .test28 import test28
+from .test29 import test29
+from .test30 import test30
+from .test31 import test31
+from .test32 import test32
+from .test33 import test33
+from .tests import tests
+
+__all__ = [
+    "test1",
+    "test2",
+    "test3",
+    "test4",
+    "test5",
+    "test6",
+    "test7",
+    "test8",
+    "test9",
+    "test10",
+    "test11",
+    "test12",
+    "test13",
+    "test14",
+    "test15",
+    "test16",
+    "test17",
+    "test18",
+    "test19",
+    "test20",
+    "test21",
+    "test22",
+    "test23",
+    "test24",
+    "test25",
+    "test26",
+    "test27",
+    "test28",
+    "test29",
+    "test30",
+    "test31",
+    "test32",
+    "test33",
+    "tests",
 ]
\ No newline at end of file
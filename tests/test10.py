@@ -1,4 +1,4 @@
-
-
-def test10() -> None:
+
+
+def test10() -> None:
     pass
\ No newline at end of file
@@ -0,0 +1,60 @@
+# tests/test11.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test11() -> None:
+    """
+    test11:
+    Wide BVH (ROWS(bvh="wbvh")) against the binary BVH on the same grid:
+    - random point lookups must find the same row in both worlds
+    - removals (swap-remove relabels) keep both indexes in sync
+    - the wide tree must be much shallower than log2(n)
+    """
+    wide = ROWS(bvh="wbvh")
+    binary = ROWS(bvh="bvh")
+
+    for rows in (wide, binary):
+        rows.remove(row=rows.get(mat="STONE", rid=0))
+
+    cell = 16
+    n = 16
+    for ix in range(n):
+        for iy in range(n):
+            for iz in range(n):
+                p0 = (ix * cell, iy * cell, iz * cell)
+                p1 = (p0[0] + cell, p0[1] + cell, p0[2] + cell)
+                wide.insert(p0=p0, p1=p1, mat="STONE")
+                binary.insert(p0=p0, p1=p1, mat="STONE")
+    timer.print(msg="STEP 1 : grids built")
+
+    def check(k:int=None) -> None:
+        for _ in range(k):
+            pos = (random.randint(0, n*cell-1), random.randint(0, n*cell-1), random.randint(0, n*cell-1))
+            try:
+                _, rid0, row0 = wide.search(pos=pos)
+            except LookupError:
+                rid0, row0 = None, None
+            try:
+                _, rid1, row1 = binary.search(pos=pos)
+            except LookupError:
+                rid1, row1 = None, None
+            assert rid0 == rid1, f"wbvh/bvh disagree at {pos}: {rid0} != {rid1}"
+            if row0 is not None:
+                assert ROW.CONTAINS(row=row0, pos=pos), f"pos={pos} not contained"
+
+    check(k=2000)
+    timer.print(msg=" - STEP 1 lookups agree")
+
+    for _ in range(1000):
+        rid = random.randint(0, wide.nrows(mat="STONE") - 1)
+        wide.remove(row=wide.get(mat="STONE", rid=rid))
+        binary.remove(row=binary.get(mat="STONE", rid=rid))
+    check(k=2000)
+    timer.print(msg=" - STEP 2 lookups agree after 1000 removals")
+
+    depth = wide.bvh.depth()
+    print(f" - WBVH depth={depth} for {wide.nrows(mat='STONE')} rows")
+    assert depth <= 6, f"wide BVH too deep: {depth}"
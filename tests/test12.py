@@ -0,0 +1,55 @@
+# tests/test12.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test12() -> None:
+    """
+    test12:
+    Sweep and prune index (ROWS(sap=True)) with floor-miner style slab edits.
+    Verifies:
+    - world volume invariant after thin slab splits routed through SAP
+    - carved slabs are AIR
+    - SAP slab queries match a brute force scan over all rows
+    - no overlapping pairs exist in the world
+    """
+    rows = ROWS(sap=True)
+    v0 = rows.volume()
+
+    slabs: list[tuple[POS, POS]] = []
+    for i in range(20):
+        x = random.randint(a=1000, b=999000)
+        y = random.randint(a=1000, b=999000)
+        z = random.randint(a=1000, b=9000)
+        for dz in range(3):
+            p0 = (x, y, z + dz)
+            p1 = (x + 20, y + 20, z + dz + 1)
+            rows.split(pos=p0, pos1=p1, mat="AIR")
+            slabs.append((p0, p1))
+    timer.print(msg="STEP 1 : 60 slab splits through SAP")
+
+    v1 = rows.volume()
+    assert v1 == v0, f"volume changed after slab splits: before={v0}, after={v1}"
+
+    for p0, p1 in random.sample(slabs, k=20):
+        pos = (random.randint(p0[0], p1[0]-1), random.randint(p0[1], p1[1]-1), p0[2])
+        mat, rid, row = rows.search(pos=pos)
+        assert mat == "AIR", f"expected AIR at {pos}, got {mat}"
+
+    for _ in range(50):
+        ax = random.randint(0, 2)
+        a = random.randint(0, 9000)
+        b = a + random.randint(1, 4)
+        got = set(rows.sap.slab(axis=ax, a=a, b=b))
+        want = set()
+        for mid in range(MATERIALS.NUM):
+            for rid in range(rows.nrows(mid=mid)):
+                r = rows.array[mid][rid]
+                if int(ROW.P0(row=r)[ax]) < b and a < int(ROW.P1(row=r)[ax]):
+                    want.add((mid, rid))
+        assert got == want, f"slab({ax},{a},{b}) mismatch: {len(got)} != {len(want)}"
+
+    assert rows.sap.pairs(axis=2) == [], "overlapping rows found"
+    print(f" - SAP OK: {len(rows.sap)} rows indexed")
@@ -0,0 +1,79 @@
+# tests/test13.py
+
+from utils import *
+from world import *
+from bundle import *
+from utils.cache import Cache
+from tests.tests import build, splits
+
+
+def test13() -> None:
+    """
+    test13:
+    Region epoch query cache (ROWS.cache) for query_box / composition.
+    Verifies:
+    - repeated queries on an unchanged region are cache hits
+    - an edit inside the region invalidates it, an edit far away does not
+    - composition always matches a fresh (uncached) world
+    - LRU size cap evicts
+    - a caller editing its arids does not change the cached result
+    - BVH / WBVH candidate sets (sync and async) return the rows a full scan finds, in rid order
+    """
+    rows = ROWS(cache=Cache(size=8))
+    rows.remove(row=rows.get(mat="STONE", rid=0))
+    rows.insert(p0=(0, 0, 0), p1=(16384, 16384, 4096), mat="STONE")             # sector x=0
+    rows.insert(p0=(65536, 0, 0), p1=(65536+16384, 16384, 4096), mat="STONE")   # sector x=4
+    p0, p1 = (1000, 1000, 1000), (1100, 1100, 1100)
+
+    comp0 = rows.composition(p0=p0, p1=p1)
+    assert comp0["STONE"] == 100**3, f"unexpected composition {comp0}"
+    for _ in range(100):
+        assert rows.composition(p0=p0, p1=p1) == comp0
+    stats = rows.cache.stats()
+    assert stats["hits"] >= 100, f"expected cache hits: {stats}"
+
+    # far away edit -> region stays cached
+    rows.split(pos=(70000, 1000, 1000), mat="AIR")
+    hits = rows.cache.hits
+    assert rows.composition(p0=p0, p1=p1) == comp0
+    assert rows.cache.hits == hits + 1, "far edit invalidated the region"
+
+    # edit inside the region -> stale
+    rows.split(pos=(1050, 1050, 1050), mat="AIR")
+    stale = rows.cache.stale
+    comp1 = rows.composition(p0=p0, p1=p1)
+    assert rows.cache.stale > stale, "inner edit did not invalidate the region"
+    assert comp1["AIR"] == 1 and comp1["STONE"] == 100**3 - 1, f"unexpected composition {comp1}"
+
+    array, arids = rows.query_box(p0=p0, p1=p1)
+    assert arids[Materials.name2mid["AIR"]] == 1
+    assert not array.flags.writeable, "cached query_box result must be read only"
+    arids[Materials.name2mid["AIR"]] = 99
+    hits = rows.cache.hits
+    array2, arids2 = rows.query_box(p0=p0, p1=p1)
+    assert rows.cache.hits == hits + 1 and arids2[Materials.name2mid["AIR"]] == 1, "a caller poisoned the cache"
+    assert arids2 is not arids
+
+    for i in range(20):
+        q0 = (2000 + i * 10, 2000, 2000)
+        rows.query_box(p0=q0, p1=(q0[0] + 5, 2005, 2005))
+    assert len(rows.cache.entries) <= 8 and rows.cache.evictions > 0, f"LRU cap not enforced: {rows.cache.stats()}"
+    print(" - cache stats:", json.dumps(rows.cache.stats()))
+
+    edits = splits(seed=13, n=60, span=120, size=12, mats=["AIR", "WATER", "LAVA"])
+    rng = random.Random(13)
+    boxes = []
+    for _ in range(40):
+        q0 = tuple(rng.randint(0, 130) for _ in range(3))
+        boxes.append((q0, tuple(v + rng.randint(1, 40) for v in q0)))
+    for bvh in ("bvh", "wbvh"):
+        for mode in ("sync", "async"):
+            world = build(splits=edits, bvh=bvh, mode=mode, cache=Cache(size=0), p0=(0, 0, 0), p1=(160, 160, 160))
+            for q0, q1 in boxes:
+                array, arids = world.query_box(p0=q0, p1=q1)
+                for mid in range(MATERIALS.NUM):
+                    stored = world.array[mid][:world.arids[mid]]
+                    lo, hi = stored[:, ROW.IDS_X0[0], :3], stored[:, ROW.IDS_X1[0], :3]
+                    want = stored[((lo < np.array(q1, dtype=ROW.DTYPE)) & (np.array(q0, dtype=ROW.DTYPE) < hi)).all(axis=1)]
+                    assert arids[mid] == len(want) and (array[mid][:arids[mid]] == want).all(), f"{bvh}/{mode}: query_box differs from a full scan at {q0} {q1}"
+    print(f" - query_box == full scan on {len(boxes)} boxes, bvh / wbvh, sync / async")
@@ -0,0 +1,72 @@
+# tests/test14.py
+
+from utils import *
+from world import *
+from bundle import *
+from utils.mdx import MDX
+from utils.types import Row
+
+
+def test14() -> None:
+    """
+    test14:
+    Packed key MDX (hash tables of face keys) against a brute force face match.
+    Verifies:
+    - every neighbor MDX.search() returns shares the exact face on that axis
+    - rows with an exact face neighbor are always found (also after removals / rehashes)
+    - memory per row stays small
+    - insert / remove churn at a steady row count cleans tombstones in place (no table growth)
+    """
+    rows = ROWS()
+    rows.remove(row=rows.get(mat="STONE", rid=0))
+    mdx: MDX = rows.mdx
+
+    cell = 8
+    n = 12
+    for ix in range(n):
+        for iy in range(n):
+            for iz in range(n):
+                p0 = (ix * cell, iy * cell, iz * cell)
+                mat = "STONE" if (ix + iy + iz) % 3 else "AIR"
+                rows.insert(p0=p0, p1=(p0[0] + cell, p0[1] + cell, p0[2] + cell), mat=mat)
+
+    for _ in range(300):
+        mat = random.choice(["STONE", "AIR"])
+        rows.remove(row=rows.get(mat=mat, rid=random.randint(0, rows.nrows(mat=mat) - 1)))
+    timer.print(msg="STEP 1 : grid built, 300 rows removed")
+
+    boxes: dict[tuple, tuple[int, int]] = {}
+    for mid in range(MATERIALS.NUM):
+        for rid in range(rows.nrows(mid=mid)):
+            r = rows.array[mid][rid]
+            boxes[(mid,) + tuple(int(v) for v in ROW.P0(row=r)) + tuple(int(v) for v in ROW.P1(row=r))] = (mid, rid)
+
+    checked = 0
+    for (mid, x0, y0, z0, x1, y1, z1), (_, rid) in boxes.items():
+        for ax in (0, 1, 2):
+            d = [0, 0, 0]
+            d[ax] = cell
+            up = (mid, x0+d[0], y0+d[1], z0+d[2], x1+d[0], y1+d[1], z1+d[2])
+            down = (mid, x0-d[0], y0-d[1], z0-d[2], x1-d[0], y1-d[1], z1-d[2])
+            want = [boxes[k] for k in (up, down) if k in boxes]
+            hit = rows._mdx_search_row(row=Row(mid=mid, rid=rid, row=rows.array[mid][rid]), axis=ax)
+            if not want:
+                assert hit is None, f"unexpected neighbor {hit.mid, hit.rid} for {(mid, rid)} on axis {ax}"
+                continue
+            assert hit is not None and (hit.mid, hit.rid) == want[0], f"wrong neighbor for {(mid, rid)} on axis {ax}"
+            checked += 1
+
+    per = mdx.nbytes() / max(1, len(boxes))
+    print(f" - MDX OK: {checked} neighbors checked, {per:.0f} bytes per row")
+    assert per < 1024, f"MDX uses too much memory per row: {per:.0f}"
+
+    # churn at a steady row count: same size rehashes reuse the tables
+    rows = ROWS()
+    mdx = rows.mdx
+    tables = [(mdx.hsh[ax][side], len(mdx.val[ax][side])) for ax in (0, 1, 2) for side in (0, 1)]
+    for i in range(3000):
+        row = rows.insert(p0=(200 + i % 60, 200, i // 60), p1=(201 + i % 60, 201, i // 60 + 1), mat="WATER")
+        rows.remove(row=row)
+    after = [(mdx.hsh[ax][side], len(mdx.val[ax][side])) for ax in (0, 1, 2) for side in (0, 1)]
+    assert all(a is b and n == m for (a, n), (b, m) in zip(tables, after)), "steady churn reallocated a table"
+    assert all(mdx.fill[ax][side] * MDX.LOAD[1] <= len(mdx.val[ax][side]) * MDX.LOAD[0] for ax in (0, 1, 2) for side in (0, 1))
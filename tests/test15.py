@@ -0,0 +1,99 @@
+# tests/test15.py
+
+from utils import *
+from world import *
+from bundle import *
+from utils.types import Row
+from utils.adj import ADJ
+from tests.tests import build, dump, splits, voxels
+
+
+def test15() -> None:
+    """
+    test15:
+    Face adjacency graph (ROWS(adj=True)) after random splits of mixed materials.
+    Verifies against a brute force pairwise scan:
+    - every touching pair (positive contact area) is reported, on the right axis
+    - contact areas are exact
+    - removals leave no stale entries behind
+    - partner() (merge partner) equals MDX.search for every row and axis
+    - plane buckets are interval indexed: a unit face query on a plane of 4096 faces visits its few neighbors
+    - merges with adj on (partners from ADJ) build the same world as with MDX, sync and async
+    """
+    rows = ROWS(adj=True)
+    rows.remove(row=rows.get(mat="STONE", rid=0))
+    rows.insert(p0=(0, 0, 0), p1=(64, 64, 64), mat="STONE")
+
+    for _ in range(40):
+        p0 = (random.randint(0, 60), random.randint(0, 60), random.randint(0, 60))
+        p1 = (p0[0] + random.randint(1, 4), p0[1] + random.randint(1, 4), p0[2] + random.randint(1, 4))
+        rows.split(pos=p0, pos1=p1, mat=random.choice(["AIR", "WATER", "OBSIDIAN"]))
+    rows.split(pos=(56, 56, 56), pos1=(64, 64, 64), mat="WATER")    # ends ON the block edge: p1 itself is empty space
+    assert rows.volume() == 64 ** 3, "split at the block edge changed the volume"
+    timer.print(msg="STEP 1 : 40 random box splits")
+
+    boxes: list[tuple[int, int, tuple]] = []
+    for mid in range(MATERIALS.NUM):
+        for rid in range(rows.nrows(mid=mid)):
+            r = rows.array[mid][rid]
+            boxes.append((mid, rid, tuple(int(v) for v in ROW.P0(row=r)) + tuple(int(v) for v in ROW.P1(row=r))))
+    assert len(rows.adj) == len(boxes), f"adj holds {len(rows.adj)} rows, world has {len(boxes)}"
+
+    def contact(a:tuple, b:tuple, ax:int) -> int:
+        if a[ax+3] != b[ax]:
+            return 0
+        area = 1
+        for i in (0, 1, 2):
+            if i == ax:
+                continue
+            d = min(a[i+3], b[i+3]) - max(a[i], b[i])
+            if d <= 0:
+                return 0
+            area *= d
+        return area
+
+    pairs = 0
+    for mid, rid, box in boxes:
+        for ax in (0, 1, 2):
+            got = {(int(r.mid), int(r.rid)): area for r, area in rows.adj.touching(row=Row(mid=mid, rid=rid, row=None), axis=ax, side=1)}
+            want = {}
+            for omid, orid, obox in boxes:
+                area = contact(box, obox, ax)
+                if area > 0:
+                    want[(omid, orid)] = area
+            assert got == want, f"adjacency mismatch for {(mid, rid)} on axis {ax}: {got} != {want}"
+            pairs += len(want)
+    print(f" - ADJ OK: {len(boxes)} rows, {pairs} touching face pairs")
+
+    grid = voxels(seed=15, n=10, mats=["AIR", "WATER", "STONE"], adj=True)     # unmerged: partners everywhere
+    partners = 0
+    for mid in range(MATERIALS.NUM):
+        for rid in range(grid.nrows(mid=mid)):
+            r = Row(mid=mid, rid=rid, row=grid.array[mid][rid])
+            for ax in (0, 1, 2):
+                got, want = grid.adj.partner(row=r, axis=ax), grid.mdx.search(r=r, axis=ax)
+                assert (got is None) == (want is None), f"partner of {(mid, rid)} on axis {ax}: {got} != {want}"
+                if got is not None:
+                    assert (int(got.mid), int(got.rid)) == (int(want.mid), int(want.rid))
+                    partners += 1
+    print(f" - partner() == MDX.search: {partners} merge partners")
+
+    flat = ADJ(rows=None)
+    for x in range(64):
+        for y in range(64):
+            flat.insert(row=Row(mid=0, rid=x * 64 + y, row=None), box=(x, y, 0, x + 1, y + 1, 1))
+    plane = flat.faces[2][0][0]
+    assert sum(len(f) for f in plane.values()) == 64 * 64
+    near = flat.overlaps(plane=plane, rect=(10, 12, 20, 22))
+    assert sorted((f[0], f[2]) for f in near) == [(10, 20), (10, 21), (11, 20), (11, 21)], f"overlaps: {near}"
+    for x in range(64):
+        for y in range(64):
+            flat.remove(row=Row(mid=0, rid=x * 64 + y, row=None))
+    assert len(flat) == 0 and not any(flat.faces[ax][side] for ax in (0, 1, 2) for side in (0, 1)), "stale faces after removal"
+
+    edits = splits(seed=15, n=60, span=40, size=6, mats=["AIR", "WATER"])
+    for mode in ("sync", "async"):
+        a = build(splits=edits, mode=mode, p0=(0, 0, 0), p1=(48, 48, 48))
+        b = build(splits=edits, mode=mode, adj=True, p0=(0, 0, 0), p1=(48, 48, 48))
+        assert dump(a) == dump(b), f"{mode}: merges with ADJ partners built a different world"
+    print(f" - merges with ADJ partners == MDX partners ({a.total} rows), sync / async")
@@ -0,0 +1,48 @@
+# tests/test16.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test16() -> None:
+    """
+    test16:
+    Greedy re-meshing (ROWS.remesh) of a fragmented region.
+    - 64 L shaped AIR pieces of 3 rows whose faces never match exactly
+      (pairwise merge cannot collapse them, the minimal cover is 2 rows)
+    Verifies:
+    - world volume and per material volume invariants
+    - every voxel keeps its material
+    - the row count reaches the minimal cover
+    """
+    rows = ROWS()
+    rows.remove(row=rows.get(mat="STONE", rid=0))
+
+    # each pattern (x/y plane, 1 thick): A=[0,2)x[0,1)  B=[0,1)x[1,3)  C=[1,2)x[1,2)  -> minimal is 2 boxes
+    carved: set[POS] = set()
+    for ox, oy, oz in [(4*i, 4*j, 2*k) for i in range(4) for j in range(4) for k in range(4)]:
+        for q0, q1 in (((0,0), (2,1)), ((0,1), (1,3)), ((1,1), (2,2))):
+            p0 = (ox + q0[0], oy + q0[1], oz)
+            p1 = (ox + q1[0], oy + q1[1], oz + 1)
+            rows.insert(p0=p0, p1=p1, mat="AIR")
+            for x in range(p0[0], p1[0]):
+                for y in range(p0[1], p1[1]):
+                    carved.add((x, y, oz))
+    rows.merge()
+
+    v0 = rows.volume()
+    air0 = rows.volume(mat="AIR")
+    before = rows.total
+    timer.print(msg=f"STEP 1 : {len(carved)} AIR voxels in {before} rows after merge")
+
+    created, arids = rows.remesh(p0=(0, 0, 0), p1=(32, 32, 32))
+    after = rows.total
+    timer.print(msg=f" - remesh: {before} rows -> {after} rows")
+
+    assert rows.volume() == v0, "world volume changed by remesh"
+    assert rows.volume(mat="AIR") == air0, "AIR volume changed by remesh"
+    assert after == 2 * 64, f"remesh did not reach the minimal box count: {before} -> {after}"
+
+    for pos in carved:
+        assert rows.search(pos=pos)[0] == "AIR", f"expected AIR at {pos}"
@@ -0,0 +1,47 @@
+# tests/test17.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test17() -> None:
+    """
+    test17:
+    Localized merge after a split (merge(rows, local=True), the split default).
+    - fragment STONE far away with an 8x8x8 lattice of single voxel carves
+    - carve + refill one voxel elsewhere
+    Verifies:
+    - world volume invariant, carved voxel is AIR, refilled voxel is STONE again
+    - the refill heals the carve: STONE row count is back where it was
+    - the MDX lookups of one local merge do not grow with the STONE rows of the world
+    """
+    rows = ROWS(mode="async")     # job traffic is counted by the queues
+    v0 = rows.volume()
+
+    for i in range(8):
+        for j in range(8):
+            for k in range(8):
+                rows.split(pos=(500000 + 3*i, 500000 + 3*j, 5000 + 3*k), mat="AIR")
+    stone = rows.nrows(mat="STONE")
+    timer.print(msg=f"STEP 1 : 512 far carves -> {stone} STONE rows")
+
+    def mdxsearches() -> int:
+        return rows.queue.submitted["mdx"]
+
+    pos = (1000, 1000, 1000)
+    n0 = mdxsearches()
+    rows.split(pos=pos, mat="AIR")
+    n1 = mdxsearches()
+    timer.print(msg=f" - carve: {n1 - n0} MDX lookups")
+    assert rows.search(pos=pos)[0] == "AIR", "carved voxel is not AIR"
+    assert n1 - n0 < stone // 4, f"local merge did {n1 - n0} MDX lookups for {stone} STONE rows"
+
+    rows.split(pos=pos, mat="STONE")
+    n2 = mdxsearches()
+    timer.print(msg=f" - refill: {n2 - n1} MDX lookups")
+    assert rows.search(pos=pos)[0] == "STONE", "refilled voxel is not STONE"
+    assert n2 - n1 < stone // 4, f"local merge did {n2 - n1} MDX lookups for {stone} STONE rows"
+
+    assert rows.volume() == v0, "world volume changed"
+    assert rows.nrows(mat="STONE") == stone, f"refill did not heal: {stone} -> {rows.nrows(mat='STONE')} STONE rows"
@@ -0,0 +1,63 @@
+# tests/test18.py
+
+from utils import *
+from world import *
+from bundle import *
+from tests.tests import build, dump, splits, voxels
+
+
+def test18() -> None:
+    """
+    test18:
+    Merge policies (ROWS(policy="best") vs ROWS(policy="axis")) on the same fragmented world.
+    - a 10^3 block of seeded random STONE / AIR unit voxels, then mergeall()
+    - the worlds of other tests: test15's AIR / WATER / STONE voxels, the split worlds (build())
+      of test13 / test15 / test20 / test28 / test29
+    Verifies:
+    - world + per material volume invariants for both policies
+    - "best" ends with fewer rows than "axis" on the voxel worlds, never more on the split worlds
+      (their splits already merged locally -> mergeall has little left to do)
+    - the incremental run table (utils.runs) misses nothing: no merge run is left afterwards
+    - "best" is deterministic: the same voxels give the exact same rows
+    """
+    axis = voxels(seed=2, n=10, mats=["STONE", "STONE", "AIR"], policy="axis")
+    best = voxels(seed=2, n=10, mats=["STONE", "STONE", "AIR"], policy="best")
+    vols = {mat: axis.volume(mat=mat) for mat in ("STONE", "AIR")}
+    timer.print(msg=f"STEP 1 : fragmented world, {axis.total} rows")
+
+    axis.mergeall()
+    best.mergeall()
+    timer.print(msg=f" - mergeall: axis {axis.total} rows, best {best.total} rows")
+
+    for rows in (axis, best):
+        assert rows.volume() == 10**3, f"world volume changed ({rows.policy})"
+        for mat, v in vols.items():
+            assert rows.volume(mat=mat) == v, f"{mat} volume changed ({rows.policy})"
+    assert best.total < axis.total, f"best policy did not beat axis: {best.total} >= {axis.total}"
+    assert all(not best.runs(mid=mid, axis=ax) for mid in range(MATERIALS.NUM) for ax in (0, 1, 2)), "a merge run is left"
+
+    again = voxels(seed=2, n=10, mats=["STONE", "STONE", "AIR"], policy="best")
+    again.mergeall()
+    assert dump(again) == dump(best), "best policy is not deterministic"
+
+    worlds = {
+        "test15 voxels": lambda policy: voxels(seed=15, n=10, mats=["AIR", "WATER", "STONE"], policy=policy),
+        "test13": lambda policy: build(splits=splits(seed=13, n=60, span=120, size=12, mats=["AIR", "WATER", "LAVA"]), policy=policy, p0=(0, 0, 0), p1=(160, 160, 160)),
+        "test15": lambda policy: build(splits=splits(seed=15, n=60, span=40, size=6, mats=["AIR", "WATER"]), policy=policy, p0=(0, 0, 0), p1=(48, 48, 48)),
+        "test20": lambda policy: build(splits=splits(seed=20, n=40, span=500, size=6, mats=["AIR", "WATER"]), policy=policy),
+        "test28": lambda policy: build(splits=splits(seed=28, n=60, span=400, size=6, mats=["AIR", "WATER"]), policy=policy),
+        "test29": lambda policy: build(splits=splits(seed=29, n=40, span=240, size=8, mats=["AIR", "WATER"]), policy=policy, p0=(0, 0, 0), p1=(256, 256, 256)),
+    }
+    for name, make in worlds.items():
+        axis, best = make("axis"), make("best")
+        vols = {mat: axis.volume(mat=mat) for mat in axis.mat.names()}
+        axis.mergeall()
+        best.mergeall()
+        for mat, v in vols.items():
+            assert best.volume(mat=mat) == v, f"{name}: {mat} volume changed"
+        assert all(not best.runs(mid=mid, axis=ax) for mid in range(MATERIALS.NUM) for ax in (0, 1, 2)), f"{name}: a merge run is left"
+        if "voxels" in name:
+            assert best.total < axis.total, f"{name}: best policy did not beat axis: {best.total} >= {axis.total}"
+        else:
+            assert best.total <= axis.total, f"{name}: best policy lost to axis: {best.total} > {axis.total}"
+        timer.print(msg=f" - {name}: axis {axis.total} rows, best {best.total} rows")
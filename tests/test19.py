@@ -0,0 +1,52 @@
+# tests/test19.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test19() -> None:
+    """
+    test19:
+    Minimal slab decomposition of ROWS.splitrow (at most 6 slabs + the center).
+    Verifies:
+    - a carve strictly inside a row emits exactly 7 rows, one of them the new material
+    - carves on the row boundary emit fewer (empty slabs are skipped)
+    - the index traffic of one carve is 7 inserts + 1 remove
+    - world + per material volume invariants and voxel materials after random carves + split()
+    """
+    rows = ROWS(mode="async")     # job traffic is counted by the queues
+    v0 = rows.volume()
+
+    def inserts() -> int:
+        return rows.queue.submitted["insert"]
+
+    def removes() -> int:
+        return rows.queue.submitted["remove"]
+
+    n0, r0 = inserts(), removes()
+    _, arids = rows.splitrow(p0=(10, 10, 10), p1=(12, 13, 14), mat="AIR")
+    assert sum(arids.values()) == 7, f"inner carve emitted {sum(arids.values())} rows"
+    assert arids[int(rows.mat.mid(name="AIR"))] == 1, "inner carve must emit one AIR center"
+    assert inserts() - n0 == 7 and removes() - r0 == 1, f"index traffic {inserts() - n0} inserts, {removes() - r0} removes"
+    assert rows.volume() == v0, "world volume changed"
+    assert rows.volume(mat="AIR") == 2 * 3 * 4, "AIR volume is not the carved box"
+
+    _, arids = rows.splitrow(p0=(0, 0, 0), p1=(5, 5, 5), mat="WATER")
+    assert sum(arids.values()) == 4, f"corner carve emitted {sum(arids.values())} rows"
+    timer.print(msg="STEP 1 : inner + corner carves")
+
+    carved: list[tuple[POS, POS]] = []
+    for _ in range(40):
+        p0 = (random.randint(100, 200), random.randint(100, 200), random.randint(100, 200))
+        p1 = (p0[0] + random.randint(1, 6), p0[1] + random.randint(1, 6), p0[2] + random.randint(1, 6))
+        rows.split(pos=p0, pos1=p1, mat="OBSIDIAN")
+        carved.append((p0, p1))
+    timer.print(msg=f" - 40 random box splits -> {rows.total} rows")
+
+    assert rows.volume() == v0, "world volume changed"
+    assert rows.volume(mat="AIR") == 2 * 3 * 4, "AIR volume changed"
+    assert rows.volume(mat="WATER") == 5 * 5 * 5, "WATER volume changed"
+    for p0, p1 in carved:
+        pos = (random.randint(p0[0], p1[0] - 1), random.randint(p0[1], p1[1] - 1), random.randint(p0[2], p1[2] - 1))
+        assert rows.search(pos=pos)[0] == "OBSIDIAN", f"expected OBSIDIAN at {pos}"
@@ -0,0 +1,42 @@
+# tests/test20.py
+
+from utils import *
+from world import *
+from bundle import *
+from tests.tests import dump, splits, build
+
+
+def test20() -> None:
+    """
+    test20:
+    Batched job submission (Queue.jobs + ROWS.batch) in async mode.
+    Verifies:
+    - the same seeded splits give the exact same rows in sync and async mode
+    - async edit jobs reach the worker in far fewer batches than jobs
+    - Queue.jobs runs a list in order and publishes it with one notification
+    """
+    boxes = splits(seed=20, n=40, span=500, size=6, mats=["AIR", "WATER"])
+
+    sync = build(splits=boxes, mode="sync")
+    rows = build(splits=boxes, mode="async")
+    assert dump(rows) == dump(sync), "async mode diverged from sync mode"
+    assert rows.volume() == sync.volume(), "world volume differs"
+
+    # every search is its own handoff (its caller waits on it), edits should ride along
+    edits = rows.queue.submitted["insert"] + rows.queue.submitted["remove"]
+    searches = sum(rows.queue.submitted.values()) - edits
+    batches = rows.queue.batches
+    timer.print(msg=f"STEP 1 : 40 async splits, {edits} edit + {searches} search jobs in {batches} batches")
+    assert (batches - searches) * 2 < edits, f"{batches} batches for {edits} edits + {searches} searches -> not batched"
+
+    q = rows.queue
+    before = q.batches
+    pos = [(1000 + i, 1000, 1000) for i in range(5)]
+    todo = [Job(pos=p, job="search", cls="bvh") for p in pos]
+    q.jobs(jobs=todo)
+    assert q.wait(job=todo[-1], timeout=ROWS.TIMEOUT), "batch was not published"
+    assert q.batches == before + 1, f"one batch expected, got {q.batches - before}"
+    for j, p in zip(todo, pos):
+        done = q.get(task="search", id=j.id)
+        assert done is not None and done.get() is not None, f"search {p} not done"
+        assert ROW.CONTAINS(row=done.get().row, pos=p), f"search {p} hit the wrong row"
@@ -0,0 +1,46 @@
+# tests/test21.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test21() -> None:
+    """
+    test21:
+    Future based job completion (Job.wait / ROWS._wait_job) instead of spin polling.
+    Verifies:
+    - an unfinished job times out after its deadline in seconds, without burning CPU
+    - a blocked waiter is woken by finish() from another thread, with the result
+    - a search miss stays None
+    - async mode searches + splits still match sync mode
+    """
+    j = Job(pos=(0, 0, 0), job="search", cls="bvh")
+    w0, c0 = time.perf_counter(), time.process_time()
+    assert not j.wait(timeout=0.2), "unfinished job reported done"
+    wall, cpu = time.perf_counter() - w0, time.process_time() - c0
+    timer.print(msg=f"STEP 1 : timeout after {wall:.3f}s wall, {cpu:.3f}s cpu")
+    assert 0.2 <= wall < 2.0, f"deadline not honoured: {wall:.3f}s"
+    assert cpu < 0.1, f"waiting burned {cpu:.3f}s of cpu"
+
+    rows = ROWS(mode="async")
+    hit = rows.get(mat="STONE", rid=0)
+    threading.Timer(0.05, j.finish, kwargs={"row": hit}).start()
+    assert j.wait(timeout=ROWS.TIMEOUT), "waiter was not woken by finish()"
+    assert j.get() is hit, "woken waiter got the wrong result"
+
+    miss = Job(pos=(0, 0, 0), job="search", cls="bvh")
+    miss.finish(row=None)
+    assert miss.wait(timeout=0) and miss.get() is None, "a search miss must stay None"
+
+    sync = ROWS(mode="sync")
+    rng = random.Random(21)
+    for _ in range(20):
+        p0 = (rng.randint(0, 300), rng.randint(0, 300), rng.randint(0, 300))
+        p1 = (p0[0] + rng.randint(1, 5), p0[1] + rng.randint(1, 5), p0[2] + rng.randint(1, 5))
+        for r in (rows, sync):
+            r.split(pos=p0, pos1=p1, mat="AIR")
+    for _ in range(500):
+        pos = (rng.randint(0, 310), rng.randint(0, 310), rng.randint(0, 310))
+        assert rows.search(pos=pos)[0] == sync.search(pos=pos)[0], f"async search differs at {pos}"
+    timer.print(msg=" - 20 splits + 500 searches async == sync")
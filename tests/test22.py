@@ -0,0 +1,80 @@
+# tests/test22.py
+
+from utils import *
+from world import *
+from bundle import *
+from tests.tests import dump, splits, build
+import asyncio
+
+
+def test22() -> None:
+    """
+    test22:
+    asyncio facade (asearch / asplit / aquery_box) for both ROWS modes.
+    - one event loop fires 20 splits and 400 searches concurrently, then checks the world
+    Verifies:
+    - concurrent edits + queries leave the same world as the same edits done synchronously
+    - every concurrent search returns a row that holds the position
+    - aquery_box after the edits matches query_box
+    - waiting on index jobs parks no extra threads (1 edit thread + the 2 queue workers)
+    - the same ROWS under contention from a second asyncio.run() (one gate per loop)
+    - close() shuts the edit thread down, a timed out ajob leaves no job registered
+    """
+    rng = random.Random(22)
+    edits = splits(seed=22, n=20, span=300, size=5, mats=["AIR"])
+    probes = [(rng.randint(0, 310), rng.randint(0, 310), rng.randint(0, 310)) for _ in range(400)]
+
+    sync = build(splits=edits)
+
+    for mode in ("async", "sync"):
+        rows = ROWS(mode=mode)
+        threads = threading.active_count()
+
+        async def probe(pos:POS=None) -> bool:
+            mat, rid, row = await rows.asearch(pos=pos)
+            return bool(ROW.CONTAINS(row=row, pos=pos))     # checked before any other task runs
+
+        async def main() -> list:
+            tasks = [rows.asplit(pos=p0, pos1=p1, mat=mat) for p0, p1, mat in edits]
+            tasks += [probe(pos=pos) for pos in probes]
+            out = await asyncio.gather(*tasks)
+            return out[len(edits):]
+
+        hits = asyncio.run(main())
+        assert all(hits), f"{mode}: {hits.count(False)} concurrent searches returned a row not holding the position"
+        assert dump(rows) == dump(sync), f"{mode}: concurrent edits diverged from sync edits"
+        assert threading.active_count() <= threads + 1, f"{mode}: waiting parked threads"
+
+        p0, p1 = (0, 0, 0), (320, 320, 320)
+        array, arids = asyncio.run(rows.aquery_box(p0=p0, p1=p1))
+        want, wids = sync.query_box(p0=p0, p1=p1)
+        assert dict(arids) == dict(wids), f"{mode}: aquery_box differs"
+        timer.print(msg=f"STEP : {mode} mode, 20 asplit + 400 asearch concurrently")
+
+        # a second event loop, gate contended again: the gate of the first loop is not reused
+        more = [((p0[0] + 400, p0[1], p0[2]), (p1[0] + 400, p1[1], p1[2])) for p0, p1, _ in edits[:5]]
+
+        async def again() -> list:
+            return await asyncio.gather(*[rows.asplit(pos=p0, pos1=p1, mat="WATER") for p0, p1 in more],
+                                        *[probe(pos=pos) for pos in probes[:50]])
+
+        assert all(asyncio.run(again())[len(more):]), f"{mode}: second loop searches wrong"
+        assert rows.volume(mat="WATER") == sum((p1[0] - p0[0]) * (p1[1] - p0[1]) * (p1[2] - p0[2]) for p0, p1 in more)
+        assert rows.pool is not None
+        rows.close()
+        assert rows.pool is None and threading.active_count() <= threads, f"{mode}: close() left the edit thread running"
+
+    # a job that never finishes: ajob times out and forgets it
+    rows = ROWS(mode="async")
+    rows.queue.stop()
+    timeout = ROWS.TIMEOUT
+    ROWS.TIMEOUT = 0.05
+    try:
+        asyncio.run(rows.asearch(pos=(1, 1, 1)))
+        assert False, "ajob did not time out"
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        ROWS.TIMEOUT = timeout
+    assert not rows.jobs["search"] and not rows.queue.pending["search"], "timed out job still registered"
+    timer.print(msg=" - second event loop, close() and ajob timeout OK")
@@ -0,0 +1,69 @@
+# tests/test23.py
+
+from utils import *
+from world import *
+from bundle import *
+from utils.rwlock import RWLock
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test23() -> None:
+    """
+    test23:
+    Reader writer concurrency: RWLock + a pool of search workers (ROWS(mode="async", workers=4)).
+    Verifies:
+    - readers hold the lock at the same time, a writer never overlaps anyone
+    - a waiting writer is not starved by new readers
+    - 8 caller threads searching concurrently through 4 workers per index get correct hits
+    - edits between the search waves are seen by the next wave
+    """
+    lock = RWLock()
+    both = threading.Barrier(2, timeout=5)
+
+    def reader() -> None:
+        with lock.read():
+            both.wait()     # only passes if both readers are inside together
+
+    ts = [threading.Thread(target=reader) for _ in range(2)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+
+    inside = {"r": 0, "w": 0, "bad": 0}
+    guard = threading.Lock()
+
+    def work(write:bool=False) -> None:
+        for _ in range(200):
+            with (lock.write() if write else lock.read()):
+                with guard:
+                    inside["w" if write else "r"] += 1
+                    if inside["w"] > 1 or (inside["w"] and inside["r"]):
+                        inside["bad"] += 1
+                with guard:
+                    inside["w" if write else "r"] -= 1
+
+    ts = [threading.Thread(target=work, kwargs={"write": i % 3 == 0}) for i in range(6)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join(timeout=30)
+    assert not any(t.is_alive() for t in ts), "writer starved or deadlocked"
+    assert inside["bad"] == 0, f"{inside['bad']} overlapping writer sections"
+    timer.print(msg="STEP 1 : RWLock readers share, writers exclusive")
+
+    rows = ROWS(mode="async", workers=4)
+    sync = ROWS()
+    rng = random.Random(23)
+    for wave in range(3):
+        for _ in range(10):
+            p0 = (rng.randint(0, 300), rng.randint(0, 300), rng.randint(0, 300))
+            p1 = (p0[0] + rng.randint(1, 5), p0[1] + rng.randint(1, 5), p0[2] + rng.randint(1, 5))
+            for r in (rows, sync):
+                r.split(pos=p0, pos1=p1, mat="AIR")
+        probes = [(rng.randint(0, 310), rng.randint(0, 310), rng.randint(0, 310)) for _ in range(800)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            got = list(pool.map(lambda pos: rows.search(pos=pos)[0], probes))
+        want = [sync.search(pos=pos)[0] for pos in probes]
+        assert got == want, f"wave {wave}: concurrent searches differ from sync"
+    timer.print(msg=" - 3 waves of 10 splits + 800 concurrent searches (8 callers, 4 workers)")
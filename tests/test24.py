@@ -0,0 +1,77 @@
+# tests/test24.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test24() -> None:
+    """
+    test24:
+    Sharded world (SHARDS) over a 2 x 2 grid of worker processes vs ONE ROWS with the same bounds.
+    - floor-miner style slabs + boxes straddling the shard borders, sent one by one, batched and in bulk
+    Verifies:
+    - world + per material volume match the single ROWS
+    - every probe (borders included) finds the same material
+    - searches outside the world raise LookupError
+    - a world reaching the max border (p1.x = XMAX) keeps its last column, single and sharded
+    """
+    W = (512, 512, 64)
+    rng = random.Random(24)
+    edits: list[dict] = []
+    for _ in range(30):
+        x, y, z = rng.randint(0, 490), rng.randint(0, 490), rng.randint(0, 60)
+        edits.append({"pos": (x, y, z), "pos1": (x + 20, y + 20, z + 1), "mat": "AIR"})
+    for _ in range(10):     # straddle x = 256 and / or y = 256
+        x, y, z = rng.randint(240, 255), rng.randint(240, 255), rng.randint(0, 60)
+        edits.append({"pos": (x, y, z), "pos1": (x + rng.randint(2, 30), y + rng.randint(2, 30), z + 3), "mat": "WATER"})
+
+    single = ROWS(p0=(0, 0, 0), p1=W)
+    for e in edits:
+        single.split(**e)
+    single.merge()
+
+    with SHARDS(nx=2, ny=2, p0=(0, 0, 0), p1=W) as world:
+        for e in edits[:10]:
+            world.split(**e)
+        with world.batch():
+            for e in edits[10:20]:
+                world.split(**e)
+        world.splits(edits=edits[20:])
+        world.merge()
+        timer.print(msg=f"STEP 1 : {len(edits)} edits on 4 shards -> {world.total} rows (single ROWS: {single.total})")
+
+        assert world.volume() == single.volume() == W[0] * W[1] * W[2], "world volume differs"
+        for mat in ("STONE", "AIR", "WATER"):
+            assert world.volume(mat=mat) == single.volume(mat=mat), f"{mat} volume differs"
+
+        probes = [(rng.randint(0, 511), rng.randint(0, 511), rng.randint(0, 63)) for _ in range(1000)]
+        probes += [(255 + dx, 255 + dy, z) for dx in (0, 1) for dy in (0, 1) for z in range(0, 64, 4)]
+        got = world.searches(pos=probes)
+        for pos, hit in zip(probes, got):
+            assert hit is not None and hit[0] == single.search(pos=pos)[0], f"shard search differs at {pos}"
+        assert world.search(pos=(256, 256, 0))[0] == single.search(pos=(256, 256, 0))[0]
+
+        try:
+            world.search(pos=(600, 0, 0))
+            assert False, "search outside the world must raise"
+        except LookupError:
+            pass
+        timer.print(msg=f" - {len(probes)} routed searches match")
+
+    # the max border: boxes are half open, a world up to XMAX keeps its last column
+    edge = ROWS(p0=(0, 0, 0), p1=(ROW.XMAX, 4, 4))
+    assert edge.volume() == ROW.XMAX * 16, f"world at the max border lost cells: {edge.volume()}"
+    edge.split(pos=(ROW.XMAX - 2, 0, 0), pos1=(ROW.XMAX, 2, 2), mat="AIR")
+    assert edge.volume(mat="AIR") == 8 and edge.volume() == ROW.XMAX * 16
+    assert edge.search(pos=(ROW.XMAX - 1, 1, 1))[0] == "AIR" and edge.search(pos=(ROW.XMAX - 1, 3, 3))[0] == "STONE"
+    with SHARDS(nx=2, ny=1, p0=(0, 0, 0), p1=(ROW.XMAX, 4, 4)) as world:
+        assert world.volume() == ROW.XMAX * 16, "sharded world at the max border lost cells"
+        world.split(pos=(ROW.XMAX - 2, 0, 0), pos1=(ROW.XMAX, 2, 2), mat="AIR")
+        assert world.volume(mat="AIR") == 8 and world.search(pos=(ROW.XMAX - 1, 1, 1))[0] == "AIR"
+    try:
+        ROWS(p0=(0, 0, 0), p1=(ROW.XMAX + 1, 4, 4))
+        assert False, "bounds past the ROW range must raise"
+    except ValueError:
+        pass
+    timer.print(msg=" - max border (XMAX) volume, split and search OK")
@@ -0,0 +1,47 @@
+# tests/test25.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test25() -> None:
+    """
+    test25:
+    Bounded job bookkeeping in async mode (fire and forget index jobs + JobPool).
+    - a long session of seeded splits and searches on ONE async ROWS
+    Verifies:
+    - world volume invariant, every search still finds the split material
+    - no registry grows with the session: ROWS.jobs and the queue pending / results are empty
+    - the JobPool recycles: far fewer Jobs created than submitted, the free list never exceeds its cap
+    """
+    rows = ROWS(mode="async")
+    v0 = rows.volume()
+    rng = random.Random(25)
+
+    for _ in range(200):
+        p0 = (rng.randint(0, 4000), rng.randint(0, 4000), rng.randint(0, 4000))
+        p1 = (p0[0] + rng.randint(1, 8), p0[1] + rng.randint(1, 8), p0[2] + rng.randint(1, 8))
+        mat = rng.choice(["AIR", "WATER"])
+        rows.split(pos=p0, pos1=p1, mat=mat)
+        assert rows.search(pos=p0)[0] == mat, f"split {p0} not visible"
+    assert rows.volume() == v0, "world volume changed"
+
+    stats = rows.jobstats()
+    submitted = sum(rows.queue.submitted.values())
+    timer.print(msg=f"STEP 1 : {submitted} jobs submitted, {stats['created']} Jobs created, {stats['reused']} reused")
+
+    assert stats["registered"] == 0, f"{stats['registered']} jobs still in the ROWS registry"
+    assert stats["pending"] + stats["results"] == 0, f"queue registries grow: {stats}"
+    assert stats["created"] * 10 < submitted, f"{stats['created']} Jobs created for {submitted} jobs -> not pooled"
+    assert stats["free"] <= stats["cap"], "JobPool free list exceeds its cap"
+
+    # a tiny pool drops the surplus instead of growing
+    pool = JobPool(cap=2)
+    jobs = [pool.get(pos=(i, 0, 0), job="search", cls="bvh") for i in range(5)]
+    for j in jobs:
+        j.finish()
+        pool.put(job=j)
+    assert len(pool) == 2 and pool.stats()["dropped"] == 3, f"pool cap not enforced: {pool.stats()}"
+    j = pool.get(pos=(7, 0, 0), job="search", cls="bvh")
+    assert j in jobs and not j.ready and j.pos == (7, 0, 0), "recycled job was not re-armed"
@@ -0,0 +1,79 @@
+# tests/test26.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test26() -> None:
+    """
+    test26:
+    Queue metrics (counters, depth gauges, latency histograms) in async mode.
+    - seeded splits + searches on ONE async ROWS, then wait for the queue to settle
+    Verifies:
+    - per lane: submitted == completed, nothing in flight, BVH and MDX searches counted separately
+    - per index maintenance latency: BVH and MDX each time their share of every insert / remove
+    - latency percentiles are ordered (p50 <= p95 <= p99 <= max) and only exist for run jobs
+    - dumpstats() is valid JSON with the same numbers, sync mode reports all zeros
+    - Histogram buckets: percentiles land within 2x of the recorded samples
+    - stress: with a tiny thread switch interval (collected jobs recycled right after finish())
+      every lane still counts each job exactly once
+    """
+    rows = ROWS(mode="async")
+    rng = random.Random(26)
+    for _ in range(50):
+        p0 = (rng.randint(0, 4000), rng.randint(0, 4000), rng.randint(0, 4000))
+        p1 = (p0[0] + rng.randint(1, 8), p0[1] + rng.randint(1, 8), p0[2] + rng.randint(1, 8))
+        rows.split(pos=p0, pos1=p1, mat="AIR")
+        rows.search(pos=p0)
+    assert rows.queue.settle(timeout=ROWS.TIMEOUT), "queue did not settle"
+
+    stats = rows.queuestats()
+    q = stats["queue"]
+    assert q["depth"]["inflight"] == 0 and q["depth"]["peak"] > 0, f"depth gauges wrong: {q['depth']}"
+    for lane, t in q["lanes"].items():
+        assert t["submitted"] == t["completed"] and t["inflight"] == 0, f"{lane} counters: {t}"
+        lat = t["latency"]
+        assert lat["count"] == t["completed"], f"{lane} latency count {lat['count']} != {t['completed']}"
+        assert lat["p50"] <= lat["p95"] <= lat["p99"] <= lat["max"], f"{lane} percentiles unordered: {lat}"
+    assert q["lanes"]["insert"]["submitted"] > 0 and q["lanes"]["remove"]["submitted"] > 0, "no edits counted"
+    assert q["lanes"]["bvh"]["submitted"] >= 50 and q["lanes"]["mdx"]["submitted"] > 0, "searches not counted per index"
+    assert q["indexes"] == ["bvh", "mdx"], f"indexes mixed up: {q['indexes']}"
+    for nm in q["indexes"]:
+        for task in ("insert", "remove"):
+            lat = q["maintenance"][nm][task]
+            assert lat["count"] == q["lanes"][task]["completed"], f"{nm} {task} maintenance count {lat['count']} != {q['lanes'][task]['completed']}"
+            assert lat["p50"] <= lat["p95"] <= lat["p99"] <= lat["max"], f"{nm} {task} percentiles unordered: {lat}"
+            assert lat["max"] <= q["lanes"][task]["latency"]["max"], f"{nm} {task} index share slower than the whole job"
+    timer.print(msg=f"STEP 1 : bvh search p99 {q['lanes']['bvh']['latency']['p99']:.6f}s")
+
+    dumped = json.loads(rows.dumpstats())
+    assert dumped["queue"]["lanes"] == rows.queue.stats()["lanes"], "JSON dump differs from stats()"
+
+    sync = ROWS(mode="sync")
+    sync.split(pos=(5, 5, 5), mat="AIR")
+    assert all(t["submitted"] == 0 for t in sync.queuestats()["queue"]["lanes"].values()), "sync mode counted jobs"
+
+    h = Histogram()
+    for ns in (1_500, 3_000, 3_000, 3_000, 1_000_000):
+        h.record(ns=ns)
+    assert 3e-6 <= h.percentile(q=0.5) <= 6e-6, f"p50 {h.percentile(q=0.5)} not near 3us"
+    assert h.percentile(q=0.99) == 1e-3, f"p99 {h.percentile(q=0.99)} is not the max sample"
+
+    # stress: the owner collects + recycles searches while the workers still record them
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        rows = ROWS(mode="async", workers=4)
+        for _ in range(150):
+            p0 = (rng.randint(0, 4000), rng.randint(0, 4000), rng.randint(0, 4000))
+            rows.split(pos=p0, pos1=(p0[0] + rng.randint(1, 4), p0[1] + rng.randint(1, 4), p0[2] + rng.randint(1, 4)), mat="WATER")
+            for _ in range(4):
+                rows.search(pos=(rng.randint(0, 4000), rng.randint(0, 4000), rng.randint(0, 4000)))
+        assert rows.queue.settle(timeout=ROWS.TIMEOUT), "stress: queue did not settle"
+    finally:
+        sys.setswitchinterval(interval)
+    lanes = rows.queue.stats()["lanes"]
+    for lane, t in lanes.items():
+        assert t["submitted"] == t["completed"] == t["latency"]["count"], f"stress: {lane} counters: {t}"
+    timer.print(msg=f" - stress: {sum(t['submitted'] for t in lanes.values())} jobs, every lane submitted == completed")
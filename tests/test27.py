@@ -0,0 +1,49 @@
+# tests/test27.py
+
+from utils import *
+from world import *
+from bundle import *
+from tests.tests import dump, splits, build
+from utils.queue import Queue
+from utils.types import Row
+
+
+def test27() -> None:
+    """
+    test27:
+    Coalescing of cancelling index jobs (Queue.coalesce) in async mode.
+    - seeded carves + refills (split, then merges that delete the fresh rows again)
+    Verifies:
+    - hand made runs: insert + remove of one identity cancel, relabel chains collapse to their ends
+    - the same edits give the exact same rows in sync mode, async mode and async without coalescing
+    - coalescing skips index work: far fewer index updates run than were submitted
+    - every probe still finds the right material through the coalesced BVH
+    """
+    def job(task:str=None, rid:int=None) -> Job:
+        return Job(row=Row(mid=0, rid=rid, row=ROW.ARRAY.copy()), job=task, cls="bvh")
+
+    run = [job("insert", 5), job("remove", 5), job("remove", 7), job("insert", 7), job("remove", 7), job("insert", 7), job("insert", 8)]
+    assert Queue.coalesce(jobs=run) == [True, True, False, True, True, False, False], "wrong cancel pattern"
+
+    # every box twice: AIR, then the STONE refill -> merges delete fresh rows again
+    boxes = [(p0, p1, mat) for p0, p1, _ in splits(seed=27, n=30, span=300, size=5, mats=["AIR"]) for mat in ("AIR", "STONE")]
+
+    def nocoalesce(rows:ROWS=None) -> None:
+        rows.queue.coalescing = False
+
+    sync = build(splits=boxes, mode="sync")
+    rows = build(splits=boxes, mode="async")
+    plain = build(splits=boxes, setup=nocoalesce, mode="async")
+    assert dump(rows) == dump(sync) == dump(plain), "coalesced rows diverged"
+
+    assert rows.queue.settle(timeout=ROWS.TIMEOUT), "queue did not settle"
+    stats = rows.queue.stats()
+    updates = (stats["lanes"]["insert"]["submitted"] + stats["lanes"]["remove"]["submitted"]) * len(stats["indexes"])
+    timer.print(msg=f"STEP 1 : {stats['coalesced']} of {updates} index updates coalesced away")
+    assert stats["coalesced"] * 5 > updates, f"only {stats['coalesced']} of {updates} index updates coalesced"
+    assert plain.queue.stats()["coalesced"] == 0, "coalescing ran although disabled"
+
+    rng = random.Random(270)
+    for _ in range(300):
+        p = (rng.randint(0, 310), rng.randint(0, 310), rng.randint(0, 310))
+        assert rows.search(pos=p)[0] == sync.search(pos=p)[0], f"probe {p} differs"
@@ -0,0 +1,61 @@
+# tests/test28.py
+
+from utils import *
+from world import *
+from bundle import *
+from tests.tests import splits
+from utils.queue import Queue
+from utils.indexes import Indexes
+from utils.types import Row
+
+
+def test28() -> None:
+    """
+    test28:
+    Search priority over index maintenance (Queue backlog + read your writes) in async mode.
+    Verifies:
+    - depends(): a BVH search needs exactly the mutations containing its point that the BVH
+      has not seen yet, plus the other mutations of the same identities, in backlog order
+    - seeded splits + near / far probes give the same answers as sync mode
+    - searches overtook pending maintenance, some mutations were applied early for a search,
+      and the backlog drains once the queue is idle
+    """
+    def job(task:str=None, rid:int=None, p0:POS=None, p1:POS=None) -> Job:
+        return Job(row=Row(mid=0, rid=rid, row=ROW.new(p0=p0, p1=p1, mat="STONE", rid=rid)), job=task, cls="bvh")
+
+    q = Queue(cls=Indexes(), start=False)
+    a = job("insert", 1, (0, 0, 0), (10, 10, 10))
+    b = job("remove", 2, (50, 50, 50), (60, 60, 60))
+    c = job("remove", 3, (0, 0, 0), (1, 1, 1))
+    d = job("insert", 3, (20, 20, 20), (30, 30, 30))     # same identity as c -> comes along
+    e = job("insert", 4, (5, 5, 5), (6, 6, 6))
+    f = job("insert", 5, (0, 0, 0), (2, 2, 2))           # already in the BVH -> not a dependency
+    for j in (a, b, c, d, e, f):
+        q.backlog.append([j, tuple(int(v) for v in ROW.P0(row=j.row.row) + ROW.P1(row=j.row.row)), {"bvh", "mdx"}, (0, j.row.rid)])
+    q.backlog[-1][2].discard("bvh")
+    deps = q.depends(job=Job(pos=(0, 0, 0), job="search", cls="bvh"))
+    assert [dep[0] for dep in deps] == [a, c, d], f"wrong dependencies: {[dep[0].row.rid for dep in deps]}"
+
+    boxes = splits(seed=28, n=60, span=400, size=6, mats=["AIR", "WATER"])
+
+    def searched(mode:str=None) -> tuple[ROWS, list[str]]:
+        # every split is followed by searches at its corners, just past it and far away
+        rng = random.Random(28)
+        rows = ROWS(mode=mode)
+        seen: list[str] = []
+        for p0, p1, mat in boxes:
+            rows.split(pos=p0, pos1=p1, mat=mat)
+            for p in (p0, (p1[0] - 1, p1[1] - 1, p1[2] - 1), (p1[0], p0[1], p0[2]), (rng.randint(0, 9999), 7, 7)):
+                seen.append(rows.search(pos=p)[0])
+        return rows, seen
+
+    sync, want = searched(mode="sync")
+    rows, got = searched(mode="async")
+    assert got == want, "async searches missed their own writes"
+
+    assert rows.queue.settle(timeout=ROWS.TIMEOUT), "queue did not settle"
+    stats = rows.queuestats()["queue"]
+    timer.print(msg=f"STEP 1 : {stats['overtakes']} overtakes, {stats['forced']} forced")
+    assert stats["overtakes"] > 0, "no search overtook maintenance"
+    assert stats["forced"] > 0, "no search depended on pending mutations"
+    assert stats["backlog"] == 0, "backlog not drained when idle"
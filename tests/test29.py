@@ -0,0 +1,84 @@
+# tests/test29.py
+
+from utils import *
+from world import *
+from bundle import *
+from tests.tests import splits, build
+
+
+def test29() -> None:
+    """
+    test29:
+    Fused index maintenance (utils.indexes.Indexes) with an extra registered index.
+    - a tiny volume index (live boxes + volume per material) registered next to BVH / MDX
+    - the same seeded splits in sync mode and async mode
+    Verifies:
+    - the extra index gets every row change with the decoded box, and ends up matching the rows
+    - async mode: ONE job per row change (not one per index), all indexes updated by it
+    - both modes give the same rows, registering a name twice raises
+    """
+    class VOLUMES:
+        def __init__(self) -> None:
+            self.box: dict[tuple[int, int], tuple[int, ...]] = {}
+            self.volume = [0] * MATERIALS.NUM
+            self.inserts = 0
+            self.removes = 0
+
+        def insert(self, row=None, box=None) -> None:
+            assert box is not None, "index insert without the decoded box"
+            self.inserts += 1
+            self.drop(row=row)
+            self.box[(int(row.mid), int(row.rid))] = box
+            self.volume[int(row.mid)] += (box[3] - box[0]) * (box[4] - box[1]) * (box[5] - box[2])
+
+        def remove(self, row=None) -> None:
+            self.removes += 1
+            self.drop(row=row)
+
+        def drop(self, row=None) -> None:
+            box = self.box.pop((int(row.mid), int(row.rid)), None)
+            if box is not None:
+                self.volume[int(row.mid)] -= (box[3] - box[0]) * (box[4] - box[1]) * (box[5] - box[2])
+
+    boxes = splits(seed=29, n=40, span=240, size=8, mats=["AIR", "WATER"])
+
+    def volumes(rows:ROWS=None) -> None:
+        vols = rows.register(name="volumes", index=VOLUMES())
+        stone = rows.get(mat="STONE", rid=0)                    # the world row predates the index
+        vols.insert(row=stone, box=(*rows.p0, *rows.p1))
+
+    def world(mode:str=None) -> tuple[ROWS, VOLUMES]:
+        rows = build(splits=boxes, setup=volumes, mode=mode, p0=(0, 0, 0), p1=(256, 256, 256))
+        rows.search(pos=(0, 0, 0))
+        return rows, rows.indexes["volumes"]
+
+    def live(rows:ROWS=None) -> dict[tuple[int, int], tuple[int, ...]]:
+        return {(mid, rid): tuple(box) for mid in range(MATERIALS.NUM) for rid, box in enumerate(rows.boxes(mid=mid).tolist())}
+
+    sync, svols = world(mode="sync")
+    rows, vols = world(mode="async")
+    assert rows.queue.settle(timeout=ROWS.TIMEOUT), "queue did not settle"
+    assert live(rows) == live(sync), "async mode diverged from sync mode"
+
+    for r, v in ((sync, svols), (rows, vols)):
+        assert v.box == live(r), f"{r.mode}: extra index does not match the rows"
+        for mat in ("STONE", "AIR", "WATER"):
+            assert v.volume[r.mat.mid(name=mat)] == r.volume(mat=mat), f"{r.mode}: {mat} volume differs in the extra index"
+
+    stats = rows.queue.stats()
+    lanes = stats["lanes"]
+    edits = lanes["insert"]["submitted"] + lanes["remove"]["submitted"]
+    timer.print(msg=f"STEP 1 : {edits} fused edit jobs for {stats['indexes']}, {stats['coalesced']} coalesced index updates")
+    assert stats["indexes"] == ["bvh", "mdx", "volumes"], f"registered indexes: {stats['indexes']}"
+    assert lanes["insert"]["submitted"] == lanes["insert"]["completed"] and lanes["remove"]["submitted"] == lanes["remove"]["completed"]
+    # sync mode calls every index once per row change -> async mode must submit exactly that many jobs
+    # (the world row insert job and the manual seed of the extra index cancel out)
+    assert lanes["insert"]["submitted"] == svols.inserts, "not one insert job per row insert"
+    assert lanes["remove"]["submitted"] == svols.removes, "not one remove job per row remove"
+
+    try:
+        rows.register(name="mdx", index=VOLUMES())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("registering 'mdx' twice did not raise")
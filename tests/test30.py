@@ -0,0 +1,105 @@
+# tests/test30.py
+
+from utils import *
+from world import *
+from bundle import *
+from tests.tests import build
+
+
+def test30() -> None:
+    """
+    test30:
+    Edits from several threads on ONE ROWS: ROWS.lock is held for a whole edit, so edits run one
+    at a time (safe sharing, no speedup is expected or measured; parallel edits -> SHARDS).
+    - the world is pre cut into 4 quadrant columns of different materials
+    - 4 miner threads split inside their own quadrant (z < 48), a 5th thread splits boxes
+      straddling the quadrant borders in z >= 48
+    Verifies:
+    - a split waits for the edit lock another thread holds, and runs once it is free
+    - sync and async mode: the threaded world equals the same edits run on one thread, cell by cell
+    - no overlapping rows, every probe finds the painted material
+    - whole world merges next to a miner leave the world unchanged
+    """
+    W = (256, 256, 64)
+    rows = ROWS(p0=(0, 0, 0), p1=W)
+    started = threading.Event()
+    t = threading.Thread(target=lambda: (started.set(), rows.split(pos=(1, 1, 1), pos1=(3, 3, 3), mat="AIR")))
+    with rows.lock:
+        t.start()
+        started.wait(timeout=ROWS.TIMEOUT)
+        t.join(timeout=0.2)
+        assert t.is_alive() and rows.total == 1, "a split ran while another thread held the edit lock"
+    t.join(timeout=ROWS.TIMEOUT)
+    assert not t.is_alive() and rows.volume(mat="AIR") == 8
+
+    quads = [((0, 0, 0), (128, 128, 64), "GLASS"), ((128, 0, 0), (256, 128, 64), "OBSIDIAN"),
+             ((0, 128, 0), (128, 256, 64), "OBSIDIAN"), ((128, 128, 0), (256, 256, 64), "GLASS")]
+    rng = random.Random(30)
+    miners: list[list[dict]] = []
+    for (q0, q1, _) in quads:
+        edits = []
+        for _ in range(25):
+            x, y, z = rng.randint(q0[0], q1[0] - 9), rng.randint(q0[1], q1[1] - 9), rng.randint(0, 44)
+            edits.append({"pos": (x, y, z), "pos1": (x + rng.randint(1, 8), y + rng.randint(1, 8), z + rng.randint(1, 3)), "mat": rng.choice(["AIR", "WATER"])})
+        miners.append(edits)
+    border = []
+    for _ in range(15):
+        x, y, z = rng.randint(100, 127), rng.randint(100, 127), rng.randint(48, 60)
+        border.append({"pos": (x, y, z), "pos1": (x + rng.randint(2, 50), y + rng.randint(2, 50), z + rng.randint(1, 4)), "mat": "LAVA"})
+    miners.append(border)
+
+    def paint(rows:ROWS=None) -> np.ndarray:
+        grid = np.full(W, -1, dtype=np.int8)
+        count = np.zeros(W, dtype=np.int8)
+        for mid in range(MATERIALS.NUM):
+            for x0, y0, z0, x1, y1, z1 in rows.boxes(mid=mid).tolist():
+                grid[x0:x1, y0:y1, z0:z1] = mid
+                count[x0:x1, y0:y1, z0:z1] += 1
+        assert (count == 1).all(), "rows overlap or leave holes"
+        return grid
+
+    ref = build(splits=quads, mode="sync", p0=(0, 0, 0), p1=W)
+    for edits in miners:
+        for e in edits:
+            ref.split(**e)
+    want = paint(ref)
+
+    for mode in ("sync", "async"):
+        rows = build(splits=quads, mode=mode, p0=(0, 0, 0), p1=W)
+        errors: list[BaseException] = []
+
+        def mine(edits:list[dict]=None) -> None:
+            try:
+                for e in edits:
+                    rows.split(**e)
+            except BaseException as exc:
+                errors.append(exc)
+
+        t0 = time.perf_counter()
+        threads = [threading.Thread(target=mine, kwargs={"edits": edits}) for edits in miners]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=60)
+        wall = time.perf_counter() - t0
+        assert not errors, f"{mode}: thread failed: {errors[0]!r}"
+        assert not any(t.is_alive() for t in threads), f"{mode}: a miner thread hangs"
+
+        timer.print(msg=f"STEP 1 : {mode}: {sum(len(m) for m in miners)} splits from {len(threads)} threads in {wall:.3f}s")
+        got = paint(rows)
+        assert (got == want).all(), f"{mode}: threaded world differs in {int((got != want).sum())} cells"
+        for _ in range(300):
+            pos = (rng.randint(0, W[0] - 1), rng.randint(0, W[1] - 1), rng.randint(0, W[2] - 1))
+            assert rows.mat.mid(name=rows.search(pos=pos)[0]) == want[pos], f"{mode}: search differs at {pos}"
+
+        # whole world merges hold the edit lock -> they run one after the other, next to a miner
+        n = rows.total
+        threads = [threading.Thread(target=rows.merge) for _ in range(2)]
+        threads.append(threading.Thread(target=mine, kwargs={"edits": border[:3]}))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=60)
+        assert not errors and not any(t.is_alive() for t in threads), f"{mode}: merge threads failed: {errors}"
+        assert (paint(rows) == want).all(), f"{mode}: merges changed the world"
+        timer.print(msg=f" - {mode}: 2 concurrent merges: {n} -> {rows.total} rows")
@@ -0,0 +1,91 @@
+# tests/test31.py
+
+from utils import *
+from world import *
+from bundle import *
+import multiprocessing as mp
+
+
+def watch(name: str = None, conn=None) -> None:
+    # reader process: consistent world volumes until told to stop, then what it saw last
+    with RowsReader(name=name) as reader:
+        conn.send(reader.epoch())
+        volumes = set()
+        while not conn.poll():
+            volumes.add(reader.volume())
+        conn.recv()
+        conn.send((volumes, reader.reads, reader.torn, reader.counts(), reader.epoch(), reader.volume(mat="AIR")))
+
+
+def test31() -> None:
+    """
+    test31:
+    Shared memory row storage (ROWS(shm=True)) + RowsReader in another process.
+    - a spawned reader process computes the world volume in a loop while this process splits
+    Verifies:
+    - every read the reader accepted was consistent (world volume never off), reads got retried
+    - published counts / epoch / material volume match the writer once it is idle
+    - seqlock: no read while an edit is open, a read overlapping an edit is retried
+    - the reader's views are read only, close() unlinks the block and keeps the rows usable
+    """
+    W = (256, 256, 64)
+    rows = ROWS(shm=True, p0=(0, 0, 0), p1=W)
+    try:
+        reader = RowsReader(name=rows.shm)
+        assert reader.p1 == W and reader.counts()[rows.mat.mid(name="STONE")] == 1
+        assert not reader.view(mid=0).flags.writeable, "reader view is writeable"
+
+        with rows.edit():
+            assert rows.shared.epoch() % 2 == 1, "epoch even inside an edit"
+            try:
+                reader.read(lambda r, counts: 0, timeout=0.05)
+                assert False, "read during an open edit"
+            except TimeoutError:
+                pass
+        torn = reader.torn
+        calls = []
+
+        def overlapped(r: RowsReader = None, counts: dict = None) -> int:
+            calls.append(counts)
+            if len(calls) == 1:
+                rows.split(pos=(0, 0, 0), pos1=(1, 1, 1), mat="AIR")     # an edit lands mid read
+            return counts[rows.mat.mid(name="AIR")]
+        assert reader.read(overlapped) == 1 and len(calls) == 2 and reader.torn > torn, "overlapping read not retried"
+
+        ctx = mp.get_context("spawn")
+        mine, theirs = ctx.Pipe()
+        proc = ctx.Process(target=watch, kwargs={"name": rows.shm, "conn": theirs}, daemon=True)
+        proc.start()
+        assert mine.poll(timeout=60), "reader process did not attach"
+        mine.recv()
+
+        rng = random.Random(31)
+        t0 = time.perf_counter()
+        for _ in range(150):
+            x, y, z = rng.randint(0, 240), rng.randint(0, 240), rng.randint(0, 60)
+            rows.split(pos=(x, y, z), pos1=(x + rng.randint(1, 16), y + rng.randint(1, 16), z + rng.randint(1, 4)), mat=rng.choice(["AIR", "WATER"]))
+        wall = time.perf_counter() - t0
+        mine.send(None)
+        assert mine.poll(timeout=60), "reader process did not answer"
+        volumes, reads, retried, counts, epoch, air = mine.recv()
+        proc.join(timeout=10)
+
+        timer.print(msg=f"STEP 1 : 150 splits in {wall:.3f}s, reader process: {reads} consistent reads, {retried} retried")
+        assert volumes == {W[0] * W[1] * W[2]}, f"reader saw torn worlds: {volumes}"
+        assert reads > 0
+        assert counts == rows.arids and epoch == rows.shared.epoch() and epoch % 2 == 0
+        assert air == rows.volume(mat="AIR") == reader.volume(mat="AIR")
+        assert reader.search(pos=(5, 5, 5))[0] == rows.search(pos=(5, 5, 5))[0]
+    finally:
+        name = rows.shm
+        rows.close()
+
+    rows.split(pos=(8, 8, 8), pos1=(9, 9, 9), mat="LAVA")
+    assert rows.volume(mat="LAVA") == 1 and reader.volume() == W[0] * W[1] * W[2]
+    reader.close()
+    try:
+        RowsReader(name=name)
+        assert False, "block still attachable after close()"
+    except FileNotFoundError:
+        pass
+    timer.print(msg=" - seqlock retries, read only views and unlink on close() OK")
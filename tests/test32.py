@@ -0,0 +1,84 @@
+# tests/test32.py
+
+from utils import *
+from world import *
+from bundle import *
+
+
+def test32() -> None:
+    """
+    test32:
+    MVCC read snapshots (ROWS.read_snapshot) while the world keeps changing.
+    Verifies:
+    - taking a snapshot copies nothing, the first change of a material copies it ONCE for every
+      snapshot at that version, untouched materials stay views
+    - a snapshot keeps the boxes, volumes and search answers of its epoch through later splits
+    - an analytics thread taking snapshots during splits always sees a whole world
+    - copies are dropped when the last snapshot closes, no snapshot inside an open edit
+    """
+    W = (256, 256, 64)
+    rows = ROWS(p0=(0, 0, 0), p1=W)
+    rng = random.Random(32)
+
+    def edit(n:int=None) -> None:
+        for _ in range(n):
+            x, y, z = rng.randint(0, 240), rng.randint(0, 240), rng.randint(0, 60)
+            rows.split(pos=(x, y, z), pos1=(x + rng.randint(1, 16), y + rng.randint(1, 16), z + rng.randint(1, 4)), mat=rng.choice(["AIR", "WATER"]))
+
+    edit(n=30)
+    lava = rows.mat.mid(name="LAVA")
+    with rows.read_snapshot() as a, rows.read_snapshot() as b:
+        assert a.epoch == b.epoch == rows.epoch and rows.copies == 0, "taking a snapshot copied rows"
+        boxes = [a.boxes(mid=mid).copy() for mid in range(MATERIALS.NUM)]
+        volumes = {mat: rows.volume(mat=mat) for mat in ("STONE", "AIR", "WATER")}
+        probes = [(rng.randint(0, W[0] - 1), rng.randint(0, W[1] - 1), rng.randint(0, W[2] - 1)) for _ in range(200)]
+        answers = [rows.search(pos=pos)[0] for pos in probes]
+
+        edit(n=60)
+        assert rows.copies == 3, f"copies for STONE / AIR / WATER expected, got {rows.copies}"
+        assert a.data[rows.mat.mid(name="AIR")] is b.data[rows.mat.mid(name="AIR")], "snapshots of one version do not share the copy"
+        assert a.live[lava] and not a.live[rows.mat.mid(name="STONE")], "untouched material was copied"
+        for mid in range(MATERIALS.NUM):
+            assert (a.boxes(mid=mid) == boxes[mid]).all() and (b.boxes(mid=mid) == boxes[mid]).all(), f"snapshot rows of {mid} changed"
+        for mat, v in volumes.items():
+            assert a.volume(mat=mat) == v, f"snapshot {mat} volume changed"
+        assert a.volume() == W[0] * W[1] * W[2]
+        for pos, mat in zip(probes, answers):
+            assert a.search(pos=pos)[0] == mat, f"snapshot search differs at {pos}"
+        stats = rows.snapstats()
+        timer.print(msg=f"STEP 1 : 2 snapshots through 60 splits: {stats}")
+        assert stats["open"] == 2 and stats["held"] > 0 and a.epoch < rows.epoch
+
+    stats = rows.snapstats()
+    assert stats["open"] == 0 and stats["held"] == 0 and all(not pins for pins in rows.pinned), stats
+    assert a.closed and a.data[0] is None
+
+    with rows.edit():
+        try:
+            rows.snapshot(timeout=0.05)
+            assert False, "snapshot taken inside an open edit"
+        except TimeoutError:
+            pass
+
+    # analytics thread: every snapshot is one whole world while splits go on
+    stop = threading.Event()
+    seen: list[tuple[int, int, int]] = []
+    errors: list[BaseException] = []
+
+    def analytics() -> None:
+        try:
+            while not stop.is_set():
+                with rows.read_snapshot() as snap:
+                    seen.append((snap.epoch, snap.volume(), sum(snap.counts.values()) - snap.total))
+        except BaseException as e:
+            errors.append(e)
+
+    t = threading.Thread(target=analytics)
+    t.start()
+    edit(n=100)
+    stop.set()
+    t.join(timeout=60)
+    assert not errors, f"analytics thread failed: {errors[0]!r}"
+    timer.print(msg=f" - analytics thread: {len(seen)} snapshots over epochs {seen[0][0]}..{seen[-1][0]}, {rows.copies} copies")
+    assert seen and all(v == W[0] * W[1] * W[2] and d == 0 for _, v, d in seen), "a snapshot saw a partial world"
+    assert rows.snapstats()["open"] == 0
@@ -0,0 +1,87 @@
+# tests/test33.py
+
+from utils import *
+from world import *
+from bundle import *
+from utils.types import Row
+
+
+def test33() -> None:
+    """
+    test33:
+    Vectorized splitrow (ROW.many + ROWS.insertmany) against the row by row reference.
+    - the reference carves the same 7 pieces with one insert() per piece (the old kernel)
+    Verifies:
+    - ROW.many builds the same rows as ROW.new (clip, sort, sizes, flags per material)
+    - sync and async mode: point splits leave the same rows, rids included, as the reference
+    - the result is compact: as many slots as the biggest material needs, nothing else
+    - insertmany copies a pinned material before it writes (snapshots keep their rows)
+    """
+    rng = random.Random(33)
+    mat = Materials()
+    for _ in range(200):
+        p0 = (rng.randint(-5, 300), rng.randint(-5, 300), rng.randint(-5, 70))
+        p1 = (rng.randint(-5, 300), rng.randint(-5, 300), rng.randint(-5, 70))
+        name = rng.choice(mat.names())
+        rid = rng.randint(0, 1000)
+        one = ROW.many(p0s=[p0], p1s=[p1], mids=[mat.mid(name=name)], rids=[rid], dirty=rid % 2 == 0)[0]
+        assert (one == ROW.new(p0=p0, p1=p1, mat=name, rid=rid, dirty=rid % 2 == 0)).all(), f"ROW.many differs for {p0} {p1} {name}"
+
+    W = (256, 256, 64)
+    pts = [(rng.randint(0, W[0] - 1), rng.randint(0, W[1] - 1), rng.randint(0, W[2] - 1)) for _ in range(400)]
+    sizes = [(rng.randint(1, 3), rng.randint(1, 3), rng.randint(1, 2)) for _ in pts]
+    mats = [rng.choice(["AIR", "WATER", "LAVA"]) for _ in pts]
+
+    def reference(rows:ROWS=None, p0:POS=None, p1:POS=None, mat:str=None) -> None:
+        mat0, _, hitrow = rows.search(pos=p0)
+        x0,y0,z0 = (int(v) for v in ROW.P0(row=hitrow))
+        x3,y3,z3 = (int(v) for v in ROW.P1(row=hitrow))
+        x1,y1,z1 = (max(a, min(int(v), b)) for v, a, b in zip(p0, (x0,y0,z0), (x3,y3,z3)))
+        x2,y2,z2 = (max(a, min(int(v), b)) for v, a, b in zip(p1, (x0,y0,z0), (x3,y3,z3)))
+        rows.remove(row=Row(mid=int(ROW.MID(row=hitrow)), rid=int(ROW.RID(row=hitrow)), row=hitrow))
+        for q0, q1, m in (((x0,y0,z0), (x1,y3,z3), mat0), ((x2,y0,z0), (x3,y3,z3), mat0),
+                          ((x1,y0,z0), (x2,y1,z3), mat0), ((x1,y2,z0), (x2,y3,z3), mat0),
+                          ((x1,y1,z0), (x2,y2,z1), mat0), ((x1,y1,z2), (x2,y2,z3), mat0),
+                          ((x1,y1,z1), (x2,y2,z2), mat)):
+            if all(b > a for a, b in zip(q0, q1)):
+                rows.insert(p0=q0, p1=q1, mat=m)
+
+    ref = ROWS(p0=(0, 0, 0), p1=W)
+    t0 = time.perf_counter()
+    for p, s, m in zip(pts, sizes, mats):
+        reference(rows=ref, p0=p, p1=(p[0] + s[0], p[1] + s[1], p[2] + s[2]), mat=m)
+    slow = time.perf_counter() - t0
+
+    for mode in ("sync", "async"):
+        rows = ROWS(mode=mode, p0=(0, 0, 0), p1=W)
+        t0 = time.perf_counter()
+        out = [rows.splitrow(p0=p, p1=(p[0] + s[0], p[1] + s[1], p[2] + s[2]), mat=m) for p, s, m in zip(pts, sizes, mats)]
+        fast = time.perf_counter() - t0
+        timer.print(msg=f"STEP 1 : {mode}: {len(pts)} point splits, vectorized {fast:.3f}s / per piece (sync) {slow:.3f}s")
+
+        for array, arids in out:
+            assert array.shape[1] == max(arids.values()) and 1 <= sum(arids.values()) <= 7, f"result not compact: {array.shape} {arids}"
+            for mid in range(MATERIALS.NUM):
+                assert (array[mid][arids[mid]:] == ROW.SENTINEL).all()
+        array, arids = out[-1]
+        for mid in range(MATERIALS.NUM):
+            for r in array[mid][:arids[mid]]:
+                assert (rows.array[mid][int(r[ROW.IDS_RID])] == r).all(), "result row is not the stored row"
+
+        assert rows.arids == ref.arids and rows.total == ref.total
+        for mid in range(MATERIALS.NUM):
+            n = rows.arids[mid]
+            assert (rows.array[mid][:n] == ref.array[mid][:n]).all(), f"{mode}: rows of {mid} differ from the reference"
+        assert rows.volume() == W[0] * W[1] * W[2]
+        for _ in range(300):
+            pos = (rng.randint(0, W[0] - 1), rng.randint(0, W[1] - 1), rng.randint(0, W[2] - 1))
+            assert rows.search(pos=pos)[:2] == ref.search(pos=pos)[:2], f"{mode}: search differs at {pos}"
+
+    # a pinned material is copied before the bulk write
+    with rows.read_snapshot() as snap:
+        water = rows.mat.mid(name="WATER")
+        before = snap.boxes(mid=water).copy()
+        raw, rids = rows.insertmany(p0s=[(0, 0, 0)], p1s=[(1, 1, 1)], mids=[water])
+        assert int(rids[0]) == rows.arids[water] - 1 and (raw[0] == rows.array[water][int(rids[0])]).all()
+        assert not snap.live[water] and (snap.boxes(mid=water) == before).all(), "bulk insert changed a snapshot"
+    timer.print(msg=" - compact results, copy on write and the row by row reference OK")
@@ -1,7 +1,7 @@
-
-
-
-
-
-def test9() -> None:
+
+
+
+
+
+def test9() -> None:
     pass
\ No newline at end of file
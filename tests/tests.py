@@ -1,25 +1,78 @@
-from utils import *
-from world import *
-from bundle import *
-from tests import *
-
-
-
-def tests(tests:list=None) -> None:
-    if tests is None:
-        tests = [test1, test2, test3, test4, test5, test6]
-
-    
-    with Bundle():
-        try:
-            for i, test in enumerate(tests):
-                
-                print(f"\n=== RUNNING TEST {i+1}/{len(tests)}: {test.__name__} ===")
-                timer.lap()
-                test()
-                print(f"=== TEST {i+1}/{len(tests)}: {test.__name__} PASSED in {timer.lap():.3f} seconds ===\n")
-
-        except Exception:
-            traceback.print_exc()
-        finally:
-            pass
\ No newline at end of file
+from utils import *
+from world import *
+from bundle import *
+from tests import *
+from typing import Callable
+from utils.types import POS
+
+
+
+def tests(tests:list=None) -> None:
+    if tests is None:
+        tests = [test1, test2, test3, test4, test5, test6]
+
+    
+    with Bundle():
+        try:
+            for i, test in enumerate(tests):
+                
+                print(f"\n=== RUNNING TEST {i+1}/{len(tests)}: {test.__name__} ===")
+                timer.lap()
+                test()
+                print(f"=== TEST {i+1}/{len(tests)}: {test.__name__} PASSED in {timer.lap():.3f} seconds ===\n")
+
+        except Exception:
+            traceback.print_exc()
+        finally:
+            pass
+
+
+# ============================================================
+# shared helpers (worlds built the same way in several tests)
+# ============================================================
+
+def dump(rows:ROWS=None) -> list[list[tuple[int, ...]]]:
+    """
+    Sorted row boxes per material -> two worlds compare equal whatever their row order.
+    """
+    return [sorted(map(tuple, rows.boxes(mid=mid).tolist())) for mid in range(MATERIALS.NUM)]
+
+
+def splits(seed:int=None, n:int=None, span:int=None, size:int=None, mats:list[str]=None) -> list[tuple[POS, POS, str]]:
+    """
+    n seeded random split boxes (p0, p1, mat): p0 in [0, span] per axis, 1..size cells per axis.
+    """
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        p0 = tuple(rng.randint(0, span) for _ in range(3))
+        p1 = tuple(v + rng.randint(1, size) for v in p0)
+        out.append((p0, p1, rng.choice(mats)))
+    return out
+
+
+def build(splits:list[tuple[POS, POS, str]]=None, setup:Callable[[ROWS], None]=None, **kwargs) -> ROWS:
+    """
+    ROWS(**kwargs) with the split boxes (splits()) applied in order.
+    setup(rows) runs first (queue flags, extra indexes, ...).
+    """
+    rows = ROWS(**kwargs)
+    if setup is not None:
+        setup(rows)
+    for p0, p1, mat in splits:
+        rows.split(pos=p0, pos1=p1, mat=mat)
+    return rows
+
+
+def voxels(seed:int=None, n:int=None, mats:list[str]=None, **kwargs) -> ROWS:
+    """
+    ROWS(**kwargs) holding only an n x n x n grid of unit rows of seeded random materials.
+    """
+    rng = random.Random(seed)
+    rows = ROWS(**kwargs)
+    rows.remove(row=rows.get(mat="STONE", rid=0))
+    for x in range(n):
+        for y in range(n):
+            for z in range(n):
+                rows.insert(p0=(x, y, z), p1=(x + 1, y + 1, z + 1), mat=rng.choice(mats))
+    return rows
@@ -1,11 +1,15 @@
-from .request import Request
-from .job import Job
-from .includes import *
-from .includes import __all__ as inc
-
-__all__ = [
-    "Request",
-    "Job",
-]
-
+from .request import Request
+from .job import Job
+from .pool import JobPool
+from .hist import Histogram
+from .includes import *
+from .includes import __all__ as inc
+
+__all__ = [
+    "Request",
+    "Job",
+    "JobPool",
+    "Histogram",
+]
+
 __all__.extend(inc)
\ No newline at end of file
@@ -0,0 +1,187 @@
+# utils/adj.py
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from world.rows import ROWS
+
+from bisect import bisect_left, insort
+
+from world.row import ROW
+from utils.types import Row
+
+LOC = tuple[int, int]                          # (mid, rid)
+BOX = tuple[int, int, int, int, int, int]      # (x0, y0, z0, x1, y1, z1)
+RECT = tuple[int, int, int, int]               # (u0, u1, v0, v1) face rectangle on a plane
+FACE = tuple[int, int, int, int, int, int]     # (u0, u1, v0, v1, mid, rid) -> sorts by u0
+PLANE = dict[int, list[FACE]]                  # width class -> faces sorted by u0
+
+
+class ADJ:
+    """
+    Face adjacency graph over ALL materials, partial contacts included.
+
+    - faces[ax][side][plane coord][k] -> faces of u width < 2**k, sorted by u0
+        side 0 -> min faces (x0 / y0 / z0), side 1 -> max faces (x1 / y1 / z1)
+      -> a query bisects each width class to u0 in (qu0 - 2**k, qu1): only faces that can overlap
+         on u are visited, never the whole plane (one big face does not widen the others' window)
+    - touching(row, axis) -> every row whose opposite face lies on the same plane
+      and overlaps this row's face rectangle with positive area (+ the area)
+    - partner(row, axis) -> the same material row with the identical opposite face (a merge
+      partner, as MDX.search): ROWS merges take it from here when adj is on -> ADJ is inline
+      (side index), so async merges skip the queue round trip of an MDX search
+    - boxes are copied on insert, so remove() never reads the (maybe reused) row slot
+
+    Opt in (ROWS(adj=True)): 6 sorted inserts / removes per row change on top of BVH + MDX,
+    worth it for partial contact queries and async merges, not for every world.
+    """
+    UV = ((1, 2), (0, 2), (0, 1))   # the two span axes of a face on axis 0 / 1 / 2
+
+    def __init__(self, rows: "ROWS" = None) -> None:
+        self.rows = rows
+        self.init()
+
+    def init(self) -> None:
+        self.faces: list[list[dict[int, PLANE]]] = [[{}, {}] for _ in range(3)]
+        self.box: dict[LOC, BOX] = {}
+
+    def __len__(self) -> int:
+        return len(self.box)
+
+    @staticmethod
+    def rect(box:BOX, axis:int) -> RECT:
+        u, v = ADJ.UV[axis]
+        return (box[u], box[u+3], box[v], box[v+3])
+
+    @staticmethod
+    def width(rect:RECT) -> int:
+        # width class k: u width < 2**k
+        return (rect[1] - rect[0]).bit_length()
+
+    def insert(self, row:Row=None, box:BOX=None) -> None:
+        mid, rid = int(row.mid), int(row.rid)
+        if box is None:
+            x0, y0, z0 = ROW.P0(row=row.row)
+            x1, y1, z1 = ROW.P1(row=row.row)
+            box = (int(x0), int(y0), int(z0), int(x1), int(y1), int(z1))
+
+        loc: LOC = (mid, rid)
+        if loc in self.box:
+            self.remove(row=row)
+        self.box[loc] = box
+
+        for ax in (0, 1, 2):
+            rect = ADJ.rect(box, ax)
+            k = ADJ.width(rect)
+            for side in (0, 1):
+                plane = self.faces[ax][side].setdefault(box[ax + 3*side], {})
+                insort(plane.setdefault(k, []), (*rect, mid, rid))
+
+    def remove(self, row:Row=None) -> None:
+        loc: LOC = (int(row.mid), int(row.rid))
+        box = self.box.pop(loc, None)
+        if box is None:
+            return
+
+        for ax in (0, 1, 2):
+            rect = ADJ.rect(box, ax)
+            k = ADJ.width(rect)
+            face: FACE = (*rect, *loc)
+            for side in (0, 1):
+                planes = self.faces[ax][side]
+                coord = box[ax + 3*side]
+                faces = planes.get(coord, {}).get(k)
+                if not faces:
+                    continue
+                i = bisect_left(faces, face)
+                if i < len(faces) and faces[i] == face:
+                    del faces[i]
+                if not faces:
+                    del planes[coord][k]
+                    if not planes[coord]:
+                        del planes[coord]
+
+    def overlaps(self, plane:PLANE=None, rect:RECT=None) -> list[FACE]:
+        """
+        Faces of one plane overlapping `rect` with positive area: per width class, only the
+        u0 window (u0 - 2**k, u1) is visited.
+        """
+        u0, u1, v0, v1 = rect
+        out: list[FACE] = []
+        for k, faces in plane.items():
+            i = bisect_left(faces, (u0 - (1 << k) + 1,))
+            j = bisect_left(faces, (u1,))
+            for face in faces[i:j]:
+                if face[1] > u0 and face[2] < v1 and v0 < face[3]:
+                    out.append(face)
+        return out
+
+    # ============================================================
+    # queries
+    # ============================================================
+
+    def touching(self, row:Row=None, axis:int=None, side:int=None) -> list[tuple[Row, int]]:
+        """
+        All rows touching `row` across its face(s) on `axis`, with the contact area.
+        side: 1 -> across the max face, 0 -> across the min face, None -> both.
+
+        Returns:
+            [(Row(mid, rid, row_view), area), ...]
+        """
+        if axis not in (0, 1, 2):
+            raise ValueError("axis must be 0,1,2")
+        if side not in (0, 1, None):
+            raise ValueError("side must be 0, 1 or None")
+
+        loc: LOC = (int(row.mid), int(row.rid))
+        box = self.box.get(loc)
+        if box is None:
+            return []
+
+        rect = ADJ.rect(box, axis)
+        u0, u1, v0, v1 = rect
+        out: list[tuple[Row, int]] = []
+        for s in ((0, 1) if side is None else (side,)):
+            # my face on side s meets their face on side 1-s
+            plane = self.faces[axis][1-s].get(box[axis + 3*s])
+            if not plane:
+                continue
+            for a0, a1, b0, b1, mid, rid in self.overlaps(plane=plane, rect=rect):
+                du = min(u1, a1) - max(u0, a0)
+                dv = min(v1, b1) - max(v0, b0)
+                out.append((Row(mid=mid, rid=rid, row=self.rows.array[mid][rid]), du * dv))
+        return out
+
+    def partner(self, row:Row=None, axis:int=None) -> Row | None:
+        """
+        THE merge partner on `axis` (same material, identical face), +face first, then -face
+        -> same answer as MDX.search(row, axis).
+        """
+        if axis not in (0, 1, 2):
+            raise ValueError("axis must be 0,1,2")
+
+        loc: LOC = (int(row.mid), int(row.rid))
+        box = self.box.get(loc)
+        if box is None:
+            return None
+
+        rect = ADJ.rect(box, axis)
+        for s in (1, 0):
+            faces = self.faces[axis][1-s].get(box[axis + 3*s], {}).get(ADJ.width(rect))
+            if not faces:
+                continue
+            i = bisect_left(faces, (*rect, loc[0]))
+            if i < len(faces) and faces[i][:5] == (*rect, loc[0]) and faces[i][5] != loc[1]:
+                mid, rid = loc[0], faces[i][5]
+                return Row(mid=mid, rid=rid, row=self.rows.array[mid][rid])
+        return None
+
+    def neighbors(self, row:Row=None) -> list[tuple[Row, int, int]]:
+        """
+        touching() on all three axes -> [(Row, axis, area), ...]
+        """
+        out: list[tuple[Row, int, int]] = []
+        for ax in (0, 1, 2):
+            for r, area in self.touching(row=row, axis=ax):
+                out.append((r, ax, area))
+        return out
@@ -0,0 +1,145 @@
+# utils/cache.py
+from __future__ import annotations
+from typing import Any, Hashable
+from collections import OrderedDict
+import sys
+
+import numpy as np
+
+from world.row import ROW
+from utils.types import POS
+
+
+class Cache:
+    """
+    Region epoch query cache.
+
+    - the world is cut into sectors of 2**bits cells per axis, each sector has an epoch
+    - bump(p0, p1) stamps every sector a changed row touches with a new clock value
+    - an entry remembers the clock it was computed at + the sectors of its query box
+      -> valid while no sector of its box was stamped later (one vectorized max)
+    - eviction: "lru" (hits refresh) or "fifo", bounded by entry count AND bytes
+    - counters: hits, misses, stale (invalidated on lookup), evictions
+    """
+    SIZE = 1024                 # max entries
+    NBYTES = 64 * 1024**2       # max bytes held by cached values
+    BITS = (14, 14, 12)         # sector size per axis -> 64 x 64 x 16 sectors for the default world
+    POLICIES = ("lru", "fifo")
+
+    def __init__(self, size:int=SIZE, nbytes:int=NBYTES, bits:POS=BITS, policy:str="lru") -> None:
+        if policy not in Cache.POLICIES:
+            raise ValueError(f"Cache policy must be one of {Cache.POLICIES}")
+        self.size = size
+        self.nbytes = nbytes
+        self.bits = bits
+        self.policy = policy
+
+        self.init()
+
+    def init(self) -> None:
+        bx, by, bz = self.bits
+        shape = (((ROW.XMAX-1) >> bx) + 1, ((ROW.YMAX-1) >> by) + 1, ((ROW.ZMAX-1) >> bz) + 1)
+        self.epochs = np.zeros(shape, dtype=np.uint64)
+        self.clock = 0
+
+        self.entries: OrderedDict[Hashable, tuple[int, tuple[slice,slice,slice], Any, int]] = OrderedDict()
+        self.used = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    # ============================================================
+    # epochs
+    # ============================================================
+
+    def sectors(self, p0:POS=None, p1:POS=None) -> tuple[slice, slice, slice]:
+        # half open box [p0, p1) -> half open sector ranges
+        out = []
+        for i, b in enumerate(self.bits):
+            a0, a1 = int(p0[i]), int(p1[i])
+            if a1 <= a0:
+                a1 = a0 + 1
+            out.append(slice(a0 >> b, ((a1 - 1) >> b) + 1))
+        return tuple(out)
+
+    def bump(self, p0:POS=None, p1:POS=None) -> None:
+        self.clock += 1
+        self.epochs[self.sectors(p0=p0, p1=p1)] = self.clock
+
+    # ============================================================
+    # entries
+    # ============================================================
+
+    def get(self, key:Hashable=None) -> Any | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stamp, secs, value, nbytes = entry
+        if int(self.epochs[secs].max()) > stamp:
+            self.drop(key=key)
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        if self.policy == "lru":
+            self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key:Hashable=None, p0:POS=None, p1:POS=None, value:Any=None, stamp:int=None) -> Any:
+        """
+        stamp -> clock read BEFORE the value was computed (defaults to now).
+        """
+        if self.size <= 0:
+            return value
+        nbytes = self.sizeof(value)
+        if nbytes > self.nbytes:
+            return value
+
+        self.drop(key=key)
+        self.entries[key] = (self.clock if stamp is None else stamp, self.sectors(p0=p0, p1=p1), value, nbytes)
+        self.used += nbytes
+
+        while len(self.entries) > self.size or self.used > self.nbytes:
+            _, (_, _, _, n) = self.entries.popitem(last=False)
+            self.used -= n
+            self.evictions += 1
+        return value
+
+    def drop(self, key:Hashable=None) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.used -= entry[3]
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.used = 0
+
+    @staticmethod
+    def sizeof(value:Any=None) -> int:
+        if isinstance(value, np.ndarray):
+            return int(value.nbytes)
+        if isinstance(value, (tuple, list)):
+            return sys.getsizeof(value) + sum(Cache.sizeof(v) for v in value)
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(Cache.sizeof(k) + Cache.sizeof(v) for k, v in value.items())
+        return sys.getsizeof(value)
+
+    def stats(self) -> dict[str, int | float | str]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.used,
+            "size": self.size,
+            "nbytes": self.nbytes,
+            "policy": self.policy,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "ratio": (self.hits / lookups) if lookups > 0 else 0.0,
+        }
@@ -0,0 +1,57 @@
+# utils/hist.py
+from __future__ import annotations
+
+import math
+
+
+class Histogram:
+    """
+    Latency histogram over fixed power of 2 buckets (nanoseconds in, seconds out).
+
+    - bucket 0 -> below LO, bucket i -> [LO * 2**(i-1), LO * 2**i), the last one is open ended
+    - record(ns) is O(1) (one bit_length), no samples are kept
+    - percentile(q) -> upper edge of the bucket holding the q-th sample (at most 2x off)
+    - not thread safe: the owner serializes record()
+    """
+    LO = 1_000          # 1 us
+    BUCKETS = 32        # LO * 2**31 -> ~ 36 minutes
+
+    def __init__(self) -> None:
+        self.init()
+
+    def init(self) -> None:
+        self.counts: list[int] = [0] * Histogram.BUCKETS
+        self.count = 0
+        self.total = 0      # ns
+        self.max = 0        # ns
+
+    def record(self, ns:int=None) -> None:
+        i = min((ns // Histogram.LO).bit_length(), Histogram.BUCKETS - 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, q:float=None) -> float:
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Histogram.percentile(): q must be in [0, 1]")
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))     # at least the first sample
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(Histogram.LO * (1 << i), self.max) / 1e9
+        return self.max / 1e9
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "count": self.count,
+            "mean": (self.total / self.count / 1e9) if self.count > 0 else 0.0,
+            "max": self.max / 1e9,
+            "p50": self.percentile(q=0.50),
+            "p95": self.percentile(q=0.95),
+            "p99": self.percentile(q=0.99),
+        }
@@ -0,0 +1,73 @@
+# utils/indexes.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterator
+if TYPE_CHECKING:
+    from utils.types import NDARR, POS, Row
+
+from world.row import ROW
+
+BOX = tuple[int, int, int, int, int, int]      # (x0, y0, z0, x1, y1, z1)
+
+
+class Indexes:
+    """
+    Fused index maintenance: every registered index updated in ONE step per row change.
+
+    - register(name, index) -> any object with insert(row, box) / remove(row)
+    - insert(row, box=None) -> the row box is decoded ONCE (Indexes.box) and handed to every index
+    - remove(row) -> by identity (mid, rid), nothing to decode
+    - search(name, pos=... | r=..., axis=...) -> the named index (bvh: a point, mdx: a row + axis)
+    - a new index = one class with insert / remove + one register() call, no new Queue / Job kind
+    """
+
+    def __init__(self, **indexes: Any) -> None:
+        self.indexes: dict[str, Any] = {}
+        for name, index in indexes.items():
+            self.register(name=name, index=index)
+
+    def register(self, name:str=None, index:Any=None) -> Any:
+        if name in self.indexes:
+            raise ValueError(f"Indexes.register(): '{name}' is already registered")
+        if not callable(getattr(index, "insert", None)) or not callable(getattr(index, "remove", None)):
+            raise TypeError(f"Indexes.register(): '{name}' needs insert(row, box) and remove(row)")
+        self.indexes[name] = index
+        return index
+
+    def __getitem__(self, name:str) -> Any:
+        return self.indexes[name]
+
+    def __contains__(self, name:str) -> bool:
+        return name in self.indexes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.indexes)
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def names(self) -> list[str]:
+        return list(self.indexes)
+
+    @staticmethod
+    def box(row:NDARR=None) -> BOX:
+        x0, y0, z0 = ROW.P0(row=row)
+        x1, y1, z1 = ROW.P1(row=row)
+        return (int(x0), int(y0), int(z0), int(x1), int(y1), int(z1))
+
+    def insert(self, row:Row=None, box:BOX=None) -> None:
+        if box is None:
+            box = Indexes.box(row=row.row)
+        for index in self.indexes.values():
+            index.insert(row=row, box=box)
+
+    def remove(self, row:Row=None) -> None:
+        for index in self.indexes.values():
+            index.remove(row=row)
+
+    def search(self, name:str=None, pos:POS=None, r:Row=None, axis:int=None) -> Row | None:
+        index = self.indexes.get(name)
+        if index is None:
+            raise KeyError(f"Indexes.search(): no index '{name}'")
+        if pos is not None:
+            return index.search(pos=pos)
+        return index.search(r=r, axis=axis)
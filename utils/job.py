@@ -1,69 +1,124 @@
-from __future__ import annotations
-from typing import TYPE_CHECKING
-if TYPE_CHECKING:
-    from utils.types import Row
-    from utils.types import POS
-
-
-
-class Job: 
-    id = 0
-    def __init__(self, row:Row=None, axis:int=None, pos:POS=None, job:str=None, cls:str=None) -> None:
-        """
-        - JOBS=["insert", "remove", "search"]
-        - CLSS=["mdx", "bvh"]
-        - ARGS=DEPENDS ON JOB AND CLASS
-         
-        - 1. [bhv args = row] --- [mdx args = row] for insert
-        - 2. [bhv args = row] --- [mdx args = row] for remove
-        - 3. [bhv args = pos] --- [mdx args = row, axis] for search
-
-        """
-        self.row: Row = row
-        self.axis: int = axis
-        self.pos: POS = pos
-        self.job: str = job    # "insert","remove","search"
-        self.cls: str = cls      # "mdx","bvh"
-
-        self.init()
-
-    def init(self) -> None:
-        self.id: int = self.getid()
-        self.result: Row = None
-        self.ready: bool = False
-
-        self.validate()
-
-    def getid(self) -> int:
-        id: int = Job.id
-        Job.id += 1
-        return id
-
-    def validate(self) -> None:
-        # CHECK VALIDITY OF JOB AND CLASS
-        if self.job not in ("insert", "remove", "search"):
-            raise ValueError("Task.job must be 'insert','remove','search'")
-        if self.cls not in ("mdx","bvh"):
-            raise ValueError("Task.cls must be 'mdx','bvh'")
-        
-        # CHECK REQUIRED PARAMS FOR JOB AND CLASS -> WITHOUT THE RIGHT PARAMS THE JOB CANNOT BE DONE
-        if self.job in ("insert","remove") and self.row is None:        # insert/remove needs row
-            raise ValueError("Task.row is required for insert/remove jobs")
-        if self.job == "search":
-            if self.cls == "mdx" and (self.row is None or self.axis is None):   # mdx search needs row and axis
-                raise ValueError("Task.row and Task.axis are required for mdx search jobs")
-            if self.cls == "bvh" and self.pos is None:                          # bvh search needs pos
-                raise ValueError("Task.pos is required for bvh search jobs")
-        
-
-    def finish(self, row:Row=None) -> None:      # only needed for search tasks -> insert/remove dont return anything buit can be marked as done anyway
-        if self.result is None:
-            row = self.row   # for insert/remove tasks we can return the row that was inserted/removed as result (its relevant info and its the same type as search result)
-        self.result:Row = row 
-        self.ready = True   
-
-    def get(self) -> Row|None:  # return result if ready
-        if self.ready==True:
-            return self.result  # at this point result is a Row instence
-        return None             # not ready yet
-
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from typing import Callable
+    from utils.types import Row
+    from utils.types import POS
+
+import threading
+
+
+
+class Job: 
+    id = 0
+    def __init__(self, row:Row=None, axis:int=None, pos:POS=None, job:str=None, cls:str=None, forget:bool=False, box:tuple[int, ...]=None) -> None:
+        """
+        - JOBS=["insert", "remove", "search"]
+        - CLSS=["mdx", "bvh", "all"]   ("all" -> insert/remove on every index of the Queue, see utils.indexes)
+        - ARGS=DEPENDS ON JOB AND CLASS
+         
+        - 1. [bhv args = row] --- [mdx args = row] for insert   (+ box: the decoded row box, optional)
+        - 2. [bhv args = row] --- [mdx args = row] for remove
+        - 3. [bhv args = pos] --- [mdx args = row, axis] for search
+
+        - forget=True -> fire and forget: never registered by the Queue, nobody collects it
+        """
+        self.row: Row = row
+        self.axis: int = axis
+        self.pos: POS = pos
+        self.job: str = job    # "insert","remove","search"
+        self.cls: str = cls      # "mdx","bvh","all"
+        self.forget: bool = forget
+        self.box: tuple[int, ...] = box
+
+        self.init()
+
+    def init(self) -> None:
+        self.id: int = self.getid()
+        self.t0: int = 0        # perf_counter_ns at submit (Queue latency)
+        self.result: Row = None
+        self.ready: bool = False
+        self.lock = threading.Lock()    # future: held until finish() -> waiters block on it, no polling
+        self.lock.acquire()
+        self.guard = threading.Lock()   # protects the done callbacks vs finish()
+        self.callbacks: list[Callable[[Job], None]] | None = []
+
+        self.validate()
+
+    def reset(self, row:Row=None, axis:int=None, pos:POS=None, job:str=None, cls:str=None, forget:bool=False, box:tuple[int, ...]=None) -> Job:
+        # re-arm a FINISHED job for a new task (JobPool): new id, same locks
+        self.row = row
+        self.axis = axis
+        self.pos = pos
+        self.job = job
+        self.cls = cls
+        self.forget = forget
+        self.box = box
+
+        self.id = self.getid()
+        self.t0 = 0
+        self.result = None
+        self.callbacks = []
+        self.ready = False
+        self.lock.acquire()     # released by finish() -> free right away on a finished job
+
+        self.validate()
+        return self
+
+    def getid(self) -> int:
+        id: int = Job.id
+        Job.id += 1
+        return id
+
+    def validate(self) -> None:
+        # CHECK VALIDITY OF JOB AND CLASS
+        if self.job not in ("insert", "remove", "search"):
+            raise ValueError("Task.job must be 'insert','remove','search'")
+        if self.cls not in ("mdx","bvh","all"):
+            raise ValueError("Task.cls must be 'mdx','bvh','all'")
+        if self.cls == "all" and self.job == "search":
+            raise ValueError("Task.cls 'all' is for insert/remove jobs only")
+        
+        # CHECK REQUIRED PARAMS FOR JOB AND CLASS -> WITHOUT THE RIGHT PARAMS THE JOB CANNOT BE DONE
+        if self.job in ("insert","remove") and self.row is None:        # insert/remove needs row
+            raise ValueError("Task.row is required for insert/remove jobs")
+        if self.job == "search":
+            if self.cls == "mdx" and (self.row is None or self.axis is None):   # mdx search needs row and axis
+                raise ValueError("Task.row and Task.axis are required for mdx search jobs")
+            if self.cls == "bvh" and self.pos is None:                          # bvh search needs pos
+                raise ValueError("Task.pos is required for bvh search jobs")
+        
+
+    def finish(self, row:Row=None) -> None:      # only needed for search tasks -> insert/remove dont return anything buit can be marked as done anyway
+        if self.ready:
+            return
+        if self.job != "search":
+            row = self.row   # for insert/remove tasks we can return the row that was inserted/removed as result (its relevant info and its the same type as search result)
+        self.result:Row = row   # search -> the hit, or None for a miss (never the query row)
+        with self.guard:
+            self.ready = True   
+            callbacks, self.callbacks = self.callbacks, None
+        self.lock.release()     # wake every waiter
+        for fn in callbacks:
+            fn(self)
+
+    def then(self, fn:Callable[[Job], None]=None) -> None:     # fn(job) on finish (on the finishing thread), or now if allready done
+        with self.guard:
+            if self.callbacks is not None:
+                self.callbacks.append(fn)
+                return
+        fn(self)
+
+    def wait(self, timeout:float=None) -> bool:     # block until finished or timeout seconds -> True if finished
+        if self.ready:
+            return True
+        if not self.lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        self.lock.release()     # pass it on to the next waiter
+        return True
+
+    def get(self) -> Row|None:  # return result if ready
+        if self.ready==True:
+            return self.result  # at this point result is a Row instence
+        return None             # not ready yet
+
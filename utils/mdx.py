@@ -1,145 +1,293 @@
-# utils/mdx.py
-from __future__ import annotations
-from typing import TYPE_CHECKING, DefaultDict, Dict, Optional, Set, Tuple
-from collections import defaultdict
-from dataclasses import dataclass
-
-if TYPE_CHECKING:
-    from world.rows import ROWS
-
-from world.row import ROW
-from utils.types import NDARR, Row
-
-LOC = Tuple[int, int]  # (mid, rid)
-FACE = Tuple[int, int, int, int, int, int]
-BUCK = DefaultDict[FACE, Set[LOC]]  # face_key -> set of LOCs
-FACES = Tuple[FACE, FACE]           # (pos_face, neg_face) for search order
-BUCKS = Tuple[BUCK, BUCK]           # (neg_bucket, pos_bucket)
-
-
-@dataclass(slots=True)
-class Faces:
-    x0: FACE
-    x1: FACE
-    y0: FACE
-    y1: FACE
-    z0: FACE
-    z1: FACE
-
-    def faces_for_axis(self, ax: int) -> FACES:
-        if ax == 0:
-            return (self.x1, self.x0)
-        if ax == 1:
-            return (self.y1, self.y0)
-        if ax == 2:
-            return (self.z1, self.z0)
-        raise ValueError("axis must be 0,1,2")
-
-
-class MDX:
-    AX_X = 0
-    AX_Y = 1
-    AX_Z = 2
-    ALLAXIS = (AX_X, AX_Y, AX_Z)
-
-    def __init__(self, rows: "ROWS" = None) -> None:
-        self.rows = rows
-        self.init()
-
-    def init(self) -> None:
-        self.neg: Tuple[BUCK, BUCK, BUCK] = (defaultdict(set), defaultdict(set), defaultdict(set))
-        self.pos: Tuple[BUCK, BUCK, BUCK] = (defaultdict(set), defaultdict(set), defaultdict(set))
-        self._faces: Dict[LOC, Faces] = {}
-
-
-    def _build_faces(self, mid: int, row: NDARR) -> Faces:
-        x0, y0, z0 = ROW.P0(row=row)
-        x1, y1, z1 = ROW.P1(row=row)
-
-        fx0: FACE = (mid, y0, y1, z0, z1, x0)
-        fx1: FACE = (mid, y0, y1, z0, z1, x1)
-
-        fy0: FACE = (mid, x0, x1, z0, z1, y0)
-        fy1: FACE = (mid, x0, x1, z0, z1, y1)
-
-        fz0: FACE = (mid, x0, x1, y0, y1, z0)
-        fz1: FACE = (mid, x0, x1, y0, y1, z1)
-
-        return Faces(x0=fx0, x1=fx1, y0=fy0, y1=fy1, z0=fz0, z1=fz1)
-
-
-    def insert(self, row: Row=None) -> None:
-        mid, rid, row = int(row.mid), int(row.rid), row.row
-        loc: LOC = (mid, rid)
-
-        faces = self._build_faces(mid=mid, row=row)
-        self._faces[loc] = faces
-
-        self.neg[self.AX_X][faces.x0].add(loc)
-        self.pos[self.AX_X][faces.x1].add(loc)
-        self.neg[self.AX_Y][faces.y0].add(loc)
-        self.pos[self.AX_Y][faces.y1].add(loc)
-        self.neg[self.AX_Z][faces.z0].add(loc)
-        self.pos[self.AX_Z][faces.z1].add(loc)
-
-
-    def remove(self, row: Row=None) -> None:
-        mid, rid = int(row.mid), int(row.rid)
-        loc: LOC = (mid, rid)
-
-        faces = self._faces.pop(loc, None)
-        if faces is None:
-            return
-
-        self._discard(self.neg[self.AX_X], faces.x0, loc)
-        self._discard(self.pos[self.AX_X], faces.x1, loc)
-
-        self._discard(self.neg[self.AX_Y], faces.y0, loc)
-        self._discard(self.pos[self.AX_Y], faces.y1, loc)
-
-        self._discard(self.neg[self.AX_Z], faces.z0, loc)
-        self._discard(self.pos[self.AX_Z], faces.z1, loc)
-
-    @staticmethod
-    def _discard(m: BUCK, key: FACE, loc: LOC) -> None:
-        s = m.get(key)
-        if not s:
-            return
-        s.discard(loc)
-        if not s:
-            del m[key]
-
-
-    def search(self, r:Row, axis:int) -> Optional[Row]:
-        """
-        Find ONE merge-candidate neighbor (same material) touching on `axis`.
-
-        Returns:
-            Row(mid, rid, row_view) or None
-        """
-        if axis not in (0, 1, 2):
-            raise ValueError("axis must be 0,1,2")
-
-        mid, rid = int(r.mid), int(r.rid)
-        loc: LOC = (mid, rid)
-
-        faces = self._faces.get(loc)
-        if faces is None:
-            return None
-
-        face_pos, face_neg = faces.faces_for_axis(axis)
-        bucks: BUCKS = (self.neg[axis], self.pos[axis])
-
-        # Try +face then -face (or whatever order faces_for_axis returns)
-        for face_key, bucket in ((face_pos, bucks[0]), (face_neg, bucks[1])):
-            candidates = bucket.get(face_key)
-            if not candidates:
-                continue
-
-            # return the first other loc
-            for (pmid, prid) in candidates:
-                if (pmid, prid) != loc:
-                    row = self.rows.array[int(pmid)][int(prid)]
-                    return Row(mid=int(pmid), rid=int(prid), row=row)
-
-        return None
+# utils/mdx.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from world.rows import ROWS
+
+import numpy as np
+
+from world.row import ROW
+from world.materials import MATERIALS
+from utils.types import Row
+
+LOC = Tuple[int, int]                               # (mid, rid)
+BOX = Tuple[int, int, int, int, int, int]           # (x0, y0, z0, x1, y1, z1)
+KEY = Tuple[int, int]                               # packed face (A, B)
+
+
+class MDX:
+    """
+    Merge index: exact face -> row, per axis and side, in packed integer keys.
+
+    - a face = (mid, plane coord, two spans) packed into two uint64 words, 21 bits per field:
+        A = mid << 42 | plane << 21 | u0
+        B = u1  << 42 | v0    << 21 | v1
+    - tables[ax][side] is a NumPy open addressing hash table (linear probing, tombstones)
+        side 0 -> min faces (x0 / y0 / z0), side 1 -> max faces (x1 / y1 / z1)
+        slot = (64 bit hash of (A, B), packed loc) -> 16 bytes, the full key is re-derived
+        from the row box store to confirm a hash match
+    - same material rows never overlap -> every face key maps to exactly ONE row
+    - row boxes are copied per (mid, rid) on insert, so remove() never reads the (maybe reused) row slot
+    """
+    AX_X = 0
+    AX_Y = 1
+    AX_Z = 2
+    ALLAXIS = (AX_X, AX_Y, AX_Z)
+
+    BITS = 21                       # coords are in [0, 2**20] -> 21 bits
+    MASK = (1 << BITS) - 1
+    CAP = 1024                      # initial slots per table (power of 2)
+    LOAD = (5, 8)                   # rehash when used slots (live + tombs) exceed 5/8 of the table
+    ROWCAP = 1024                   # initial rows per material in the box store
+    UV = ((1, 2), (0, 2), (0, 1))   # the two span axes of a face on axis 0 / 1 / 2
+    EMPTY = -1
+    TOMB = -2
+    M64 = (1 << 64) - 1
+    K1 = 0x9E3779B97F4A7C15
+    K2 = 0xC2B2AE3D27D4EB4F
+
+    def __init__(self, rows: "ROWS" = None) -> None:
+        self.rows = rows
+        self.init()
+
+    def init(self) -> None:
+        # per (axis, side): key hashes, packed loc values (mid << 32 | rid), used slots (live + tombs), live slots
+        self.hsh = [[np.zeros(MDX.CAP, dtype=np.uint64) for _ in range(2)] for _ in MDX.ALLAXIS]
+        self.val = [[np.full(MDX.CAP, MDX.EMPTY, dtype=np.int64) for _ in range(2)] for _ in MDX.ALLAXIS]
+        self.fill = [[0, 0] for _ in MDX.ALLAXIS]
+        self.live = [[0, 0] for _ in MDX.ALLAXIS]
+
+        # per material row box store, indexed by rid
+        self.box = [np.zeros((MDX.ROWCAP, 6), dtype=np.int64) for _ in range(MATERIALS.NUM)]
+        self.on = [np.zeros(MDX.ROWCAP, dtype=bool) for _ in range(MATERIALS.NUM)]
+
+    # ============================================================
+    # keys
+    # ============================================================
+
+    @staticmethod
+    def key(mid:int, box:BOX, axis:int, side:int) -> KEY:
+        u, v = MDX.UV[axis]
+        plane = box[axis + 3*side]
+        A = (mid << 42) | (plane << 21) | box[u]
+        B = (box[u+3] << 42) | (box[v] << 21) | box[v+3]
+        return (A, B)
+
+    @staticmethod
+    def keys(mids:np.ndarray, boxes:np.ndarray, axis:int, side:int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized key(): mids (n,), boxes (n, 6) -> (A, B) uint64 arrays.
+        """
+        u, v = MDX.UV[axis]
+        b = boxes.astype(np.uint64)
+        m = mids.astype(np.uint64)
+        A = (m << np.uint64(42)) | (b[:, axis + 3*side] << np.uint64(21)) | b[:, u]
+        B = (b[:, u+3] << np.uint64(42)) | (b[:, v] << np.uint64(21)) | b[:, v+3]
+        return (A, B)
+
+    @staticmethod
+    def hash(A:int, B:int) -> int:
+        return ((A * MDX.K1) ^ (B * MDX.K2)) & MDX.M64
+
+    @staticmethod
+    def slot(h:int, cap:int) -> int:
+        return h >> (64 - (cap.bit_length() - 1))
+
+    def match(self, v:int, ax:int, side:int, A:int, B:int) -> bool:
+        # confirm a hash hit: re-derive the face key of the stored row
+        mid, rid = v >> 32, v & 0xFFFFFFFF
+        box = self._box(mid, rid)
+        return box is not None and MDX.key(mid, box, ax, side) == (A, B)
+
+    # ============================================================
+    # hash tables
+    # ============================================================
+
+    def put(self, ax:int, side:int, A:int, B:int, loc:int) -> None:
+        if (self.fill[ax][side] + 1) * MDX.LOAD[1] > len(self.val[ax][side]) * MDX.LOAD[0]:
+            self.rehash(ax=ax, side=side)
+
+        hsh, val = self.hsh[ax][side], self.val[ax][side]
+        cap = len(val)
+        h = MDX.hash(A, B)
+        i = MDX.slot(h, cap)
+        tomb = -1
+        while True:
+            v = val.item(i)
+            if v == MDX.EMPTY:
+                break
+            if v == MDX.TOMB:
+                if tomb < 0:
+                    tomb = i
+            elif hsh.item(i) == h and self.match(v, ax, side, A, B):
+                val[i] = loc            # same face re-registered -> latest owner wins
+                return
+            i = (i + 1) & (cap - 1)
+
+        if tomb >= 0:
+            i = tomb
+        else:
+            self.fill[ax][side] += 1
+        hsh[i] = h
+        val[i] = loc
+        self.live[ax][side] += 1
+
+    def pop(self, ax:int, side:int, A:int, B:int, loc:int) -> None:
+        # the owner is known -> match on (hash, loc), no key re-derivation needed
+        hsh, val = self.hsh[ax][side], self.val[ax][side]
+        cap = len(val)
+        h = MDX.hash(A, B)
+        i = MDX.slot(h, cap)
+        while True:
+            v = val.item(i)
+            if v == MDX.EMPTY:
+                return
+            if v == loc and hsh.item(i) == h:
+                val[i] = MDX.TOMB
+                self.live[ax][side] -= 1
+                return
+            i = (i + 1) & (cap - 1)
+
+    def get(self, ax:int, side:int, A:int, B:int) -> int:
+        hsh, val = self.hsh[ax][side], self.val[ax][side]
+        cap = len(val)
+        h = MDX.hash(A, B)
+        i = MDX.slot(h, cap)
+        while True:
+            v = val.item(i)
+            if v == MDX.EMPTY:
+                return -1
+            if v != MDX.TOMB and hsh.item(i) == h and self.match(v, ax, side, A, B):
+                return v
+            i = (i + 1) & (cap - 1)
+
+    def rehash(self, ax:int, side:int) -> None:
+        hsh, val = self.hsh[ax][side], self.val[ax][side]
+        keep = val >= 0
+        live = int(keep.sum())
+        cap = len(val)
+        while live * MDX.LOAD[1] * 2 > cap * MDX.LOAD[0]:      # at most half the max load after a rehash
+            cap *= 2
+
+        # live entries out first (copies) -> a rehash at the same size (tombstone cleanup)
+        # reuses the tables in place, only growing allocates
+        hs = hsh[keep]
+        vs = val[keep]
+        if cap == len(val):
+            hsh[:] = 0
+            val[:] = MDX.EMPTY
+        else:
+            self.hsh[ax][side] = np.zeros(cap, dtype=np.uint64)
+            self.val[ax][side] = np.full(cap, MDX.EMPTY, dtype=np.int64)
+        self.fill[ax][side] = live
+        self.live[ax][side] = live
+        if live == 0:
+            return
+
+        # vectorized re-insert: every round each unplaced entry claims its probe slot,
+        # one winner per free slot, losers move one slot further
+        pos = (hs >> np.uint64(64 - (cap.bit_length() - 1))).astype(np.int64)
+        free = np.ones(cap, dtype=bool)
+        left = np.arange(live)
+        while left.size:
+            want = pos[left]
+            ok = free[want]
+            cand = left[ok]
+            slots, first = np.unique(want[ok], return_index=True)
+            won = cand[first]
+            self.hsh[ax][side][slots] = hs[won]
+            self.val[ax][side][slots] = vs[won]
+            free[slots] = False
+            placed = np.zeros(live, dtype=bool)
+            placed[won] = True
+            left = left[~placed[left]]
+            pos[left] = (pos[left] + 1) & (cap - 1)
+
+    def nbytes(self) -> int:
+        total = sum(b.nbytes for b in self.box) + sum(o.nbytes for o in self.on)
+        for ax in MDX.ALLAXIS:
+            for side in (0, 1):
+                total += self.hsh[ax][side].nbytes + self.val[ax][side].nbytes
+        return total
+
+    # ============================================================
+    # rows
+    # ============================================================
+
+    def _box(self, mid:int, rid:int) -> Optional[BOX]:
+        on = self.on[mid]
+        if rid >= len(on) or not on.item(rid):
+            return None
+        return tuple(self.box[mid][rid].tolist())
+
+    def insert(self, row: Row=None, box: BOX=None) -> None:
+        mid, rid, row = int(row.mid), int(row.rid), row.row
+        if box is None:
+            x0, y0, z0 = ROW.P0(row=row)
+            x1, y1, z1 = ROW.P1(row=row)
+            box = (int(x0), int(y0), int(z0), int(x1), int(y1), int(z1))
+
+        if self._box(mid, rid) is not None:
+            self.remove(row=Row(mid=mid, rid=rid, row=row))
+        if rid >= len(self.on[mid]):
+            cap = len(self.on[mid])
+            while rid >= cap:
+                cap *= 2
+            grown = np.zeros((cap, 6), dtype=np.int64)
+            grown[:len(self.box[mid])] = self.box[mid]
+            on = np.zeros(cap, dtype=bool)
+            on[:len(self.on[mid])] = self.on[mid]
+            self.box[mid], self.on[mid] = grown, on
+
+        self.box[mid][rid] = box
+        self.on[mid][rid] = True
+
+        loc = (mid << 32) | rid
+        for ax in MDX.ALLAXIS:
+            for side in (0, 1):
+                A, B = MDX.key(mid, box, ax, side)
+                self.put(ax=ax, side=side, A=A, B=B, loc=loc)
+
+    def remove(self, row: Row=None) -> None:
+        mid, rid = int(row.mid), int(row.rid)
+        box = self._box(mid, rid)
+        if box is None:
+            return
+
+        self.on[mid][rid] = False
+        loc = (mid << 32) | rid
+        for ax in MDX.ALLAXIS:
+            for side in (0, 1):
+                A, B = MDX.key(mid, box, ax, side)
+                self.pop(ax=ax, side=side, A=A, B=B, loc=loc)
+
+    def search(self, r:Row, axis:int) -> Optional[Row]:
+        """
+        Find THE merge-candidate neighbor (same material, identical face) touching on `axis`.
+        The +face is tried first, then the -face.
+
+        Returns:
+            Row(mid, rid, row_view) or None
+        """
+        if axis not in (0, 1, 2):
+            raise ValueError("axis must be 0,1,2")
+
+        mid, rid = int(r.mid), int(r.rid)
+        box = self._box(mid, rid)
+        if box is None:
+            return None
+
+        # my max face == their min face, then my min face == their max face
+        for side in (1, 0):
+            A, B = MDX.key(mid, box, axis, side)
+            loc = self.get(ax=axis, side=1-side, A=A, B=B)
+            if loc < 0:
+                continue
+            pmid, prid = loc >> 32, loc & 0xFFFFFFFF
+            if (pmid, prid) == (mid, rid):
+                continue
+            row = self.rows.array[pmid][prid]
+            return Row(mid=pmid, rid=prid, row=row)
+
+        return None
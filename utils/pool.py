@@ -0,0 +1,73 @@
+# utils/pool.py
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from utils.types import Row
+    from utils.types import POS
+
+import threading
+
+from utils.job import Job
+
+
+class JobPool:
+    """
+    Free list of finished Jobs, recycled on the hot index paths (ROWS.job).
+
+    - get(...) -> a recycled Job (Job.reset, new id) or a new one when the list is empty
+    - put(job) -> a finished job goes back on the list, beyond `cap` free jobs it is dropped
+    - thread safe: the Queue workers put fire and forget jobs, the owner puts collected searches
+    - counters: created, reused, released, dropped
+    """
+    CAP = 1024
+
+    def __init__(self, cap:int=CAP) -> None:
+        if cap < 0:
+            raise ValueError("JobPool(): cap must be >= 0")
+        self.cap = cap
+        self.init()
+
+    def init(self) -> None:
+        self.free: list[Job] = []
+        self.lock = threading.Lock()
+
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+    def get(self, row:Row=None, axis:int=None, pos:POS=None, job:str=None, cls:str=None, forget:bool=False, box:tuple[int, ...]=None) -> Job:
+        with self.lock:
+            old = self.free.pop() if self.free else None
+            if old is None:
+                self.created += 1
+            else:
+                self.reused += 1
+        if old is None:
+            return Job(row=row, axis=axis, pos=pos, job=job, cls=cls, forget=forget, box=box)
+        return old.reset(row=row, axis=axis, pos=pos, job=job, cls=cls, forget=forget, box=box)
+
+    def put(self, job:Job=None) -> None:
+        # only finished jobs: a job still queued or running is never handed out twice
+        if job is None or not job.ready:
+            return
+        with self.lock:
+            if len(self.free) >= self.cap:
+                self.dropped += 1
+                return
+            job.row = job.pos = job.box = job.result = None     # do not keep rows alive from the free list
+            self.free.append(job)
+            self.released += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "free": len(self.free),
+            "cap": self.cap,
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "dropped": self.dropped,
+        }
@@ -1,140 +1,485 @@
-from __future__ import annotations
-from typing import TYPE_CHECKING
-
-
-if TYPE_CHECKING:
-    from utils.mdx import MDX
-    from utils.bvh import BVH
-    from utils.job import Job
-
-
-
-from queue import Empty, SimpleQueue
-import threading
-
-
-
-
-
-class Queue:
-    def __init__(self, cls:MDX|BVH=None) -> None:
-        self.cls: MDX|BVH = cls
-
-        self.init()
-        self.start()
-
-    def init(self) -> None:
-        self.results: dict[str, dict[int, Job]] = {"insert":{}, "remove":{}, "search":{}}
-        self.pending: dict[str, dict[int, Job]] = {"insert":{}, "remove":{}, "search":{}}
-        self.insertjobs, self.insertresp = SimpleQueue(), SimpleQueue()
-        self.removejobs, self.removeresp = SimpleQueue(), SimpleQueue()
-        self.searchjobs, self.searchresp = SimpleQueue(), SimpleQueue()
-
-        self.threadinsert = threading.Thread(target=self.runinsert, daemon=True)
-        self.threadremove = threading.Thread(target=self.runremove, daemon=True)
-        self.threadsearch = threading.Thread(target=self.runsearch, daemon=True)
-        self.threadresult = threading.Thread(target=self.runresult, daemon=True)
-
-    def start(self) -> None:    
-        self.running = True
-        self.threadinsert.start()
-        self.threadremove.start()
-        self.threadsearch.start()
-        self.threadresult.start()
-
-    def stop(self) -> None:    
-        self.running = False
-        self.threadinsert.join()
-        self.threadremove.join()
-        self.threadsearch.join()
-        self.threadresult.join()
-
-    def runinsert(self) -> None:
-         while self.running==True:
-            job: Job = self.insertjobs.get()
-            res: Job = self.cls.insert(job=job)
-            self.insertresp.put(res)
-
-    def runremove(self) -> None:
-         while self.running==True:
-            job: Job = self.removejobs.get()
-            res: Job = self.cls.remove(job=job)
-            self.removeresp.put(res)
-
-    def runsearch(self) -> None:
-         while self.running==True:
-            job: Job = self.searchjobs.get()
-            result:Job = self.cls.search(job=job)
-            self.searchresp.put(result)
-
-    def runresult(self) -> None:
-        def save(job:Job=None) -> None:
-            self.results[job.job][job.id] = job   
-
-        def tryit(fn:callable=None) -> Job | None:
-            try:
-                job: Job = fn()
-                save(job=job)       # fn() raises the Empty exception if no item was available within that time.
-            except Empty:
-                pass
-            except Exception as e:
-                print(f"[ERROR] Queue.runresult(): unexpected error:\n{e!r}")
-        
-        while self.running==True:
-            workload = self.workload()
-            if workload == 0:
-                wait = 0.001
-            else:
-                wait = 0.0
-            block = True if wait > 0.0 else False
-            tryit(fn=lambda call=self.insertresp.get, time=wait, block=block: call(timeout=time, block=block)) # raises the Empty exception if no item was available within that time.
-            tryit(fn=lambda call=self.removeresp.get, time=0.00, block=False: call(timeout=time, block=block)) # raises the Empty exception if no item was available within that time.
-            tryit(fn=lambda call=self.searchresp.get, time=0.00, block=False: call(timeout=time, block=block)) # raises the Empty exception if no item was available within that time.
-
-
-    def insert(self, job:Job=None) -> None:
-        self.insertjobs.put(job)
-
-    def remove(self, job:Job=None) -> None:
-        self.removejobs.put(job)
-
-    def search(self, job:Job=None) -> None:
-        self.searchjobs.put(job)
-
-    def job(self, job:Job=None) -> None:
-        # at this point the job is allready distributed to the right class in ROWS.job(job=job) -> send to either mdx or bvh queue
-        # so here i only need to send it to the right method in this queue
-        # NOTE the validation of the right params is done in Job.validate() so here its safe to just call the right method
-        if job.job in ("insert","remove","search")  :
-            self.pending[job.job][job.id] = job   # keep track of pending jobs
-        if job.job == "insert":
-            self.insert(job=job)
-        if job.job == "remove":
-            self.remove(job=job)
-        if job.job == "search":
-            self.search(job=job)
-        
-    def workload(self) -> int:
-        pending = sum(len(v) for v in self.pending.values())
-        results = sum(len(v) for v in self.results.values())
-        return pending - results
-
-    def get(self, task:str=None, id:int=None) -> Job|None:
-        if task not in ("insert","remove","search"):
-            raise ValueError("Queue.get(): task must be 'insert','remove' or 'search'")
-        if id is None:
-            raise ValueError("Queue.get(): id must be provided")
-        job: Job = self.results[task].pop(id, None)
-        if job is not None:
-            self.pending[task].pop(id, None)   # remove from pending as well
-        return job # return the whole job instence so the caller can check if its ready and get the result -> job can be None too!!!
-
-
-
-# self.bvh = Queue(cls=self.bvh)
-# self.mdx = Queue(cls=self.mdx)
-# usage:
-# self.job(job=job)  # job is an instence of Job -> distributes to the right queue
-# result = self.get(task="search", id=some_id)  # for search jobs only
-# result = self.get(task="insert", id=some_id)  # for insert jobs only
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from utils.indexes import Indexes
+    from utils.job import Job
+    from utils.pool import JobPool
+
+
+
+from queue import Empty, SimpleQueue
+import threading
+import json
+import time
+
+from world.row import ROW
+from utils.rwlock import RWLock
+from utils.hist import Histogram
+
+
+
+
+
+class Queue:
+    KEEP = 4096     # uncollected results kept per task, the oldest are reclaimed beyond that
+    CHUNK = 64      # backlog mutations applied per write section while idle (bounds a search's wait)
+    LINGER = 0.002  # seconds without new jobs before maintenance starts -> churn can cancel out first
+    BACKLOG = 256   # more pending mutations than this -> the oldest half is applied right away
+
+    def __init__(self, cls:Indexes=None, start:bool=True, workers:int=1, pool:JobPool=None, coalesce:bool=True) -> None:
+        """
+        cls         -> the Indexes behind this queue: ONE insert / remove job updates all of them
+                       (box decoded once), a search job names its index (job.cls "bvh" / "mdx")
+        start=False -> no worker thread, the owner calls run(job) / the indexes directly (sync mode)
+        workers     -> search threads; searches share the indexes (read lock), inserts / removes
+                       are applied in order by the dispatcher thread (write lock)
+
+        scheduling: inserts / removes are background maintenance, they wait in a backlog
+        (submit order) and are applied in CHUNKs once no new jobs arrived for LINGER seconds. A search
+        overtakes the backlog, except for the mutations that can change its answer
+        (read your writes) -> those are applied first, in order, with every earlier
+        mutation of the same (mid, rid), to the searched index ONLY:
+        - bvh search(pos)       -> mutations whose box contains pos
+        - mdx search(row, axis) -> same material mutations touching the row's box (faces included)
+        the other indexes keep them pending, a fused job finishes once every index is updated
+        pool        -> fire and forget jobs (job.forget) go back to this JobPool once run
+        coalesce    -> per index, an insert followed by a remove of the same (mid, rid) among
+                       the pending mutations cancels out, neither touches that index
+        """
+        if workers < 1:
+            raise ValueError("Queue(): workers must be >= 1")
+        self.cls: Indexes = cls
+        self.workers = workers
+        self.pool = pool
+        self.coalescing = coalesce
+
+        self.init()
+        if start:
+            self.start()
+
+    def init(self) -> None:
+        self.results: dict[str, dict[int, Job]] = {"insert":{}, "remove":{}, "search":{}}
+        self.pending: dict[str, dict[int, Job]] = {"insert":{}, "remove":{}, "search":{}}
+        # metrics: fire and forget jobs skip both registries -> counted here instead
+        # per lane: "insert" / "remove" + one search lane per index ("bvh", "mdx", ...)
+        # submitted on the owner thread, completed + latency (submit -> finish) by the workers
+        self.mlock = threading.Lock()
+        self.submitted: dict[str, int] = {}
+        self.completed: dict[str, int] = {}
+        self.latency: dict[str, Histogram] = {}
+        # per index + task: submit -> THAT index updated (its share of a fused insert / remove job)
+        self.maintenance: dict[str, dict[str, Histogram]] = {}
+        for lane in ("insert", "remove", *(self.cls.names() if self.cls is not None else ())):
+            self.addlane(lane=lane)
+        self.peak = 0       # most jobs in flight at once
+        self.reclaimed = 0
+        self.coalesced = 0  # index updates skipped (cancelled by coalesce())
+        # ONE fifo for all tasks -> a search always sees every insert/remove submitted before it
+        # items are single jobs or lists of jobs (one batch)
+        self.jobsq: SimpleQueue = SimpleQueue()
+        self.thread = threading.Thread(target=self.runjobs, daemon=True)
+        self.running = False
+        # search pool: fed by the dispatcher, so a search only starts after every earlier mutation
+        self.lock = RWLock()
+        self.searchq: SimpleQueue = SimpleQueue()
+        self.searchers = [threading.Thread(target=self.runsearch, daemon=True) for _ in range(self.workers)]
+        # ONE notification per drained batch -> waiters sleep instead of polling
+        self.done = threading.Condition()
+        self.batches = 0
+        # maintenance backlog (dispatcher thread only): [job, box, indexes still to update, (mid, rid)] in submit order
+        self.backlog: list[list] = []
+        self.overtakes = 0  # searches dispatched ahead of pending maintenance
+        self.forced = 0     # mutations applied early because a search depended on them
+
+    def start(self) -> None:    
+        self.running = True
+        self.thread.start()
+        for t in self.searchers:
+            t.start()
+
+    def stop(self) -> None:    
+        if not self.running:
+            return
+        self.running = False
+        self.jobsq.put(None)    # wake the workers
+        self.thread.join()
+        for t in self.searchers:
+            self.searchq.put(None)
+        for t in self.searchers:
+            t.join()
+
+    def run(self, job:Job=None) -> Job:
+        # execute one job on the calling thread
+        if job.job == "insert":
+            self.cls.insert(row=job.row, box=job.box)
+            job.finish()
+        elif job.job == "remove":
+            self.cls.remove(row=job.row)
+            job.finish()
+        else:
+            try:
+                if job.cls == "bvh":
+                    row = self.cls.search(name=job.cls, pos=job.pos)
+                else:
+                    row = self.cls.search(name=job.cls, r=job.row, axis=job.axis)
+            except LookupError:
+                row = None
+            job.finish(row=row)
+        return job
+
+    def drain(self, timeout:float=None) -> list[Job]:
+        # block (at most timeout seconds) for the first item, then take everything already queued -> one batch
+        batch: list[Job] = []
+        try:
+            item = self.jobsq.get(timeout=timeout)
+        except Empty:
+            return batch
+        while True:
+            if isinstance(item, list):
+                batch.extend(item)
+            elif item is not None:
+                batch.append(item)
+            try:
+                item = self.jobsq.get_nowait()
+            except Empty:
+                return batch
+
+    def runjobs(self) -> None:
+        while self.running==True:
+            batch = self.drain(timeout=Queue.LINGER if self.backlog else None)
+            # register first: a job woken by finish() can be collected with get() right away
+            for job in batch:
+                if not job.forget:
+                    self.keep(job=job)
+
+            # mutations -> backlog, searches -> the pool once what they depend on is applied
+            for job in batch:
+                if job.job != "search":
+                    box = job.box if job.box is not None else tuple(int(v) for v in ROW.P0(row=job.row.row) + ROW.P1(row=job.row.row))
+                    self.backlog.append([job, box, set(self.cls.names()), (int(job.row.mid), int(job.row.rid))])
+                    continue
+                deps = self.depends(job=job)
+                if deps:
+                    self.forced += len(deps)
+                    self.apply(entries=deps, name=job.cls)
+                    self.backlog = [e for e in self.backlog if e[2]]
+                if self.backlog:
+                    self.overtakes += 1
+                self.searchq.put(job)
+
+            # idle (nothing new) or too far behind -> maintenance
+            if not batch or len(self.backlog) > Queue.BACKLOG:
+                n = len(self.backlog) - Queue.BACKLOG // 2 if batch else Queue.CHUNK
+                entries = self.backlog[:n]
+                del self.backlog[:n]
+                self.apply(entries=entries)
+
+            with self.done:
+                if batch:
+                    self.batches += 1
+                self.done.notify_all()
+
+    def depends(self, job:Job=None) -> list[list]:
+        """
+        The backlog entries `job` (a search) must see on ITS index, in order:
+        every mutation that can change its answer + all earlier ones of the same identities.
+        """
+        if not self.backlog:
+            return []
+        name = job.cls
+        if name == "bvh":
+            x, y, z = (int(v) for v in job.pos)
+            hit = lambda b: b[0] <= x < b[3] and b[1] <= y < b[4] and b[2] <= z < b[5]
+        else:
+            mid = int(job.row.mid)
+            q = tuple(int(v) for v in ROW.P0(row=job.row.row) + ROW.P1(row=job.row.row))
+            hit = lambda b: b[0] <= q[3] and q[0] <= b[3] and b[1] <= q[4] and q[1] <= b[4] and b[2] <= q[5] and q[2] <= b[5]
+            own = (mid, int(job.row.rid))
+
+        keys: set[tuple[int,int]] = set()
+        for _, box, todo, key in self.backlog:
+            if name not in todo:
+                continue
+            if name == "bvh":
+                if hit(box):
+                    keys.add(key)
+            elif key == own or (key[0] == mid and hit(box)):
+                keys.add(key)
+        if not keys:
+            return []
+        return [e for e in self.backlog if e[3] in keys and name in e[2]]
+
+    def apply(self, entries:list[list]=None, name:str=None) -> None:
+        """
+        Backlog entries [job, box, indexes still to update, (mid, rid)] -> ONE write section.
+        name=None -> every pending index (maintenance), name -> only that index (a search needs it).
+        Per index the pending entries are coalesced first; a job finishes once all its indexes are done.
+        """
+        if not entries:
+            return
+        names = [name] if name is not None else self.cls.names()
+        cancel: dict[str, set[int]] = {}
+        for nm in names:
+            sub = [e for e in entries if nm in e[2]]
+            skip = Queue.coalesce(jobs=[e[0] for e in sub]) if self.coalescing else ()
+            cancel[nm] = {id(e) for e, cancelled in zip(sub, skip) if cancelled}
+
+        with self.lock.write():
+            # index by index: each index's share of the batch ends at one timestamp
+            for nm in names:
+                done: list[Job] = []
+                for e in entries:
+                    job, todo = e[0], e[2]
+                    if nm not in todo:
+                        continue
+                    todo.discard(nm)
+                    if id(e) in cancel[nm]:
+                        self.coalesced += 1
+                    else:
+                        self.runindex(job=job, name=nm)
+                    done.append(job)
+                self.maintained(name=nm, jobs=done)
+            for e in entries:
+                job, todo = e[0], e[2]
+                if not todo:
+                    # read before finish(): a finished job can be collected and reused at once
+                    lane, t0, forget = Queue.lane(job=job), job.t0, job.forget
+                    job.finish()
+                    self.record(lane=lane, t0=t0)
+                    if forget and self.pool is not None:
+                        self.pool.put(job=job)   # nobody waits on it -> recycle right away
+
+    def maintained(self, name:str=None, jobs:list[Job]=None) -> None:
+        # index `name` is up to date for these (still unfinished) jobs -> per index latency
+        if not jobs:
+            return
+        now = time.perf_counter_ns()
+        with self.mlock:
+            lanes = self.maintenance.setdefault(name, {"insert": Histogram(), "remove": Histogram()})
+            for job in jobs:
+                if job.t0:
+                    lanes[job.job].record(ns=now - job.t0)
+
+    def runindex(self, job:Job=None, name:str=None) -> None:
+        # one insert / remove on ONE index of the fused job
+        try:
+            if job.job == "insert":
+                self.cls[name].insert(row=job.row, box=job.box)
+            else:
+                self.cls[name].remove(row=job.row)
+        except Exception as e:
+            print(f"[ERROR] Queue: unexpected error in {name}.{job.job}:\n{e!r}")
+
+    def keep(self, job:Job=None) -> None:
+        results = self.results[job.job]
+        results[job.id] = job
+        while len(results) > Queue.KEEP:     # nobody collects these -> reclaim the oldest
+            id = next(iter(results))
+            results.pop(id)
+            self.pending[job.job].pop(id, None)
+            self.reclaimed += 1
+
+    def runsearch(self) -> None:
+        while self.running==True:
+            job: Job = self.searchq.get()
+            if job is None:
+                continue
+            forget = job.forget     # before finish(): a collected job may be reused right away
+            with self.lock.read():
+                self.runsafe(job=job)
+            if forget and self.pool is not None:
+                self.pool.put(job=job)
+            with self.done:
+                self.done.notify_all()
+
+    def runsafe(self, job:Job=None) -> None:
+        # the job is not ours after finish() (run() finishes it) -> metrics read up front
+        lane, t0, cls, task = Queue.lane(job=job), job.t0, job.cls, job.job
+        try:
+            self.run(job=job)
+        except Exception as e:
+            print(f"[ERROR] Queue: unexpected error in {cls}.{task}:\n{e!r}")
+            job.finish()
+        self.record(lane=lane, t0=t0)
+
+    def record(self, lane:str=None, t0:int=None) -> None:
+        # lane + submit stamp of a job, read BEFORE it finished
+        if t0:
+            ns = time.perf_counter_ns() - t0
+            with self.mlock:
+                self.completed[lane] += 1
+                self.latency[lane].record(ns=ns)
+
+    @staticmethod
+    def coalesce(jobs:list[Job]=None) -> list[bool]:
+        """
+        Net effect of a run of inserts / removes (no search in between) per (mid, rid)
+        -> skip flags. An insert followed by a remove of the same identity cancels out,
+        so what survives per identity is at most [remove] [insert], in the original order:
+        a chain of relabels (remove, insert, remove, insert, ...) collapses to its ends.
+        Identities are independent in every index, so the survivors keep their order.
+        """
+        skip = [False] * len(jobs)
+        last: dict[tuple[int,int], int] = {}    # (mid, rid) -> position of its live insert
+        for i, job in enumerate(jobs):
+            key = (int(job.row.mid), int(job.row.rid))
+            if job.job == "insert":
+                last[key] = i
+                continue
+            k = last.pop(key, None)
+            if k is not None:
+                skip[k] = skip[i] = True
+        return skip
+
+    def wait(self, job:Job=None, timeout:float=None) -> bool:
+        """
+        Block until the batch holding `job` was run (or timeout seconds) -> True if it was.
+        Single job waiters can use job.wait(timeout) instead.
+        """
+        with self.done:
+            return self.done.wait_for(lambda: job.ready, timeout=timeout)
+
+    def settle(self, timeout:float=None) -> bool:
+        """
+        Block until every submitted job was run (or timeout seconds) -> True if idle.
+        """
+        with self.done:
+            return self.done.wait_for(lambda: self.inflight() == 0, timeout=timeout)
+
+    # ============================================================
+    # metrics
+    # ============================================================
+
+    @staticmethod
+    def lane(job:Job=None) -> str:
+        return job.cls if job.job == "search" else job.job
+
+    def addlane(self, lane:str=None) -> None:
+        with self.mlock:
+            self.submitted.setdefault(lane, 0)
+            self.completed.setdefault(lane, 0)
+            self.latency.setdefault(lane, Histogram())
+
+    def submit(self, jobs:list[Job]=None) -> None:
+        # stamp + count on the owner thread, right before the queue handoff
+        now = time.perf_counter_ns()
+        for job in jobs:
+            job.t0 = now
+            lane = Queue.lane(job=job)
+            if lane not in self.submitted:
+                self.addlane(lane=lane)
+            self.submitted[lane] += 1
+            if not job.forget:
+                self.pending[job.job][job.id] = job   # keep track of pending jobs
+        self.peak = max(self.peak, self.inflight())
+
+    def inflight(self, lane:str=None) -> int:
+        lanes = list(self.submitted) if lane is None else (lane,)
+        return sum(self.submitted[l] - self.completed[l] for l in lanes)
+
+    def stats(self) -> dict:
+        """
+        Counters per lane (submitted / completed / in flight), depth gauges and
+        submit -> finish latency (seconds: mean, max, p50, p95, p99) per lane.
+        Lanes: "insert" / "remove" (every index at once) + one search lane per index.
+        maintenance: submit -> index updated latency per index and task ("bvh" / "mdx" / ...
+        x "insert" / "remove"), the share of each index in the fused jobs.
+        """
+        with self.mlock:
+            maintenance = {nm: {task: h.stats() for task, h in lanes.items()} for nm, lanes in self.maintenance.items()}
+            lanes = {
+                l: {
+                    "submitted": self.submitted[l],
+                    "completed": self.completed[l],
+                    "inflight": self.submitted[l] - self.completed[l],
+                    "latency": self.latency[l].stats(),
+                }
+                for l in self.submitted
+            }
+        return {
+            "indexes": self.cls.names() if self.cls is not None else [],
+            "workers": self.workers,
+            "running": self.running,
+            "lanes": lanes,
+            "maintenance": maintenance,
+            "depth": {
+                "inflight": sum(l["inflight"] for l in lanes.values()),
+                "peak": self.peak,
+                "queued": self.jobsq.qsize(),       # handoffs (single jobs or batches) not drained yet
+                "searches": self.searchq.qsize(),   # searches waiting for a search thread
+                "pending": sum(len(v) for v in self.pending.values()),
+                "results": sum(len(v) for v in self.results.values()),
+            },
+            "batches": self.batches,
+            "reclaimed": self.reclaimed,
+            "coalesced": self.coalesced,
+            "backlog": len(self.backlog),
+            "overtakes": self.overtakes,
+            "forced": self.forced,
+        }
+
+    def dump(self, path:str=None) -> str:
+        # stats() as JSON, also written to `path` when given
+        text = json.dumps(self.stats(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def insert(self, job:Job=None) -> None:
+        self.jobsq.put(job)
+
+    def remove(self, job:Job=None) -> None:
+        self.jobsq.put(job)
+
+    def search(self, job:Job=None) -> None:
+        self.jobsq.put(job)
+
+    def jobs(self, jobs:list[Job]=None) -> None:
+        # batch submit: ONE queue handoff for the whole list, run in list order
+        if not jobs:
+            return
+        self.submit(jobs=jobs)
+        self.jobsq.put(list(jobs))
+
+    def job(self, job:Job=None) -> None:
+        # at this point the job is allready distributed to the right class in ROWS.job(job=job) -> send to either mdx or bvh queue
+        # so here i only need to send it to the right method in this queue
+        # NOTE the validation of the right params is done in Job.validate() so here its safe to just call the right method
+        if job.job in ("insert","remove","search")  :
+            self.submit(jobs=[job])
+        if job.job == "insert":
+            self.insert(job=job)
+        if job.job == "remove":
+            self.remove(job=job)
+        if job.job == "search":
+            self.search(job=job)
+        
+    def workload(self) -> int:
+        pending = sum(len(v) for v in self.pending.values())
+        results = sum(len(v) for v in self.results.values())
+        return pending - results
+
+    def get(self, task:str=None, id:int=None) -> Job|None:
+        if task not in ("insert","remove","search"):
+            raise ValueError("Queue.get(): task must be 'insert','remove' or 'search'")
+        if id is None:
+            raise ValueError("Queue.get(): id must be provided")
+        job: Job = self.results[task].get(id)
+        if job is None or not job.ready:
+            return None                         # not run yet (registered results can still be running)
+        self.results[task].pop(id, None)
+        self.pending[task].pop(id, None)   # remove from pending as well
+        return job # return the whole job instence so the caller can check if its ready and get the result -> job can be None too!!!
+
+
+
+# self.bvh = Queue(cls=self.bvh)
+# self.mdx = Queue(cls=self.mdx)
+# usage:
+# self.job(job=job)  # job is an instence of Job -> distributes to the right queue
+# result = self.get(task="search", id=some_id)  # for search jobs only
+# result = self.get(task="insert", id=some_id)  # for insert jobs only
 # result = self.get(task="remove", id=some_id)  # for remove jobs only
\ No newline at end of file
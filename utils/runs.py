@@ -0,0 +1,221 @@
+# utils/runs.py
+from __future__ import annotations
+from typing import Callable
+import heapq
+
+import numpy as np
+
+from utils.mdx import MDX
+
+BOX = tuple[int, int, int, int, int, int]      # (x0, y0, z0, x1, y1, z1)
+KEY = tuple[int, int]                          # MDX face key (A, B)
+RUN = tuple[int, BOX]                          # (axis, head box)
+
+
+class Runs:
+    """
+    Merge runs of ONE material, kept up to date while they are applied (ROWS.mergebest).
+
+    - faces[ax][side][key] -> box: the exact face table (MDX keys), built once (vectorized keys),
+      keys[box] -> its 6 face keys, (ax, side) at 2 * ax + side, so a removal never derives them again
+    - runs[(ax, head)] -> (merged box, member boxes, score, version): the maximal chains of
+      exact face pairs per axis (every box is in at most one run per axis)
+    - facing[(ax, side, key)] -> runs whose merged box looks for a partner at that face
+    - heap of (score, axis, head) -> pop() hands out the best live run, stale entries are skipped
+    - update(removed, created): only the chains through the changed boxes (and the survivors
+      of broken runs) are walked again, only runs facing a changed face are scored again
+      -> cost ~ the merges done, not (rounds x rows) as a rebuild per round
+    - boxes, not rids: a remove swaps rids around, boxes stay put (rid[box] kept by the caller)
+    """
+
+    def __init__(self, mid: int = None, boxes: np.ndarray = None, runs: list[list[list[int]]] = None,
+                 score: Callable = None) -> None:
+        """
+        boxes (n, 6) of the material in rid order, runs[ax] -> member rids of each maximal run
+        (ROWS.runs), score(p0, p1, n, partners) -> comparable tuple, higher is better.
+        """
+        self.mid = mid
+        self.score = score
+        self.faces: list[list[dict[KEY, BOX]]] = [[{}, {}] for _ in range(3)]
+        self.keys: dict[BOX, tuple[KEY, ...]] = {}
+        self.runs: dict[RUN, tuple[BOX, list[BOX], tuple, int, list]] = {}
+        self.member: list[dict[BOX, RUN]] = [{}, {}, {}]
+        self.facing: dict[tuple[int, int, KEY], set[RUN]] = {}
+        self.heap: list[tuple] = []
+        self.popped: dict[RUN, int] = {}
+        self.version = 0
+
+        listed = [tuple(b) for b in boxes.tolist()]
+        self.rid: dict[BOX, int] = {box: rid for rid, box in enumerate(listed)}
+        mids = np.full(len(listed), mid, dtype=np.int64)
+        cols = []
+        for ax in (0, 1, 2):
+            for side in (0, 1):
+                A, B = MDX.keys(mids, boxes, ax, side)
+                col = list(zip(A.tolist(), B.tolist()))
+                self.faces[ax][side].update(zip(col, listed))
+                cols.append(col)
+        self.keys.update(zip(listed, zip(*cols)))
+        for ax in (0, 1, 2):
+            for members in runs[ax]:
+                self.make(ax=ax, members=[listed[rid] for rid in members])
+
+    def __len__(self) -> int:
+        return len(self.runs)
+
+    def key(self, box: BOX, ax: int, side: int) -> KEY:
+        return MDX.key(self.mid, box, ax, side)
+
+    # ============================================================
+    # face table
+    # ============================================================
+
+    def add(self, box: BOX = None) -> list[tuple[int, int, KEY]]:
+        keys = self.keys[box] = tuple(self.key(box, ax, side) for ax in (0, 1, 2) for side in (0, 1))
+        for i, k in enumerate(keys):
+            self.faces[i >> 1][i & 1][k] = box
+        return [(i >> 1, i & 1, k) for i, k in enumerate(keys)]
+
+    def drop(self, box: BOX = None) -> list[tuple[int, int, KEY]]:
+        keys = self.keys.pop(box)
+        for i, k in enumerate(keys):
+            self.faces[i >> 1][i & 1].pop(k, None)
+        return [(i >> 1, i & 1, k) for i, k in enumerate(keys)]
+
+    # ============================================================
+    # runs
+    # ============================================================
+
+    def chain(self, ax: int = None, box: BOX = None) -> list[BOX]:
+        # back to the head (max face meets my min face), then forward to the tail
+        lo, hi = 2 * ax, 2 * ax + 1
+        head = box
+        while (prev := self.faces[ax][1].get(self.keys[head][lo])) is not None:
+            head = prev
+        members = [head]
+        while (nxt := self.faces[ax][0].get(self.keys[members[-1]][hi])) is not None:
+            members.append(nxt)
+        return members
+
+    def walk(self, ax: int = None, box: BOX = None) -> None:
+        """
+        (Re)build the run through `box` on `ax`: runs it overlaps are replaced.
+        """
+        members = self.chain(ax=ax, box=box)
+        old = self.runs.get((ax, members[0]))
+        if old is not None and old[1] == members:
+            return
+        for m in members:
+            if m in self.member[ax]:
+                self.forget(run=self.member[ax][m])
+        if len(members) >= 2:
+            self.make(ax=ax, members=members)
+
+    def make(self, ax: int = None, members: list[BOX] = None) -> None:
+        run: RUN = (ax, members[0])
+        head, tail = members[0], members[-1]
+        p1 = list(head[3:])
+        p1[ax] = tail[3 + ax]
+        merged: BOX = (*head[:3], *p1)
+        # faces of the merged box look for partners on the opposite side
+        looks = [(a, 1 - side, self.key(merged, a, side)) for a in (0, 1, 2) for side in (0, 1)]
+        for m in members:
+            self.member[ax][m] = run
+        for f in looks:
+            self.facing.setdefault(f, set()).add(run)
+        self.runs[run] = (merged, members, (), 0, looks)
+        self.rescore(run=run)
+
+    def forget(self, run: RUN = None) -> None:
+        entry = self.runs.pop(run, None)
+        if entry is None:
+            return
+        _, members, _, _, looks = entry
+        for m in members:
+            if self.member[run[0]].get(m) == run:
+                del self.member[run[0]][m]
+        for f in looks:
+            runs = self.facing.get(f)
+            if runs is not None:
+                runs.discard(run)
+                if not runs:
+                    del self.facing[f]
+
+    def rescore(self, run: RUN = None) -> None:
+        # partners: faces of the merged box that meet another row of ours face to face
+        merged, members, _, _, looks = self.runs[run]
+        found = 0
+        for a, side, k in looks:
+            other = self.faces[a][side].get(k)
+            if other is not None and other not in members:
+                found += 1
+        score = self.score(p0=merged[:3], p1=merged[3:], n=len(members), partners=found)
+        self.version += 1
+        self.runs[run] = (merged, members, score, self.version, looks)
+        heapq.heappush(self.heap, (tuple(-v for v in score), run[0], run[1], self.version))
+
+    # ============================================================
+    # apply
+    # ============================================================
+
+    def pop(self) -> RUN | None:
+        """
+        Best live run (ties on (axis, head box)) -> its id, see get(); None when done.
+        """
+        while self.heap:
+            _, ax, head, version = heapq.heappop(self.heap)
+            entry = self.runs.get((ax, head))
+            if entry is not None and entry[3] == version:
+                self.popped[(ax, head)] = version
+                return (ax, head)
+        return None
+
+    def get(self, run: RUN = None) -> tuple[BOX, list[BOX]]:
+        # -> (merged box, member boxes)
+        entry = self.runs[run]
+        return (entry[0], entry[1])
+
+    def requeue(self, run: RUN = None) -> None:
+        # a popped run that was not applied goes back on the heap (if live and not scored again since)
+        entry = self.runs.get(run)
+        if entry is not None and self.popped.pop(run, None) == entry[3]:
+            heapq.heappush(self.heap, (tuple(-v for v in entry[2]), run[0], run[1], entry[3]))
+
+    def touched(self, run: RUN = None) -> set[KEY]:
+        """
+        Every face key the run depends on: its members' faces (chain, removal) and the faces
+        its merged box looks at (score). A run touching none of the keys another pending merge
+        changes still has its exact chain and score -> it can be applied in the same batch.
+        """
+        merged, members, _, _, looks = self.runs[run]
+        keys = {k for _, _, k in looks}
+        for m in members:
+            keys.update(self.keys[m])
+        return keys
+
+    def update(self, removed: list[BOX] = None, created: list[BOX] = None) -> None:
+        """
+        Boxes a merge removed / created -> face table, broken runs, new chains, scores.
+        """
+        changed: list[tuple[int, int, KEY]] = []
+        touched: set[BOX] = set()
+        for box in removed:
+            self.rid.pop(box, None)
+            changed += self.drop(box=box)
+            for ax in (0, 1, 2):
+                run = self.member[ax].get(box)
+                if run is not None:
+                    touched.update(self.runs[run][1])
+                    self.forget(run=run)
+        for box in created:
+            changed += self.add(box=box)
+            touched.add(box)
+        touched.difference_update(removed)
+
+        for box in sorted(touched):
+            for ax in (0, 1, 2):
+                self.walk(ax=ax, box=box)
+        for f in changed:
+            for run in sorted(self.facing.get(f, ())):
+                if run in self.runs:
+                    self.rescore(run=run)
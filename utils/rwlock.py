@@ -0,0 +1,53 @@
+# utils/rwlock.py
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Iterator
+
+import threading
+
+
+class RWLock:
+    """
+    Reader writer lock: many readers at once OR one writer.
+
+    - with lock.read():  ... shared, for index searches
+    - with lock.write(): ... exclusive, for index inserts / removes
+    - writer preferring: a waiting writer blocks NEW readers -> a steady stream of
+      searches can not starve the mutations
+    - not reentrant
+    """
+
+    def __init__(self) -> None:
+        self.cond = threading.Condition(threading.Lock())
+        self.readers = 0
+        self.writer = False
+        self.waiting = 0    # writers waiting for the readers to leave
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self.cond:
+            while self.writer or self.waiting:
+                self.cond.wait()
+            self.readers += 1
+        try:
+            yield
+        finally:
+            with self.cond:
+                self.readers -= 1
+                if self.readers == 0:
+                    self.cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self.cond:
+            self.waiting += 1
+            while self.writer or self.readers:
+                self.cond.wait()
+            self.waiting -= 1
+            self.writer = True
+        try:
+            yield
+        finally:
+            with self.cond:
+                self.writer = False
+                self.cond.notify_all()
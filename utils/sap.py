@@ -0,0 +1,137 @@
+# utils/sap.py
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from world.rows import ROWS
+
+import bisect
+
+from world.row import ROW
+from utils.types import POS, Row
+
+LOC = tuple[int, int]                          # (mid, rid)
+BOX = tuple[int, int, int, int, int, int]      # (x0, y0, z0, x1, y1, z1)
+END = tuple[int, int, int]                     # (coord, mid, rid) -> sorts by coord, ties by identity
+
+
+class SAP:
+    """
+    Sweep and prune: per axis sorted endpoint index over row min/max coordinates.
+
+    - lo[ax] -> sorted (min coord, mid, rid) of every row
+    - hi[ax] -> sorted (max coord, mid, rid) of every row
+    - slab(ax, a, b) -> all rows overlapping [a, b) on ax with two binary searches,
+      then only the smaller side of the cut is walked
+    - pairs(ax) -> overlapping row pairs by sweeping the endpoints of one axis
+    - boxes are copied on insert, so remove() never reads the (maybe reused) row slot
+    """
+
+    def __init__(self, rows: "ROWS" = None) -> None:
+        self.rows = rows
+        self.init()
+
+    def init(self) -> None:
+        self.lo: tuple[list[END], list[END], list[END]] = ([], [], [])
+        self.hi: tuple[list[END], list[END], list[END]] = ([], [], [])
+        self.box: dict[LOC, BOX] = {}
+
+    def __len__(self) -> int:
+        return len(self.box)
+
+    def insert(self, row:Row=None, box:BOX=None) -> None:
+        mid, rid = int(row.mid), int(row.rid)
+        if box is None:
+            x0, y0, z0 = ROW.P0(row=row.row)
+            x1, y1, z1 = ROW.P1(row=row.row)
+            box = (int(x0), int(y0), int(z0), int(x1), int(y1), int(z1))
+
+        if (mid, rid) in self.box:
+            self.remove(row=row)
+        self.box[(mid, rid)] = box
+
+        for ax in (0, 1, 2):
+            bisect.insort(self.lo[ax], (box[ax], mid, rid))
+            bisect.insort(self.hi[ax], (box[ax+3], mid, rid))
+
+    def remove(self, row:Row=None) -> None:
+        mid, rid = int(row.mid), int(row.rid)
+        box = self.box.pop((mid, rid), None)
+        if box is None:
+            return
+
+        for ax in (0, 1, 2):
+            self._discard(self.lo[ax], (box[ax], mid, rid))
+            self._discard(self.hi[ax], (box[ax+3], mid, rid))
+
+    @staticmethod
+    def _discard(ends: list[END], end: END) -> None:
+        i = bisect.bisect_left(ends, end)
+        if i < len(ends) and ends[i] == end:
+            del ends[i]
+
+    # ============================================================
+    # queries
+    # ============================================================
+
+    def slab(self, axis:int=None, a:int=None, b:int=None) -> list[LOC]:
+        """
+        All rows overlapping [a, b) on `axis` (half open, like the rows themselves).
+        """
+        if axis not in (0, 1, 2):
+            raise ValueError("axis must be 0,1,2")
+        if a is None or b is None or a >= b:
+            return []
+
+        lo, hi = self.lo[axis], self.hi[axis]
+        nlo = bisect.bisect_left(lo, (b,))         # lo[:nlo]  -> min < b
+        nhi = bisect.bisect_left(hi, (a+1,))       # hi[nhi:]  -> max > a
+
+        # walk the smaller side, filter with the other condition
+        if nlo <= len(hi) - nhi:
+            return [(mid, rid) for _, mid, rid in lo[:nlo] if self.box[(mid, rid)][axis+3] > a]
+        return [(mid, rid) for _, mid, rid in hi[nhi:] if self.box[(mid, rid)][axis] < b]
+
+    def query(self, p0:POS=None, p1:POS=None) -> list[LOC]:
+        """
+        All rows intersecting the box [p0, p1): slab on the thinnest axis, prune with the others.
+        """
+        p0, p1 = ROW.SORT(p0=p0, p1=p1)
+        p0 = tuple(int(v) for v in p0)
+        p1 = tuple(int(v) for v in p1)
+        ax = min((0, 1, 2), key=lambda i: p1[i] - p0[i])
+
+        out: list[LOC] = []
+        for loc in self.slab(axis=ax, a=p0[ax], b=p1[ax]):
+            box = self.box[loc]
+            if all(box[i] < p1[i] and p0[i] < box[i+3] for i in (0, 1, 2)):
+                out.append(loc)
+        return out
+
+    def pairs(self, axis:int=0) -> list[tuple[LOC, LOC]]:
+        """
+        All pairs of rows whose boxes overlap (positive volume) -> empty for a valid world.
+        Sweep the endpoints of `axis`: ends before starts on equal coords (half open boxes).
+        """
+        if axis not in (0, 1, 2):
+            raise ValueError("axis must be 0,1,2")
+
+        lo, hi = self.lo[axis], self.hi[axis]
+        others = [i for i in (0, 1, 2) if i != axis]
+        active: set[LOC] = set()
+        out: list[tuple[LOC, LOC]] = []
+
+        j = 0
+        for coord, mid, rid in lo:
+            while j < len(hi) and hi[j][0] <= coord:
+                active.discard((hi[j][1], hi[j][2]))
+                j += 1
+
+            loc = (mid, rid)
+            box = self.box[loc]
+            for other in active:
+                obox = self.box[other]
+                if all(box[i] < obox[i+3] and obox[i] < box[i+3] for i in others):
+                    out.append((other, loc))
+            active.add(loc)
+        return out
@@ -0,0 +1,311 @@
+# utils/wbvh.py
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from world.rows import ROWS
+
+import numpy as np
+
+from world.row import ROW
+from utils.types import POS, Row
+
+LOC = tuple[int, int]   # (mid, rid)
+
+
+class WBVH:
+    """
+    Wide BVH (drop-in for utils.bvh.BVH: insert(row) / remove(row) / search(pos) / query(p0, p1))
+
+    - inner nodes hold up to WIDTH child boxes in one small contiguous (slots, 6) array
+    - leaves hold a bucket of up to LEAF rows in the same layout
+    - every traversal step tests all boxes of a node with ONE vectorized comparison
+    - box layout per slot: (x0, y0, z0, -x1, -y1, -z1), half open [p0, p1)
+      -> negated maxima: containment is ONE `<=` against (x, y, z, -x-1, -y-1, -z-1)
+      -> and the union of boxes is ONE column wise min
+    - slot meaning: inner -> kid = child node | leaf -> kid = mid, aux = rid
+    """
+    WIDTH = 8
+    LEAF = 8
+
+    __slots__ = (
+        "rows",
+        "root",
+        "width","leaf",
+        "box","kid","aux",
+        "cnt","isleaf","parent","pslot",
+        "free",
+        "where",
+    )
+
+    def __init__(self, rows: "ROWS" = None, width:int=WIDTH, leaf:int=LEAF) -> None:
+        if width < 2 or leaf < 2:
+            raise ValueError("WBVH width and leaf must be >= 2")
+        self.rows = rows
+        self.root = -1
+
+        self.width = width
+        self.leaf = leaf
+
+        slots = max(width, leaf) + 1    # +1 -> room for the overflow entry before a split
+        self.box = np.zeros((0, slots, 6), dtype=np.int64)
+        self.kid = np.full((0, slots), -1, dtype=np.int64)
+        self.aux = np.full((0, slots), -1, dtype=np.int64)
+
+        self.cnt: list[int] = []
+        self.isleaf: list[bool] = []
+        self.parent: list[int] = []
+        self.pslot: list[int] = []
+        self.free: list[int] = []
+
+        self.where: dict[LOC, tuple[int,int]] = {}   # (mid,rid) -> (leaf, slot)
+
+    # ============================================================
+    # node helpers
+    # ============================================================
+
+    def grow(self) -> None:
+        cap = len(self.cnt)
+        new = max(16, cap * 2)
+        slots = self.box.shape[1]
+
+        box = np.zeros((new, slots, 6), dtype=np.int64)
+        kid = np.full((new, slots), -1, dtype=np.int64)
+        aux = np.full((new, slots), -1, dtype=np.int64)
+        box[:cap] = self.box
+        kid[:cap] = self.kid
+        aux[:cap] = self.aux
+        self.box, self.kid, self.aux = box, kid, aux
+
+        self.cnt.extend([0] * (new - cap))
+        self.isleaf.extend([False] * (new - cap))
+        self.parent.extend([-1] * (new - cap))
+        self.pslot.extend([-1] * (new - cap))
+        self.free.extend(range(new - 1, cap - 1, -1))   # pop() hands out low ids first
+
+    def newnode(self, leaf:bool=False) -> int:
+        if not self.free:
+            self.grow()
+        n = self.free.pop()
+        self.cnt[n] = 0
+        self.isleaf[n] = leaf
+        self.parent[n] = -1
+        self.pslot[n] = -1
+        return n
+
+    def release(self, n:int) -> None:
+        self.cnt[n] = 0
+        self.parent[n] = -1
+        self.pslot[n] = -1
+        self.free.append(n)
+
+    def bounds(self, n:int) -> np.ndarray:
+        return self.box[n, :self.cnt[n]].min(axis=0)
+
+    def attach(self, p:int, n:int) -> None:
+        s = self.cnt[p]
+        self.box[p, s] = self.bounds(n)
+        self.kid[p, s] = n
+        self.parent[n] = p
+        self.pslot[n] = s
+        self.cnt[p] = s + 1
+
+    def setslot(self, n:int, dst:int, src:int) -> None:
+        # copy slot src -> dst inside node n and keep the back references valid
+        self.box[n, dst] = self.box[n, src]
+        self.kid[n, dst] = self.kid[n, src]
+        self.aux[n, dst] = self.aux[n, src]
+        if self.isleaf[n]:
+            self.where[(int(self.kid[n, dst]), int(self.aux[n, dst]))] = (n, dst)
+        else:
+            self.pslot[int(self.kid[n, dst])] = dst
+
+    def depth(self) -> int:
+        if self.root == -1:
+            return 0
+        d, n = 1, self.root
+        while not self.isleaf[n]:
+            n = int(self.kid[n, 0])
+            d += 1
+        return d
+
+    # ============================================================
+    # insertion
+    # ============================================================
+
+    def insert(self, row:Row=None, box:tuple[int, ...]=None) -> None:
+        mid,rid,row = int(row.mid),int(row.rid),row.row
+        x0,y0,z0,x1,y1,z1 = box if box is not None else (*ROW.P0(row=row), *ROW.P1(row=row))
+        b = np.array((x0,y0,z0,-int(x1),-int(y1),-int(z1)), dtype=np.int64)
+
+        if self.root == -1:
+            self.root = self.newnode(leaf=True)
+
+        # descend: pick the child whose volume grows least, expand it on the way down
+        n = self.root
+        while not self.isleaf[n]:
+            boxes = self.box[n, :self.cnt[n]]
+            union = np.minimum(boxes, b)
+            grow = (union[:, :3] + union[:, 3:]).prod(axis=1) - (boxes[:, :3] + boxes[:, 3:]).prod(axis=1)
+            s = int(np.argmin(-grow))   # extents are negated -> (-1)**3 flips the sign of every volume
+            self.box[n, s] = union[s]
+            n = int(self.kid[n, s])
+
+        s = self.cnt[n]
+        self.box[n, s] = b
+        self.kid[n, s] = mid
+        self.aux[n, s] = rid
+        self.cnt[n] = s + 1
+        self.where[(mid,rid)] = (n, s)
+
+        if self.cnt[n] > self.leaf:
+            self.split(n)
+
+    def split(self, n:int) -> None:
+        # overflowing node -> halve along the axis with the widest centroid spread
+        while True:
+            c = self.cnt[n]
+            boxes = self.box[n, :c]
+            centers = boxes[:, :3] - boxes[:, 3:]
+            ax = int(np.argmax(centers.max(axis=0) - centers.min(axis=0)))
+            order = np.argsort(centers[:, ax], kind="stable")
+
+            keep = c // 2
+            m = self.newnode(leaf=self.isleaf[n])
+
+            box = self.box[n, order].copy()
+            kid = self.kid[n, order].copy()
+            aux = self.aux[n, order].copy()
+
+            self.box[m, :c-keep] = box[keep:c]
+            self.kid[m, :c-keep] = kid[keep:c]
+            self.aux[m, :c-keep] = aux[keep:c]
+            self.cnt[m] = c - keep
+
+            self.box[n, :keep] = box[:keep]
+            self.kid[n, :keep] = kid[:keep]
+            self.aux[n, :keep] = aux[:keep]
+            self.kid[n, keep:] = -1
+            self.aux[n, keep:] = -1
+            self.cnt[n] = keep
+
+            # fix back references of everything that moved
+            for node in (n, m):
+                for s in range(self.cnt[node]):
+                    if self.isleaf[node]:
+                        self.where[(int(self.kid[node, s]), int(self.aux[node, s]))] = (node, s)
+                    else:
+                        k = int(self.kid[node, s])
+                        self.parent[k] = node
+                        self.pslot[k] = s
+
+            p = self.parent[n]
+            if p == -1:
+                root = self.newnode(leaf=False)
+                self.attach(root, n)
+                self.attach(root, m)
+                self.root = root
+                return
+
+            self.box[p, self.pslot[n]] = self.bounds(n)
+            self.attach(p, m)
+            if self.cnt[p] <= self.width:
+                return
+            n = p
+
+    # ============================================================
+    # removal
+    # ============================================================
+
+    def remove(self, row:Row=None) -> None:
+        mid,rid = int(row.mid),int(row.rid)
+        hit = self.where.pop((mid,rid), None)
+        if hit is None:
+            return
+
+        n, s = hit
+        last = self.cnt[n] - 1
+        if s != last:
+            self.setslot(n, s, last)
+        self.kid[n, last] = -1
+        self.aux[n, last] = -1
+        self.cnt[n] = last
+
+        # walk up: drop empty nodes, refit the rest
+        while n != self.root:
+            p, t = self.parent[n], self.pslot[n]
+            if self.cnt[n] == 0:
+                last = self.cnt[p] - 1
+                if t != last:
+                    self.setslot(p, t, last)
+                self.kid[p, last] = -1
+                self.cnt[p] = last
+                self.release(n)
+            else:
+                self.box[p, t] = self.bounds(n)
+            n = p
+
+        # shrink the root: single child inner roots collapse, empty roots vanish
+        while self.root != -1 and not self.isleaf[self.root] and self.cnt[self.root] == 1:
+            old = self.root
+            self.root = int(self.kid[old, 0])
+            self.parent[self.root] = -1
+            self.pslot[self.root] = -1
+            self.release(old)
+        if self.root != -1 and self.cnt[self.root] == 0:
+            self.release(self.root)
+            self.root = -1
+
+    # ============================================================
+    # search
+    # ============================================================
+
+    def search(self, pos:POS=None)->Row:
+        if self.root == -1:
+            raise LookupError("BVH empty")
+
+        x,y,z = int(pos[0]),int(pos[1]),int(pos[2])
+        q = np.array((x,y,z,-x-1,-y-1,-z-1), dtype=np.int64)
+        stack = [self.root]
+
+        while stack:
+            n = stack.pop()
+            hit = np.flatnonzero((self.box[n, :self.cnt[n]] <= q).all(axis=1))
+            if hit.size == 0:
+                continue
+
+            if self.isleaf[n]:
+                s = int(hit[0])
+                mid = int(self.kid[n, s])
+                rid = int(self.aux[n, s])
+                row = self.rows.array[mid][rid]
+                if ROW.CONTAINS(row=row,pos=pos):
+                    return Row(mid=mid,rid=rid,row=row)
+                continue
+
+            stack.extend(self.kid[n, hit].tolist())
+
+        raise LookupError("point not found")
+
+    def query(self, p0:POS=None, p1:POS=None)->list[LOC]:
+        """
+        All rows intersecting the box [p0, p1) -> (mid, rid) list, ONE comparison per node:
+        a slot overlaps when (x0, y0, z0, -x1, -y1, -z1) < (qx1, qy1, qz1, -qx0, -qy0, -qz0).
+        """
+        q = np.array((*p1, *(-int(v) for v in p0)), dtype=np.int64)
+        out: list[LOC] = []
+        stack = [self.root] if self.root != -1 else []
+
+        while stack:
+            n = stack.pop()
+            hit = np.flatnonzero((self.box[n, :self.cnt[n]] < q).all(axis=1))
+            if hit.size == 0:
+                continue
+
+            if self.isleaf[n]:
+                out.extend(zip(self.kid[n, hit].tolist(), self.aux[n, hit].tolist()))
+                continue
+
+            stack.extend(self.kid[n, hit].tolist())
+
+        return out
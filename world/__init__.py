@@ -1,21 +1,25 @@
-
-from .buildings import *
-from .buildings import __all__ as allbuildings
-
-from .resources import *
-from .resources import __all__ as allresources
-
-from .rows import ROWS
-from .row import ROW
-from .materials import MATERIALS, Materials, Material
-
-__all__ = [
-    "MATERIALS",
-    "Materials",
-    "Material",
-    "ROW",
-    "ROWS",
-] 
-
-__all__.extend(allbuildings)
+
+from .buildings import *
+from .buildings import __all__ as allbuildings
+
+from .resources import *
+from .resources import __all__ as allresources
+
+from .rows import ROWS
+from .shards import SHARDS
+from .shared import RowsReader
+from .row import ROW
+from .materials import MATERIALS, Materials, Material
+
+__all__ = [
+    "MATERIALS",
+    "Materials",
+    "Material",
+    "ROW",
+    "ROWS",
+    "SHARDS",
+    "RowsReader",
+] 
+
+__all__.extend(allbuildings)
 __all__.extend(allresources)
\ No newline at end of file
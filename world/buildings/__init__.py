@@ -1,12 +1,12 @@
-
-from .miner import Miner
-from .factory import Factory
-from .warehouse import Warehouse
-
-
-
-__all__ = [
-    "Miner",    
-    "Factory",
-    "Warehouse",
+
+from .miner import Miner
+from .factory import Factory
+from .warehouse import Warehouse
+
+
+
+__all__ = [
+    "Miner",    
+    "Factory",
+    "Warehouse",
 ]
\ No newline at end of file
@@ -1,8 +1,8 @@
-from .resource import Resource, RESOURCELIKE
-from .resources import Resources
-
-__all__ = [
-    "Resource",
-    "Resources",
-    "RESOURCELIKE",
+from .resource import Resource, RESOURCELIKE
+from .resources import Resources
+
+__all__ = [
+    "Resource",
+    "Resources",
+    "RESOURCELIKE",
 ]
\ No newline at end of file
@@ -1,587 +1,1462 @@
-from __future__ import annotations
-from typing import TYPE_CHECKING
-if TYPE_CHECKING:
-    pass
-
-import numpy as np
-
-from world.materials import Materials, MATERIALS
-from world.row import ROW
-from utils.bvh import BVH
-from utils.mdx import MDX
-from utils.types import POS, SIZE, NDARR, REQS, Row
-from utils.queue import Queue
-from utils.job import Job
-
-
-class ROWS:
-    """
-    PUBLIC (human interface):
-    - insert(p0:POS, p1:POS, mat:str, dirty:bool=True, alive:bool=True) -> Row
-    - split(pos:POS, pos1:POS=None, mat:str=None) -> REQS
-    - merge(rows:NDARR=None) -> REQS
-    - volume(mat:str=None) -> int
-    - get(mat:str, rid:int) -> Row
-    - search(pos:POS) -> tuple[str,int,NDARR]   <-- matches tests
-
-    INTERNAL:
-    - remove(row:Row) -> None
-    - merge2(row0:Row, row1:Row) -> REQS
-    """
-
-    SIZE = 65536
-
-    def __init__(self) -> None:
-        self.mat = Materials()
-        self.bvh = Queue(cls=BVH(rows=self))
-        self.mdx = Queue(cls=MDX(rows=self))
-
-        self.total = 0
-        self.array, self.arids = self.reqs(n=ROWS.SIZE)
-
-        self.shape = self.array.shape
-        self.nbytes = self.array.nbytes
-        self.gbytes = self.nbytes / (1024**3)
-
-        self.p0 = (ROW.XMIN, ROW.YMIN, ROW.ZMIN)
-        self.p1 = (ROW.XMAX, ROW.YMAX, ROW.ZMAX)
-
-        # local registry so ROWS can poll results by id
-        self.jobs: dict[str, dict[int, Job]] = {"insert": {}, "remove": {}, "search": {}}
-
-        # default world row
-        self.insert(p0=self.p0, p1=self.p1, mat="STONE")
-
-    # ============================================================
-    # Job hub
-    # ============================================================
-
-    def job(self, task: str = None, cls: str = None,
-            row: Row = None, axis: int = None, pos: POS = None,
-            callback=None, **cb_kwargs) -> Job:
-        """
-        Create + dispatch a Job to either BVH or MDX queue.
-        Store it locally by (task,id) so callers can poll.
-
-        Optional callback:
-            callback(job=<completed job>, **cb_kwargs)
-        The Queue worker should call job.finish(...), and we will run callback
-        after we observe completion in poll helpers.
-        """
-        j = Job(row=row, axis=axis, pos=pos, job=task, cls=cls)
-        # attach callback dynamically (no Job refactor required yet)
-        j._callback = callback
-        j._cb_kwargs = cb_kwargs
-
-        if cls == "bvh":
-            self.bvh.job(job=j)
-        elif cls == "mdx":
-            self.mdx.job(job=j)
-        else:
-            raise ValueError("ROWS.job(): cls must be 'bvh' or 'mdx'")
-
-        self.jobs[task][j.id] = j
-        return j
-
-    def _poll_job(self, j: Job) -> Job | None:
-        """
-        Non-blocking poll: ask the right queue if this job finished.
-        If finished, store it in local jobs map and run callback once.
-        """
-        q = self.bvh if j.cls == "bvh" else self.mdx
-        done = q.get(task=j.job, id=j.id)
-        if done is None:
-            return None
-
-        # update local registry
-        self.jobs[j.job][j.id] = done
-
-        # fire callback once (if any)
-        cb = getattr(done, "_callback", None)
-        if cb is not None:
-            try:
-                cb(job=done, **getattr(done, "_cb_kwargs", {}))
-            except Exception as e:
-                # don't crash core sim for callback mistakes
-                print(f"[WARN] Job callback failed: {e!r}")
-            done._callback = None
-
-        return done
-
-    def _wait_job(self, j: Job, spins: int = 10_000) -> Job:
-        """
-        Synchronous wait by polling.
-        Keeps ROWS.search API synchronous for tests / existing callers.
-        """
-        for _ in range(spins):
-            done = self._poll_job(j)
-            if done is not None:
-                return done
-        raise TimeoutError(f"Job did not complete in time: {j.cls}.{j.job} id={j.id}")
-
-    # ============================================================
-    # storage helpers
-    # ============================================================
-
-    def reqs(self, n: int = None) -> REQS:
-        array: NDARR = np.full((MATERIALS.NUM, n, *ROW.SHAPE), fill_value=ROW.SENTINEL, dtype=ROW.DTYPE)
-        arids: dict[int, int] = {mid: 0 for mid in range(MATERIALS.NUM)}
-        return (array, arids)
-
-    def newn(self, mat: str = None) -> int:
-        if mat is None:
-            raise ValueError("newn requires mat")
-        mid = self.mat.mid(name=mat)
-        rid = self.arids[mid]
-        self.arids[mid] += 1
-        self.total += 1
-        return rid
-
-    def deln(self, mat: str = None) -> int:
-        if mat is None:
-            raise ValueError("deln requires mat")
-        mid = self.mat.mid(name=mat)
-        if self.arids[mid] <= 0:
-            raise ValueError("no rows to free")
-        self.arids[mid] -= 1
-        self.total -= 1
-        return self.arids[mid]
-
-    def nrows(self, mat: str = None, mid: int = None) -> int:
-        if mid is None:
-            if mat is None:
-                raise ValueError("nrows requires mat or mid")
-            mid = self.mat.mid(name=mat)
-        return self.arids[mid]
-
-    # ============================================================
-    # Row helpers
-    # ============================================================
-
-    def get(self, mat: str = None, rid: int = None) -> Row:
-        if mat is None or rid is None:
-            raise ValueError("get requires mat and rid")
-        mid = self.mat.mid(name=mat)
-        return Row(mid=mid, rid=rid, row=self.array[mid][rid])
-
-    # ============================================================
-    # core ops
-    # ============================================================
-
-    def insert(self, p0: POS = None, p1: POS = None, mat: str = None,
-               dirty: bool = True, alive: bool = True) -> Row:
-        if mat is None:
-            raise ValueError("insert requires mat")
-
-        rid = self.newn(mat=mat)
-        raw: NDARR = ROW.new(p0=p0, p1=p1, mat=mat, rid=rid, dirty=dirty, alive=alive)
-
-        mid = int(ROW.MID(row=raw))
-        rid = int(ROW.RID(row=raw))
-
-        # write RAW into storage slot
-        slot = self.array[mid][rid]
-        slot[:] = raw
-        stored = Row(mid=mid, rid=rid, row=slot)
-
-        # index async
-        self.job(task="insert", cls="bvh", row=stored)
-        self.job(task="insert", cls="mdx", row=stored)
-        return stored
-
-    def remove(self, row: Row = None) -> None:
-        if row is None:
-            raise ValueError("remove requires row")
-
-        mid = int(row.mid)
-        rid = int(row.rid)
-        mat_name = self.mat.name(mid=mid)
-        n = self.nrows(mid=mid)
-        last = n - 1
-
-        # remove target from indices
-        self.job(task="remove", cls="bvh", row=row)
-        self.job(task="remove", cls="mdx", row=row)
-
-        if rid != last:
-            # remove moved's old identity from indices
-            moved_old = Row(mid=mid, rid=last, row=self.array[mid][last])
-            self.job(task="remove", cls="bvh", row=moved_old)
-            self.job(task="remove", cls="mdx", row=moved_old)
-
-            # move data and patch RID
-            moved_data = self.array[mid][last].copy()
-            moved_data[*ROW.IDS_RID] = np.uint64(rid)
-            self.array[mid][rid][:] = moved_data
-
-            moved_new = Row(mid=mid, rid=rid, row=self.array[mid][rid])
-            self.job(task="insert", cls="bvh", row=moved_new)
-            self.job(task="insert", cls="mdx", row=moved_new)
-
-        # invalidate last
-        self.array[mid][last][:] = ROW.ARRAY
-        self.deln(mat=mat_name)
-
-    # ============================================================
-    # queries (sync facade on async jobs)
-    # ============================================================
-
-    def _bvh_search_row(self, pos: POS) -> Row:
-        j = self.job(task="search", cls="bvh", pos=pos)
-        done = self._wait_job(j)
-        hit = done.get()
-        if hit is None:
-            raise LookupError("BVH search returned no result")
-        return hit
-
-    def _mdx_search_row(self, row: Row, axis: int) -> Row | None:
-        j = self.job(task="search", cls="mdx", row=row, axis=axis)
-        done = self._wait_job(j)
-        return done.get()  # may be None if no neighbor
-
-    def search(self, pos: POS = None) -> tuple[str, int, NDARR]:
-        if pos is None:
-            raise ValueError("search requires pos")
-        hit: Row = self._bvh_search_row(pos)
-        mat = self.mat.name(mid=int(hit.mid))
-        return (mat, int(hit.rid), hit.row)
-
-    # ============================================================
-    # split/merge (only change: use _bvh_search_row / _mdx_search_row)
-    # ============================================================
-
-    def size(self) -> SIZE:
-        return (self.p1[0]-self.p0[0], self.p1[1]-self.p0[1], self.p1[2]-self.p0[2])
-
-    def volume(self, mat: str = None) -> int:
-        if mat is None:
-            total = 0
-            for mid in range(MATERIALS.NUM):
-                total += self.volume(mat=self.mat.name(mid=mid))
-            return int(total)
-
-        mid = int(self.mat.mid(name=mat))
-        total = 0
-        n = self.nrows(mid=mid)
-        for rid in range(n):
-            total += int(ROW.VOLUME(row=self.array[mid][rid]))
-        return int(total)
-
-    def splitrow(self, p0: POS = None, p1: POS = None, mat: str = None) -> REQS:
-        if p0 is None or p1 is None or mat is None:
-            raise ValueError("splitrow requires p0,p1,mat")
-
-        mat0, _, hitrow = self.search(pos=p0)
-
-        r0 = ROW.P0(row=hitrow)
-        r1 = ROW.P1(row=hitrow)
-
-        x0,y0,z0 = r0
-        x3,y3,z3 = r1
-        x1,y1,z1 = p0
-        x2,y2,z2 = p1
-
-        x1=max(x0,min(x1,x3)); x2=max(x0,min(x2,x3))
-        y1=max(y0,min(y1,y3)); y2=max(y0,min(y2,y3))
-        z1=max(z0,min(z1,z3)); z2=max(z0,min(z2,z3))
-
-        xs=((x0,x1),(x1,x2),(x2,x3))
-        ys=((y0,y1),(y1,y2),(y2,y3))
-        zs=((z0,z1),(z1,z2),(z2,z3))
-
-        array, arids = self.reqs(n=27)
-
-        for i,(X0,X1) in enumerate(xs):
-            for j,(Y0,Y1) in enumerate(ys):
-                for k,(Z0,Z1) in enumerate(zs):
-                    if (X1-X0)<=0 or (Y1-Y0)<=0 or (Z1-Z0)<=0:
-                        continue
-
-                    center = (i==1 and j==1 and k==1)
-                    use_mat = mat if center else mat0
-
-                    newrow = self.insert(p0=(X0,Y0,Z0), p1=(X1,Y1,Z1), mat=use_mat)
-                    mid_new = int(newrow.mid)
-
-                    array[mid_new][arids[mid_new]] = newrow.row
-                    arids[mid_new] += 1
-
-        hit_mid = int(ROW.MID(row=hitrow))
-        hit_rid = int(ROW.RID(row=hitrow))
-        self.remove(row=Row(mid=hit_mid, rid=hit_rid, row=hitrow))
-
-        return (array, arids)
-
-    def split1(self, pos: POS = None, pos1: POS = None, mat: str = None) -> REQS:
-        if pos is None or mat is None:
-            raise ValueError("split1 requires pos,mat")
-        if pos1 is None:
-            pos1 = (pos[0]+1, pos[1]+1, pos[2]+1)
-        batch, _ = self.splitrow(p0=pos, p1=pos1, mat=mat)
-        merged, marids = self.merge(rows=batch)
-        return (merged, marids)
-
-    def split2(self, p0: POS = None, p1: POS = None, mat: str = None) -> REQS:
-        def intersect(a0:POS=None,a1:POS=None,b0:POS=None,b1:POS=None)->tuple[POS,POS]|None:
-            q0 = (max(a0[0],b0[0]), max(a0[1],b0[1]), max(a0[2],b0[2]))
-            q1 = (min(a1[0],b1[0]), min(a1[1],b1[1]), min(a1[2],b1[2]))
-            if q0[0]>=q1[0] or q0[1]>=q1[1] or q0[2]>=q1[2]:
-                return None
-            return (q0,q1)
-
-        if p0 is None or p1 is None or mat is None:
-            raise ValueError("split2 requires p0,p1,mat")
-
-        p0,p1 = ROW.SORT(p0=p0, p1=p1)
-        if p0[0]>=p1[0] or p0[1]>=p1[1] or p0[2]>=p1[2]:
-            return self.reqs(n=0)
-
-        acc: list[list[NDARR]] = [[] for _ in range(MATERIALS.NUM)]
-
-        _, _, hitrow1 = self.search(pos=p0)
-        _, _, hitrow2 = self.search(pos=p1)
-        r0 = ROW.P0(row=hitrow1)
-        r1 = ROW.P1(row=hitrow1)
-        r2 = ROW.P0(row=hitrow2)
-        r3 = ROW.P1(row=hitrow2)
-        if r0 == r2 and r1 == r3:
-            return self.split1(pos=p0, pos1=p1, mat=mat)
-
-        hit = intersect(a0=p0, a1=p1, b0=r0, b1=r1)
-        if hit is None:
-            return self.reqs(n=0)
-
-        q0,q1 = hit
-        batch,_ = self.splitrow(p0=q0, p1=q1, mat=mat)
-        merged,marids = self.merge(rows=batch)
-
-        for mid in range(MATERIALS.NUM):
-            for i in range(marids[mid]):
-                acc[mid].append(merged[mid][i])
-
-        if q1[0]<p1[0]:
-            b,a = self.split2(p0=(q1[0],p0[1],p0[2]), p1=p1, mat=mat)
-            for mid in range(MATERIALS.NUM):
-                for i in range(a[mid]):
-                    acc[mid].append(b[mid][i])
-
-        if q1[1]<p1[1]:
-            b,a = self.split2(p0=(p0[0],q1[1],p0[2]), p1=(q1[0],p1[1],p1[2]), mat=mat)
-            for mid in range(MATERIALS.NUM):
-                for i in range(a[mid]):
-                    acc[mid].append(b[mid][i])
-
-        if q1[2]<p1[2]:
-            b,a = self.split2(p0=(p0[0],p0[1],q1[2]), p1=(q1[0],q1[1],p1[2]), mat=mat)
-            for mid in range(MATERIALS.NUM):
-                for i in range(a[mid]):
-                    acc[mid].append(b[mid][i])
-
-        out_arids = {mid: len(acc[mid]) for mid in range(MATERIALS.NUM)}
-        n = max(out_arids.values()) if out_arids else 0
-        array, arids = self.reqs(n=n)
-
-        for mid in range(MATERIALS.NUM):
-            arids[mid] = out_arids[mid]
-            for i,r in enumerate(acc[mid]):
-                array[mid][i] = r
-
-        return (array, arids)
-
-    def split(self, pos: POS = None, pos1: POS = None, mat: str = None) -> REQS:
-        if mat is None:
-            raise ValueError("material must be specified")
-        if pos is None and pos1 is None:
-            raise ValueError("either pos or pos1 must be provided")
-
-        if pos is not None and pos1 is not None:
-            return self.split2(p0=pos, p1=pos1, mat=mat)
-        if pos is not None:
-            return self.split1(pos=pos, mat=mat)
-        return self.split1(pos=pos1, mat=mat)
-
-    def merge2(self, row0: Row = None, row1: Row = None) -> REQS:
-        if row0 is None or row1 is None:
-            return self.reqs(n=0)
-
-        if int(row0.mid) != int(row1.mid):
-            return self.reqs(n=0)
-
-        touch = ROW.MERGE(row0=row0.row, row1=row1.row)
-        if touch == (False, False, False):
-            return self.reqs(n=0)
-
-        p0 = ROW.SORT(p0=ROW.P0(row=row0.row), p1=ROW.P0(row=row1.row))[0]
-        p1 = ROW.SORT(p0=ROW.P1(row=row0.row), p1=ROW.P1(row=row1.row))[1]
-
-        hi, lo = (row0, row1) if int(row0.rid) > int(row1.rid) else (row1, row0)
-
-        self.remove(row=hi)
-        self.remove(row=lo)
-
-        mat_name = self.mat.name(mid=int(row0.mid))
-        newrow = self.insert(p0=p0, p1=p1, mat=mat_name)
-
-        array, arids = self.reqs(n=1)
-        array[int(newrow.mid)][0] = newrow.row
-        arids[int(newrow.mid)] = 1
-        return (array, arids)
-
-    def mergeax(self, mat: str = None, axis: int = None) -> REQS:
-        if mat is None:
-            raise ValueError("mergeax requires mat")
-        if axis is None:
-            raise ValueError("mergeax requires axis")
-
-        mid = int(self.mat.mid(name=mat))
-        start_n = self.nrows(mid=mid)
-        array, arids = self.reqs(n=start_n)
-
-        extra = list(range(self.arids[mid]-1, -1, -1))
-        seen: set[int] = set()
-
-        while extra:
-            rid = int(extra.pop())
-            if rid < 0 or rid >= self.arids[mid]:
-                continue
-            if rid in seen:
-                continue
-            seen.add(rid)
-
-            row0 = Row(mid=mid, rid=rid, row=self.array[mid][rid])
-            row1 = self._mdx_search_row(row=row0, axis=axis)
-            if row1 is None:
-                continue
-
-            created, carids = self.merge2(row0=row0, row1=row1)
-            if carids[mid] > 0:
-                array[mid][arids[mid]] = created[mid][0]
-                arids[mid] += 1
-
-                new_rid = self.arids[mid] - 1
-                extra.append(int(new_rid))
-                seen.discard(rid)
-                extra.append(rid)
-
-        return (array, arids)
-
-    def mergemat(self, mat: str = None) -> REQS:
-        if mat is None:
-            raise ValueError("mergemat requires mat")
-
-        mid = int(self.mat.mid(name=mat))
-        array, arids = self.reqs(n=self.nrows(mid=mid))
-
-        for ax in (0,1,2):
-            while True:
-                created, carids = self.mergeax(mat=mat, axis=ax)
-                if carids[mid] <= 0:
-                    break
-                for i in range(carids[mid]):
-                    array[mid][arids[mid]] = created[mid][i]
-                    arids[mid] += 1
-
-        return (array, arids)
-
-    def mergerows(self, rows: NDARR = None) -> REQS:
-        # unchanged except mdx neighbor lookups now use _mdx_search_row
-        if rows is None:
-            return self.reqs(n=0)
-
-        mids_present: set[int] = set()
-        for mid in range(rows.shape[0]):
-            for i in range(rows.shape[1]):
-                if rows[mid][i][*ROW.IDS_RID] != ROW.SENTINEL:
-                    mids_present.add(mid)
-                    break
-
-        worst = 0
-        for mid in mids_present:
-            worst += self.nrows(mid=mid)
-
-        array, arids = self.reqs(n=worst)
-
-        while True:
-            merged_this_round = 0
-
-            for ax in (0,1,2):
-                extra: list[tuple[int,int]] = []
-                for mid in mids_present:
-                    for rid in range(self.arids[mid]-1, -1, -1):
-                        extra.append((mid,rid))
-
-                seen: set[tuple[int,int]] = set()
-
-                while extra:
-                    mid,rid = extra.pop()
-                    if rid < 0 or rid >= self.arids[mid]:
-                        continue
-
-                    key = (mid,rid)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-
-                    row0 = Row(mid=mid, rid=rid, row=self.array[mid][rid])
-                    row1 = self._mdx_search_row(row=row0, axis=ax)
-                    if row1 is None:
-                        continue
-
-                    created, carids = self.merge2(row0=row0, row1=row1)
-                    if carids[mid] > 0:
-                        array[mid][arids[mid]] = created[mid][0]
-                        arids[mid] += 1
-                        merged_this_round += 1
-
-                        new_rid = self.arids[mid] - 1
-                        extra.append((mid, int(new_rid)))
-                        seen.discard((mid,rid))
-                        extra.append((mid,rid))
-
-            if merged_this_round == 0:
-                break
-
-        return (array, arids)
-
-    def mergeall(self) -> REQS:
-        array, arids = self.reqs(n=self.total)
-        for mat in self.mat.names():
-            created, carids = self.mergemat(mat=mat)
-            for mid in range(MATERIALS.NUM):
-                for i in range(carids[mid]):
-                    array[mid][arids[mid]] = created[mid][i]
-                    arids[mid] += 1
-        return (array, arids)
-
-    def merge(self, rows: NDARR = None) -> REQS:
-        if rows is None:
-            return self.mergeall()
-        return self.mergerows(rows=rows)
-
-    def stats(self) -> str:
-        sizes = []
-        for mid in range(MATERIALS.NUM):
-            mat = self.mat.name(mid=mid)
-            rows = self.nrows(mid=mid)
-            for rid in range(self.arids[mid]):
-                sizes.append((rows, mat, ROW.VOLUME(row=self.array[mid][rid])))
-        volume = self.volume()
-        stats = []
-        for r, m, s in sizes:
-            stats.append({
-                "mat": m,
-                "rows": r,
-                "vol": int(s),
-                "perc": (s / volume * 100) if volume > 0 else 0.0,
-            })
-        string = "ROWS STATS:\n"
-        string += f"  TOTAL VOLUME: {volume}\n"
-        for entry in stats:
-            string += f"  MAT={entry['mat']:10s} ROWS={entry['rows']:6d} VOL={entry['vol']:12d} PERC={entry['perc']:6.2f}%\n"
-        return string
-
-    def __repr__(self) -> str:
-        return self.stats()
-
-    def __str__(self) -> str:
-        return self.stats()
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    pass
+
+from contextlib import contextmanager, asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+import json
+import threading
+import weakref
+
+import numpy as np
+
+from world.materials import Materials, MATERIALS
+from world.row import ROW
+from utils.bvh import BVH
+from utils.wbvh import WBVH
+from utils.sap import SAP
+from utils.adj import ADJ
+from utils.cache import Cache
+from world.shared import SharedRows
+from world.snapshot import Snapshot
+from utils.mdx import MDX
+from utils.runs import Runs
+from utils.indexes import Indexes, BOX
+from utils.types import POS, SIZE, NDARR, REQS, Row
+from utils.queue import Queue
+from utils.job import Job
+from utils.pool import JobPool
+
+
+class ROWS:
+    """
+    PUBLIC (human interface):
+    - insert(p0:POS, p1:POS, mat:str, dirty:bool=True, alive:bool=True) -> Row
+    - insertmany(p0s:NDARR, p1s:NDARR, mids:NDARR) -> (rows, rids)   (n rows in ONE step)
+    - split(pos:POS, pos1:POS=None, mat:str=None) -> REQS
+    - merge(rows:NDARR=None, local:bool=True) -> REQS
+    - volume(mat:str=None) -> int
+    - get(mat:str, rid:int) -> Row
+    - search(pos:POS) -> tuple[str,int,NDARR]   <-- matches tests
+    - query_box(p0:POS, p1:POS) -> REQS          (cached, read only)
+    - remesh(p0:POS, p1:POS) -> REQS             (greedy re-meshing of a region)
+    - composition(p0:POS, p1:POS) -> dict[str,int]   (cached)
+    - batch() -> context: async index jobs of a whole edit go out as ONE batch per queue
+    - queuestats() / dumpstats(path) -> per index job counters, queue depth, latency p50/p95/p99 (JSON)
+    - await asearch(pos) / asplit(pos, pos1, mat) / aquery_box(p0, p1)   (asyncio facade)
+    - split / merge / insert / remesh from several threads: safe, ONE edit at a time (see THREADS);
+      edits of disjoint regions running in parallel -> SHARDS (one ROWS per process)
+
+    OPTIONS:
+    - ROWS(bvh="bvh")  -> binary BVH (one row per leaf)
+    - ROWS(bvh="wbvh") -> wide BVH (8 child boxes per node, bucketed leaves)
+    - ROWS(sap=True)   -> per axis sorted endpoint index, thin slab splits skip the BVH
+    - ROWS(adj=True)   -> face adjacency graph over all materials (partial contacts + area),
+                          merges take their partners from it instead of MDX searches
+    - ROWS(cache=Cache(size=..., nbytes=..., policy="lru")) -> region epoch query cache
+    - ROWS(policy="best") -> merges score candidates (face partners, run, volume) and apply the best first
+    - ROWS(policy="axis") -> merges take the first neighbor found, axes in x, y, z order
+    - ROWS(mode="sync")   -> BVH / MDX run inline on the calling thread, no Job objects (default)
+    - ROWS(mode="async")  -> every index operation is a Job, run in order by the ONE Queue worker:
+                             a row change is ONE job for all indexes (fused maintenance, utils.indexes)
+    - ROWS(mode="async", workers=4) -> 4 search threads (read lock), mutations exclusive
+    - register(name, index, side=False) -> one more index maintained with the others
+    - ROWS(p0=..., p1=...) -> world bounds (default: the full ROW coordinate range)
+    - with read_snapshot() as snap -> immutable rows at one edit boundary while edits go on
+      (copy on write per material, see world.snapshot): snap.volume / boxes / search / rows
+    - ROWS(shm=True | "name") -> rows in multiprocessing.shared_memory: other processes attach a
+                                 RowsReader(rows.shm) (zero copy, seqlock epoch), close() unlinks it
+
+    INTERNAL:
+    - remove(row:Row) -> None
+    - merge2(row0:Row, row1:Row) -> REQS
+
+    THREADS:
+    - lock -> ONE reentrant lock held for a WHOLE edit (insert / insertmany / split + its merge /
+      merge / remesh): an edit never sees another one half done and never runs twice
+    - searches, query_box and composition take the same lock per call
+    - edits do NOT run in parallel: every material array, BVH and MDX is shared by the whole world
+      (and the index work is pure Python under the GIL) -> parallel edits of disjoint regions
+      are SHARDS' job, one ROWS per process
+    """
+
+    SIZE = 65536
+    SLAB = 4    # split boxes at most this thick (on some axis) go through SAP when enabled
+    CELLS = 1 << 21     # max cells of the compressed grid remesh() rasterizes
+    POLICIES = ("best", "axis")     # merge policy: scored candidates | fixed x, y, z order
+    MODES = ("sync", "async")       # index execution: inline on the caller | Job + Queue worker
+    TIMEOUT = 10.0                  # seconds _wait_job waits for an async job
+    # splitrow pieces as (lo, hi) cut plane per axis: plane 0 / 3 = hit row, 1 / 2 = carved box
+    PIECES = np.array((
+        (0, 0, 0, 1, 3, 3), (2, 0, 0, 3, 3, 3),     # x slabs
+        (1, 0, 0, 2, 1, 3), (1, 2, 0, 2, 3, 3),     # y slabs
+        (1, 1, 0, 2, 2, 1), (1, 1, 2, 2, 2, 3),     # z slabs
+        (1, 1, 1, 2, 2, 2),                         # center (new material, LAST)
+    ))
+    AXES = np.array((0, 1, 2, 0, 1, 2))
+
+    def __init__(self, bvh: str = "bvh", sap: bool = False, adj: bool = False, cache: Cache = None,
+                 policy: str = "best", mode: str = "sync", workers: int = 1,
+                 p0: POS = None, p1: POS = None, shm: bool | str = False) -> None:
+        if policy not in ROWS.POLICIES:
+            raise ValueError(f"ROWS(): policy must be one of {ROWS.POLICIES}")
+        if mode not in ROWS.MODES:
+            raise ValueError(f"ROWS(): mode must be one of {ROWS.MODES}")
+        self.mat = Materials()
+        self.policy = policy
+        self.mode = mode
+        self.jobpool = JobPool()     # recycled Jobs for the async index paths
+        # fused maintenance: ONE decode + ONE job per row change for every index
+        # indexes -> searched through the queue in async mode | side -> always on the calling thread
+        self.bvh = self.newbvh(bvh=bvh)
+        self.mdx = MDX(rows=self)
+        self.indexes = Indexes(bvh=self.bvh, mdx=self.mdx)
+        self.side = Indexes()
+        self.sap = self.register(name="sap", index=SAP(rows=self), side=True) if sap else None     # optional
+        self.adj = self.register(name="adj", index=ADJ(rows=self), side=True) if adj else None     # optional
+        self.queue = Queue(cls=self.indexes, start=(mode == "async"), workers=workers, pool=self.jobpool)
+        self.cache = cache if cache is not None else Cache()
+        self.lock = threading.RLock()
+
+        # world bounds -> the default STONE row fills exactly [p0, p1), p1 up to (XMAX, YMAX, ZMAX) inclusive
+        self.p0 = tuple(int(v) for v in p0) if p0 is not None else (ROW.XMIN, ROW.YMIN, ROW.ZMIN)
+        self.p1 = tuple(int(v) for v in p1) if p1 is not None else (ROW.XMAX, ROW.YMAX, ROW.ZMAX)
+        if any(self.p0[i] >= self.p1[i] for i in (0,1,2)):
+            raise ValueError("ROWS(): p0 must be below p1 on every axis")
+        if min(self.p0) < 0 or any(self.p1[i] > m for i, m in enumerate((ROW.XMAX, ROW.YMAX, ROW.ZMAX))):
+            raise ValueError("ROWS(): bounds outside the ROW coordinate range [0, (XMAX, YMAX, ZMAX)]")
+
+        # row storage: private array, or ONE shared memory block out of process RowsReaders attach to
+        self.total = 0
+        self.shared = SharedRows(size=ROWS.SIZE, p0=self.p0, p1=self.p1, name=shm if isinstance(shm, str) else None) if shm else None
+        self.shm = self.shared.name if self.shared is not None else None
+        if self.shared is None:
+            self.array, self.arids = self.reqs(n=ROWS.SIZE)
+        else:
+            self.array, self.arids = self.shared.array, {mid: 0 for mid in range(MATERIALS.NUM)}
+        self.editing = 0    # edit() depth, the shared epoch is odd while > 0
+        self.epoch = 0      # edits completed (outermost edit() exits)
+        self.idle = threading.Condition(self.lock)      # notified when the last open edit ends
+
+        # read snapshots: open ones + the ones still viewing the live rows of each material (copy on write)
+        self.snaps: list[Snapshot] = []
+        self.pinned: list[list[Snapshot]] = [[] for _ in range(MATERIALS.NUM)]
+        self.copies = 0     # materials copied for snapshots
+        self.copied = 0     # bytes copied for snapshots
+
+        self.shape = self.array.shape
+        self.nbytes = self.array.nbytes
+        self.gbytes = self.nbytes / (1024**3)
+
+        # local registry of searches in flight, so ROWS can poll results by id (dropped once collected)
+        self.jobs: dict[str, dict[int, Job]] = {"insert": {}, "remove": {}, "search": {}}
+
+        # async batching: insert/remove jobs collected while inside batch()
+        self.batching = 0
+        self.pend: list[Job] = []
+
+        # asyncio facade: edit executor (created on first use, shut down by close()) + ONE read/write
+        # gate per event loop: an asyncio.Condition is bound to the loop it first waited on
+        self.pool: ThreadPoolExecutor | None = None
+        self.gates: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict] = weakref.WeakKeyDictionary()
+
+        # default world row
+        self.insert(p0=self.p0, p1=self.p1, mat="STONE")
+
+    def register(self, name: str = None, index=None, side: bool = False):
+        """
+        Add an index maintained with the others: index.insert(row, box) / index.remove(row)
+        get every row change from now on (register before the first edit to see every row).
+        side=False -> updated by the queue worker in async mode, like BVH / MDX
+        side=True  -> always updated on the calling thread (indexes ROWS reads directly, like SAP)
+        """
+        if name in self.indexes or name in self.side:
+            raise ValueError(f"ROWS.register(): index '{name}' already registered")
+        return (self.side if side else self.indexes).register(name=name, index=index)
+
+    def newbvh(self, bvh: str = None) -> BVH | WBVH:
+        if bvh == "bvh":
+            return BVH(rows=self)
+        if bvh == "wbvh":
+            return WBVH(rows=self)
+        raise ValueError("ROWS(): bvh must be 'bvh' or 'wbvh'")
+
+    # ============================================================
+    # Job hub
+    # ============================================================
+
+    def job(self, task: str = None, cls: str = None,
+            row: Row = None, axis: int = None, pos: POS = None, box: tuple[int, ...] = None,
+            callback=None, **cb_kwargs) -> Job:
+        """
+        Create + dispatch a Job to the queue (async mode), recycled from the JobPool.
+        insert/remove jobs (cls="all") update every index at once and are fire and forget:
+        registered nowhere, back in the pool once run. Searches name their index (cls="bvh" / "mdx").
+        Searches are stored locally by (task,id) so callers can poll, until collected.
+        insert/remove jobs carry a COPY of the row: the slot can be reused before the worker runs.
+
+        Optional callback:
+            callback(job=<completed job>, **cb_kwargs)
+        The Queue worker should call job.finish(...), and we will run callback
+        after we observe completion in poll helpers.
+        """
+        forget = task in ("insert", "remove")
+        if forget:
+            row = Row(mid=row.mid, rid=row.rid, row=row.row.copy())
+        j = self.jobpool.get(row=row, axis=axis, pos=pos, job=task, cls=cls, forget=forget, box=box)
+        # attach callback dynamically (no Job refactor required yet)
+        j._callback = callback
+        j._cb_kwargs = cb_kwargs
+
+        if cls not in ("bvh", "mdx", "all"):
+            raise ValueError("ROWS.job(): cls must be 'bvh', 'mdx' or 'all'")
+        if self.batching and forget:
+            self.pend.append(j)
+        else:
+            self.queue.job(job=j)
+
+        if not forget:
+            self.jobs[task][j.id] = j
+        return j
+
+    @contextmanager
+    def batch(self):
+        """
+        Async mode: collect the insert/remove jobs of a whole edit and hand them to the
+        queue as ONE batch (Queue.jobs) on exit. Nests, the outermost exit flushes.
+        Searches inside flush first, so they still see every earlier change.
+        Sync mode: no-op.
+        """
+        with self.lock:
+            self.batching += 1
+        try:
+            with self.edit():
+                yield self
+        finally:
+            with self.lock:
+                self.batching -= 1
+                if self.batching == 0:
+                    self.flush()
+
+    @contextmanager
+    def edit(self):
+        """
+        Writer side of the shared storage seqlock (shm): the epoch turns odd when the outermost
+        edit starts, the row counts are published and the epoch turns even when it ends.
+        Nests (batch, insert and remove all open one). Private storage: depth only.
+        """
+        with self.lock:
+            self.editing += 1
+            if self.editing == 1 and self.shared is not None:
+                self.shared.begin()
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.editing -= 1
+                if self.editing == 0:
+                    self.epoch += 1
+                    if self.shared is not None:
+                        self.shared.end(arids=self.arids, total=self.total)
+                    self.idle.notify_all()
+
+    # ============================================================
+    # read snapshots
+    # ============================================================
+
+    @contextmanager
+    def read_snapshot(self, timeout: float = TIMEOUT):
+        """
+        with rows.read_snapshot() as snap: ... -> a Snapshot of the rows between two edits.
+        Taking it costs no copy: it views the live rows, and the first change of a material
+        after it copies that material's rows once for every snapshot still viewing them.
+        Waits (at most timeout seconds) for the open edits to end -> take it outside an edit.
+        """
+        snap = self.snapshot(timeout=timeout)
+        try:
+            yield snap
+        finally:
+            snap.close()
+
+    def snapshot(self, timeout: float = TIMEOUT) -> Snapshot:
+        # read_snapshot() without the with block: the caller close()s it
+        with self.idle:
+            if not self.idle.wait_for(lambda: self.editing == 0, timeout=timeout):
+                raise TimeoutError(f"ROWS.snapshot(): edits still open after {timeout}s")
+            snap = Snapshot(rows=self)
+            self.snaps.append(snap)
+            for pins in self.pinned:
+                pins.append(snap)
+            return snap
+
+    def cow(self, mid: int = None) -> None:
+        # first change of material mid since snapshots were taken -> ONE copy for all of them
+        old = self.array[mid][:self.arids[mid]].copy()
+        old.flags.writeable = False
+        for snap in self.pinned[mid]:
+            snap.data[mid] = old
+            snap.live[mid] = False
+        self.pinned[mid] = []
+        self.copies += 1
+        self.copied += old.nbytes
+
+    def release(self, snap: Snapshot = None) -> None:
+        # a snapshot closed -> unpin it, its copies go with the last snapshot holding them
+        with self.lock:
+            if snap in self.snaps:
+                self.snaps.remove(snap)
+            for pins in self.pinned:
+                if snap in pins:
+                    pins.remove(snap)
+
+    def snapstats(self) -> dict[str, int]:
+        """
+        open snapshots, copies made for them (count, bytes) and the bytes of copies still held.
+        """
+        with self.lock:
+            held = {}
+            for snap in self.snaps:
+                for mid in range(MATERIALS.NUM):
+                    if not snap.live[mid]:
+                        held[id(snap.data[mid])] = snap.data[mid].nbytes
+            return {
+                "epoch": self.epoch,
+                "open": len(self.snaps),
+                "copies": self.copies,
+                "copied": self.copied,
+                "held": sum(held.values()),
+            }
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.pend:
+                self.queue.jobs(jobs=self.pend)
+                self.pend = []
+
+    def index(self, task: str = None, row: Row = None, box: BOX = None) -> None:
+        """
+        Dispatch one row change (insert/remove) to every index, the row box decoded ONCE
+        (or handed over by a bulk insert): the queued indexes (inline in sync mode, ONE job in
+        async mode), then the side indexes. Also bumps the cache epoch of every sector the row touches.
+        """
+        if box is None:
+            box = Indexes.box(row=row.row)
+        self.cache.bump(p0=box[:3], p1=box[3:])
+        if task == "insert":
+            if self.mode == "sync":
+                self.indexes.insert(row=row, box=box)
+            else:
+                self.job(task=task, cls="all", row=row, box=box)
+            self.side.insert(row=row, box=box)
+        else:
+            if self.mode == "sync":
+                self.indexes.remove(row=row)
+            else:
+                self.job(task=task, cls="all", row=row, box=box)
+            self.side.remove(row=row)
+
+    def _poll_job(self, j: Job) -> Job | None:
+        """
+        Non-blocking poll: ask the right queue if this job finished.
+        If finished, drop it from the local jobs map and run callback once.
+        The caller hands it back with self.jobpool.put(job) after reading the result.
+        """
+        done = self.queue.get(task=j.job, id=j.id)
+        if done is None:
+            return None
+
+        # collected -> reclaim the local registry entry
+        self.jobs[j.job].pop(j.id, None)
+
+        # fire callback once (if any)
+        cb = getattr(done, "_callback", None)
+        if cb is not None:
+            try:
+                cb(job=done, **getattr(done, "_cb_kwargs", {}))
+            except Exception as e:
+                # don't crash core sim for callback mistakes
+                print(f"[WARN] Job callback failed: {e!r}")
+            done._callback = None
+
+        return done
+
+    def jobstats(self) -> dict[str, int]:
+        """
+        Job bookkeeping: JobPool counters + every registry that could hold jobs.
+        """
+        stats = self.jobpool.stats()
+        stats["registered"] = sum(len(v) for v in self.jobs.values())
+        stats["pending"] = sum(len(v) for v in self.queue.pending.values())
+        stats["results"] = sum(len(v) for v in self.queue.results.values())
+        stats["reclaimed"] = self.queue.reclaimed
+        return stats
+
+    def queuestats(self) -> dict:
+        """
+        Queue.stats() (counters, depth gauges, latency percentiles per lane: insert / remove /
+        one search lane per index) + jobstats(). Sync mode runs the indexes inline -> all 0.
+        """
+        return {"mode": self.mode, "queue": self.queue.stats(), "jobs": self.jobstats()}
+
+    def dumpstats(self, path: str = None) -> str:
+        # queuestats() as JSON, also written to `path` when given
+        text = json.dumps(self.queuestats(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def _wait_job(self, j: Job, timeout: float = TIMEOUT) -> Job:
+        """
+        Synchronous wait: block on the job's future (deadline in seconds), then collect it.
+        Keeps ROWS.search API synchronous for tests / existing callers.
+        """
+        if j.wait(timeout=timeout):
+            done = self._poll_job(j)
+            if done is not None:
+                return done
+        raise TimeoutError(f"Job did not complete in time: {j.cls}.{j.job} id={j.id}")
+
+    # ============================================================
+    # storage helpers
+    # ============================================================
+
+    def reqs(self, n: int = None) -> REQS:
+        array: NDARR = np.full((MATERIALS.NUM, n, *ROW.SHAPE), fill_value=ROW.SENTINEL, dtype=ROW.DTYPE)
+        arids: dict[int, int] = {mid: 0 for mid in range(MATERIALS.NUM)}
+        return (array, arids)
+
+    def newn(self, mat: str = None) -> int:
+        if mat is None:
+            raise ValueError("newn requires mat")
+        mid = self.mat.mid(name=mat)
+        rid = self.arids[mid]
+        self.arids[mid] += 1
+        self.total += 1
+        return rid
+
+    def deln(self, mat: str = None) -> int:
+        if mat is None:
+            raise ValueError("deln requires mat")
+        mid = self.mat.mid(name=mat)
+        if self.arids[mid] <= 0:
+            raise ValueError("no rows to free")
+        self.arids[mid] -= 1
+        self.total -= 1
+        return self.arids[mid]
+
+    def nrows(self, mat: str = None, mid: int = None) -> int:
+        if mid is None:
+            if mat is None:
+                raise ValueError("nrows requires mat or mid")
+            mid = self.mat.mid(name=mat)
+        return self.arids[mid]
+
+    # ============================================================
+    # Row helpers
+    # ============================================================
+
+    def get(self, mat: str = None, rid: int = None) -> Row:
+        if mat is None or rid is None:
+            raise ValueError("get requires mat and rid")
+        mid = self.mat.mid(name=mat)
+        return Row(mid=mid, rid=rid, row=self.array[mid][rid])
+
+    # ============================================================
+    # core ops
+    # ============================================================
+
+    def insert(self, p0: POS = None, p1: POS = None, mat: str = None,
+               dirty: bool = True, alive: bool = True) -> Row:
+        if mat is None:
+            raise ValueError("insert requires mat")
+
+        with self.lock, self.edit():
+            if self.pinned[self.mat.mid(name=mat)]:
+                self.cow(mid=self.mat.mid(name=mat))
+            rid = self.newn(mat=mat)
+            raw: NDARR = ROW.new(p0=p0, p1=p1, mat=mat, rid=rid, dirty=dirty, alive=alive)
+
+            mid = int(ROW.MID(row=raw))
+            rid = int(ROW.RID(row=raw))
+
+            # write RAW into storage slot
+            slot = self.array[mid][rid]
+            slot[:] = raw
+            stored = Row(mid=mid, rid=rid, row=slot)
+
+            # index async
+            self.index(task="insert", row=stored)
+            return stored
+
+    def insertmany(self, p0s: NDARR = None, p1s: NDARR = None, mids: NDARR = None,
+                   dirty: bool = True, alive: bool = True) -> tuple[NDARR, NDARR]:
+        """
+        Insert n rows in ONE step: rids handed out per material in input order, the rows built
+        at once (ROW.many) and written with one scatter, then indexed row by row in that order.
+        p0s / p1s (n, 3), mids (n,) -> (stored rows (n, *ROW.SHAPE) copy, rids (n,))
+        """
+        p0s = np.asarray(p0s, dtype=np.int64).reshape(-1, 3)
+        p1s = np.asarray(p1s, dtype=np.int64).reshape(-1, 3)
+        mids = np.asarray(mids, dtype=np.int64).reshape(-1)
+        rids = np.zeros(len(mids), dtype=np.int64)
+        if not len(mids):
+            return (np.empty((0, *ROW.SHAPE), dtype=ROW.DTYPE), rids)
+
+        with self.lock, self.edit():
+            for mid in np.unique(mids).tolist():
+                if self.pinned[mid]:
+                    self.cow(mid=mid)
+                sel = mids == mid
+                k = int(np.count_nonzero(sel))
+                rids[sel] = np.arange(self.arids[mid], self.arids[mid] + k)
+                self.arids[mid] += k
+                self.total += k
+
+            raw = ROW.many(p0s=p0s, p1s=p1s, mids=mids, rids=rids, dirty=dirty, alive=alive)
+            self.array[mids, rids] = raw
+
+            boxes = np.concatenate((raw[:, ROW.IDS_X0[0], :3], raw[:, ROW.IDS_X1[0], :3]), axis=1).tolist()
+            for mid, rid, box in zip(mids.tolist(), rids.tolist(), boxes):
+                self.index(task="insert", row=Row(mid=mid, rid=rid, row=self.array[mid][rid]), box=tuple(box))
+            return (raw, rids)
+
+    def remove(self, row: Row = None) -> None:
+        if row is None:
+            raise ValueError("remove requires row")
+        with self.lock, self.edit():
+            self._remove(row=row)
+
+    def _remove(self, row: Row = None) -> None:
+        mid = int(row.mid)
+        rid = int(row.rid)
+        if self.pinned[mid]:
+            self.cow(mid=mid)
+        mat_name = self.mat.name(mid=mid)
+        n = self.nrows(mid=mid)
+        last = n - 1
+
+        # remove target from indices
+        self.index(task="remove", row=row)
+
+        if rid != last:
+            # remove moved's old identity from indices
+            moved_old = Row(mid=mid, rid=last, row=self.array[mid][last])
+            self.index(task="remove", row=moved_old)
+
+            # move data and patch RID
+            moved_data = self.array[mid][last].copy()
+            moved_data[*ROW.IDS_RID] = np.uint64(rid)
+            self.array[mid][rid][:] = moved_data
+
+            moved_new = Row(mid=mid, rid=rid, row=self.array[mid][rid])
+            self.index(task="insert", row=moved_new)
+
+        # invalidate last
+        self.array[mid][last][:] = ROW.ARRAY
+        self.deln(mat=mat_name)
+
+    # ============================================================
+    # queries (sync facade on async jobs)
+    # ============================================================
+
+    def _bvh_search_row(self, pos: POS) -> Row:
+        with self.lock:
+            if self.mode == "sync":
+                return self.bvh.search(pos=pos)
+            self.flush()
+            j = self.job(task="search", cls="bvh", pos=pos)
+            done = self._wait_job(j)
+            hit = done.get()
+            self.jobpool.put(job=done)
+        if hit is None:
+            raise LookupError("BVH search returned no result")
+        return hit
+
+    def _mdx_search_row(self, row: Row, axis: int) -> Row | None:
+        with self.lock:
+            if self.mode == "sync":
+                return self.mdx.search(r=row, axis=axis)
+            self.flush()
+            j = self.job(task="search", cls="mdx", row=row, axis=axis)
+            done = self._wait_job(j)
+            hit = done.get()  # may be None if no neighbor
+            self.jobpool.put(job=done)
+        return hit
+
+    def _partner_row(self, row: Row, axis: int) -> Row | None:
+        # merge partner: ADJ when on (inline side index, same answer, no queue round trip), else MDX
+        if self.adj is not None:
+            with self.lock:
+                return self.adj.partner(row=row, axis=axis)
+        return self._mdx_search_row(row=row, axis=axis)
+
+    def search(self, pos: POS = None) -> tuple[str, int, NDARR]:
+        if pos is None:
+            raise ValueError("search requires pos")
+        hit: Row = self._bvh_search_row(pos)
+        mat = self.mat.name(mid=int(hit.mid))
+        return (mat, int(hit.rid), hit.row)
+
+    def query_box(self, p0: POS = None, p1: POS = None) -> REQS:
+        """
+        All rows intersecting the box [p0, p1), per material: BVH candidates (subtrees off the
+        box skipped), rid order per material. Async mode -> the queue settles first.
+        Cached per region epoch as (read only array, count tuple) -> every caller gets its own arids.
+        """
+        if p0 is None or p1 is None:
+            raise ValueError("query_box requires p0,p1")
+        p0, p1 = ROW.SORT(p0=p0, p1=p1)
+        p0 = tuple(int(v) for v in p0)
+        p1 = tuple(int(v) for v in p1)
+
+        with self.lock:
+            key = ("query_box", p0, p1)
+            hit = self.cache.get(key=key)
+            if hit is None:
+                stamp = self.cache.clock
+                if self.mode == "async":
+                    self.flush()
+                    if not self.queue.settle(timeout=ROWS.TIMEOUT):
+                        raise TimeoutError("query_box: index queue did not settle")
+                found: list[list[int]] = [[] for _ in range(MATERIALS.NUM)]
+                for mid, rid in self.bvh.query(p0=p0, p1=p1):
+                    found[mid].append(rid)
+
+                array, _ = self.reqs(n=max(len(f) for f in found))
+                for mid, f in enumerate(found):
+                    array[mid][:len(f)] = self.array[mid][sorted(f)]
+                array.flags.writeable = False
+                hit = self.cache.put(key=key, p0=p0, p1=p1, value=(array, tuple(len(f) for f in found)), stamp=stamp)
+            array, counts = hit
+            return (array, dict(enumerate(counts)))
+
+    def composition(self, p0: POS = None, p1: POS = None) -> dict[str, int]:
+        """
+        Volume per material inside the box [p0, p1) (rows clipped to the box). Cached.
+        """
+        if p0 is None or p1 is None:
+            raise ValueError("composition requires p0,p1")
+        p0, p1 = ROW.SORT(p0=p0, p1=p1)
+        p0 = tuple(int(v) for v in p0)
+        p1 = tuple(int(v) for v in p1)
+
+        with self.lock:
+            key = ("composition", p0, p1)
+            hit = self.cache.get(key=key)
+            if hit is not None:
+                return dict(hit)
+
+            stamp = self.cache.clock
+            array, arids = self.query_box(p0=p0, p1=p1)
+            lo = np.array(p0, dtype=ROW.DTYPE)
+            hi = np.array(p1, dtype=ROW.DTYPE)
+            comp: dict[str, int] = {}
+            for mid in range(MATERIALS.NUM):
+                rows = array[mid][:arids[mid]]
+                r0 = np.maximum(rows[:, ROW.IDS_X0[0], :3], lo)
+                r1 = np.minimum(rows[:, ROW.IDS_X1[0], :3], hi)
+                comp[self.mat.name(mid=mid)] = int((r1 - r0).prod(axis=1).sum())
+            self.cache.put(key=key, p0=p0, p1=p1, value=comp, stamp=stamp)
+            return dict(comp)
+
+    # ============================================================
+    # asyncio facade
+    # ============================================================
+
+    def gate(self) -> dict:
+        # the read/write gate of the running loop: {"cond", "readers", "writing"}
+        # (tasks of other loops run on other threads -> kept apart by the edit lock instead)
+        loop = asyncio.get_running_loop()
+        gate = self.gates.get(loop)
+        if gate is None:
+            gate = self.gates[loop] = {"cond": asyncio.Condition(), "readers": 0, "writing": False}
+        return gate
+
+    @asynccontextmanager
+    async def aread(self):
+        # many readers at once, never together with a writer
+        gate = self.gate()
+        async with gate["cond"]:
+            await gate["cond"].wait_for(lambda: not gate["writing"])
+            gate["readers"] += 1
+        try:
+            yield self
+        finally:
+            async with gate["cond"]:
+                gate["readers"] -= 1
+                gate["cond"].notify_all()
+
+    @asynccontextmanager
+    async def awrite(self):
+        # one writer, after every reader left
+        gate = self.gate()
+        async with gate["cond"]:
+            await gate["cond"].wait_for(lambda: not gate["writing"] and gate["readers"] == 0)
+            gate["writing"] = True
+        try:
+            yield self
+        finally:
+            async with gate["cond"]:
+                gate["writing"] = False
+                gate["cond"].notify_all()
+
+    async def aexec(self, fn, **kwargs):
+        # run on the ONE edit thread -> the event loop never blocks on a world edit
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rows")
+        return await asyncio.get_running_loop().run_in_executor(self.pool, partial(fn, **kwargs))
+
+    async def ajob(self, j: Job) -> Job:
+        """
+        Await an async job: the worker resolves an asyncio future through call_soon_threadsafe,
+        no thread is parked waiting on it.
+        """
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+
+        def resolve(job: Job) -> None:
+            if not fut.done():
+                fut.set_result(job)
+
+        j.then(lambda job: loop.call_soon_threadsafe(resolve, job))
+        try:
+            await asyncio.wait_for(fut, timeout=ROWS.TIMEOUT)
+        except asyncio.TimeoutError:
+            # nobody will collect it -> drop it from every registry (the queue reclaims its result)
+            self.jobs[j.job].pop(j.id, None)
+            self.queue.pending[j.job].pop(j.id, None)
+            raise
+        done = self._poll_job(j)
+        return done if done is not None else j
+
+    async def asearch(self, pos: POS = None) -> tuple[str, int, NDARR]:
+        if pos is None:
+            raise ValueError("asearch requires pos")
+        async with self.aread():
+            if self.mode == "sync":
+                return self.search(pos=pos)
+            self.flush()
+            done = await self.ajob(self.job(task="search", cls="bvh", pos=pos))
+            hit = done.get()
+            self.jobpool.put(job=done)
+            if hit is None:
+                raise LookupError("BVH search returned no result")
+            return (self.mat.name(mid=int(hit.mid)), int(hit.rid), hit.row)
+
+    async def aquery_box(self, p0: POS = None, p1: POS = None) -> REQS:
+        async with self.aread():
+            return await self.aexec(self.query_box, p0=p0, p1=p1)
+
+    async def asplit(self, pos: POS = None, pos1: POS = None, mat: str = None) -> REQS:
+        async with self.awrite():
+            return await self.aexec(self.split, pos=pos, pos1=pos1, mat=mat)
+
+    # ============================================================
+    # split/merge (only change: use _bvh_search_row / _mdx_search_row)
+    # ============================================================
+
+    def size(self) -> SIZE:
+        return (self.p1[0]-self.p0[0], self.p1[1]-self.p0[1], self.p1[2]-self.p0[2])
+
+    def volume(self, mat: str = None) -> int:
+        if mat is None:
+            total = 0
+            for mid in range(MATERIALS.NUM):
+                total += self.volume(mat=self.mat.name(mid=mid))
+            return int(total)
+
+        mid = int(self.mat.mid(name=mat))
+        total = 0
+        n = self.nrows(mid=mid)
+        for rid in range(n):
+            total += int(ROW.VOLUME(row=self.array[mid][rid]))
+        return int(total)
+
+    def splitrow(self, p0: POS = None, p1: POS = None, mat: str = None, hit: Row = None) -> REQS:
+        """
+        Carve [p0, p1) (clamped to the hit row) out of the row at p0, minimal decomposition:
+        - 2 x slabs over the full y/z extent, 2 y slabs inside the x range, 2 z slabs inside x/y
+        - + the center with the new material -> at most 7 rows instead of 27 sub boxes
+        the 7 boxes come from ONE gather over the cut planes (ROWS.PIECES), the non empty ones
+        go in with ONE insertmany() -> compact REQS (n = most rows of one material)
+        the hit row is removed first, so the new rows never overlap a live row
+        one step under the lock: the hit can not move between the search and its remove
+        """
+        if p0 is None or p1 is None or mat is None:
+            raise ValueError("splitrow requires p0,p1,mat")
+
+        with self.lock:
+            if hit is None:
+                _, _, hitrow = self.search(pos=p0)
+            else:
+                hitrow = hit.row
+
+            h0 = hitrow[ROW.IDS_X0[0], :3].astype(np.int64)
+            h1 = hitrow[ROW.IDS_X1[0], :3].astype(np.int64)
+            cuts = np.stack((h0, np.clip(np.asarray(p0, dtype=np.int64), h0, h1),
+                             np.clip(np.asarray(p1, dtype=np.int64), h0, h1), h1), axis=1)     # (axis, plane)
+            boxes = cuts[ROWS.AXES, ROWS.PIECES]
+            keep = (boxes[:, 3:] > boxes[:, :3]).all(axis=1)
+
+            mid0 = int(hitrow[ROW.IDS_MID])
+            mids = np.full(len(boxes), mid0, dtype=np.int64)
+            mids[-1] = self.mat.mid(name=mat)
+
+            # the slot of the hit row is reused by remove() -> bounds were copied above
+            self.remove(row=Row(mid=mid0, rid=int(hitrow[ROW.IDS_RID]), row=hitrow))
+
+            mids = mids[keep]
+            raw, _ = self.insertmany(p0s=boxes[keep, :3], p1s=boxes[keep, 3:], mids=mids)
+
+        counts = np.bincount(mids, minlength=MATERIALS.NUM)
+        array, arids = self.reqs(n=int(counts.max()))
+        for mid in np.flatnonzero(counts).tolist():
+            array[mid][:counts[mid]] = raw[mids == mid]
+            arids[mid] = int(counts[mid])
+        return (array, arids)
+
+    def split1(self, pos: POS = None, pos1: POS = None, mat: str = None) -> REQS:
+        if pos is None or mat is None:
+            raise ValueError("split1 requires pos,mat")
+        if pos1 is None:
+            pos1 = (pos[0]+1, pos[1]+1, pos[2]+1)
+        batch, _ = self.splitrow(p0=pos, p1=pos1, mat=mat)
+        merged, marids = self.merge(rows=batch)
+        return (merged, marids)
+
+    def split2(self, p0: POS = None, p1: POS = None, mat: str = None) -> REQS:
+        def intersect(a0:POS=None,a1:POS=None,b0:POS=None,b1:POS=None)->tuple[POS,POS]|None:
+            q0 = (max(a0[0],b0[0]), max(a0[1],b0[1]), max(a0[2],b0[2]))
+            q1 = (min(a1[0],b1[0]), min(a1[1],b1[1]), min(a1[2],b1[2]))
+            if q0[0]>=q1[0] or q0[1]>=q1[1] or q0[2]>=q1[2]:
+                return None
+            return (q0,q1)
+
+        if p0 is None or p1 is None or mat is None:
+            raise ValueError("split2 requires p0,p1,mat")
+
+        p0,p1 = ROW.SORT(p0=p0, p1=p1)
+        if p0[0]>=p1[0] or p0[1]>=p1[1] or p0[2]>=p1[2]:
+            return self.reqs(n=0)
+
+        acc: list[list[NDARR]] = [[] for _ in range(MATERIALS.NUM)]
+
+        with self.lock:     # read the bounds before another thread's remove can move the rows
+            _, _, hitrow1 = self.search(pos=p0)
+            _, _, hitrow2 = self.search(pos=(p1[0]-1, p1[1]-1, p1[2]-1))     # last cell, p1 itself is exclusive
+            r0 = ROW.P0(row=hitrow1)
+            r1 = ROW.P1(row=hitrow1)
+            r2 = ROW.P0(row=hitrow2)
+            r3 = ROW.P1(row=hitrow2)
+        if r0 == r2 and r1 == r3:
+            return self.split1(pos=p0, pos1=p1, mat=mat)
+
+        hit = intersect(a0=p0, a1=p1, b0=r0, b1=r1)
+        if hit is None:
+            return self.reqs(n=0)
+
+        q0,q1 = hit
+        batch,_ = self.splitrow(p0=q0, p1=q1, mat=mat)
+        merged,marids = self.merge(rows=batch)
+
+        for mid in range(MATERIALS.NUM):
+            for i in range(marids[mid]):
+                acc[mid].append(merged[mid][i])
+
+        if q1[0]<p1[0]:
+            b,a = self.split2(p0=(q1[0],p0[1],p0[2]), p1=p1, mat=mat)
+            for mid in range(MATERIALS.NUM):
+                for i in range(a[mid]):
+                    acc[mid].append(b[mid][i])
+
+        if q1[1]<p1[1]:
+            b,a = self.split2(p0=(p0[0],q1[1],p0[2]), p1=(q1[0],p1[1],p1[2]), mat=mat)
+            for mid in range(MATERIALS.NUM):
+                for i in range(a[mid]):
+                    acc[mid].append(b[mid][i])
+
+        if q1[2]<p1[2]:
+            b,a = self.split2(p0=(p0[0],p0[1],q1[2]), p1=(q1[0],q1[1],p1[2]), mat=mat)
+            for mid in range(MATERIALS.NUM):
+                for i in range(a[mid]):
+                    acc[mid].append(b[mid][i])
+
+        out_arids = {mid: len(acc[mid]) for mid in range(MATERIALS.NUM)}
+        n = max(out_arids.values()) if out_arids else 0
+        array, arids = self.reqs(n=n)
+
+        for mid in range(MATERIALS.NUM):
+            arids[mid] = out_arids[mid]
+            for i,r in enumerate(acc[mid]):
+                array[mid][i] = r
+
+        return (array, arids)
+
+    def splitslab(self, p0: POS = None, p1: POS = None, mat: str = None) -> REQS:
+        """
+        Thin slab edit: the SAP index hands over every row overlapping the box at once
+        (no BVH traversal per sub-box), each one is split on its intersection, then one merge.
+        """
+        if p0 is None or p1 is None or mat is None:
+            raise ValueError("splitslab requires p0,p1,mat")
+        if self.sap is None:
+            raise ValueError("splitslab requires ROWS(sap=True)")
+
+        p0,p1 = ROW.SORT(p0=p0, p1=p1)
+        if p0[0]>=p1[0] or p0[1]>=p1[1] or p0[2]>=p1[2]:
+            return self.reqs(n=0)
+
+        mid_new = int(self.mat.mid(name=mat))
+        with self.lock:     # ONE step: the pending hits must not move under another thread's remove
+            hits = [(mid,rid) for mid,rid in self.sap.query(p0=p0, p1=p1) if mid != mid_new]
+
+            # highest rid first: remove() swaps the LAST row into the hole, so pending hits never move
+            hits.sort(key=lambda loc: loc[1], reverse=True)
+
+            acc: list[list[NDARR]] = [[] for _ in range(MATERIALS.NUM)]
+            for mid,rid in hits:
+                hit = Row(mid=mid, rid=rid, row=self.array[mid][rid])
+                r0 = ROW.P0(row=hit.row)
+                r1 = ROW.P1(row=hit.row)
+                q0 = tuple(max(int(p0[i]), int(r0[i])) for i in (0,1,2))
+                q1 = tuple(min(int(p1[i]), int(r1[i])) for i in (0,1,2))
+
+                batch,barids = self.splitrow(p0=q0, p1=q1, mat=mat, hit=hit)
+                for m in range(MATERIALS.NUM):
+                    for i in range(barids[m]):
+                        acc[m].append(batch[m][i])
+
+        n = max(len(a) for a in acc)
+        array, arids = self.reqs(n=n)
+        for m in range(MATERIALS.NUM):
+            arids[m] = len(acc[m])
+            for i,r in enumerate(acc[m]):
+                array[m][i] = r
+
+        return self.merge(rows=array)
+
+    def thin(self, p0: POS = None, p1: POS = None) -> bool:
+        return min(abs(int(p1[i]) - int(p0[i])) for i in (0,1,2)) <= ROWS.SLAB
+
+    def split(self, pos: POS = None, pos1: POS = None, mat: str = None) -> REQS:
+        """
+        Holds the edit lock for the whole split + merge: runs once, other threads' edits wait.
+        """
+        with self.lock, self.batch():
+            return self._split(pos=pos, pos1=pos1, mat=mat)
+
+    def _split(self, pos: POS = None, pos1: POS = None, mat: str = None) -> REQS:
+        if mat is None:
+            raise ValueError("material must be specified")
+        if pos is None and pos1 is None:
+            raise ValueError("either pos or pos1 must be provided")
+
+        if pos is not None and pos1 is not None:
+            if self.sap is not None and self.thin(p0=pos, p1=pos1):
+                return self.splitslab(p0=pos, p1=pos1, mat=mat)
+            return self.split2(p0=pos, p1=pos1, mat=mat)
+        if pos is not None:
+            return self.split1(pos=pos, mat=mat)
+        return self.split1(pos=pos1, mat=mat)
+
+    def merge2(self, row0: Row = None, row1: Row = None) -> REQS:
+        if row0 is None or row1 is None:
+            return self.reqs(n=0)
+
+        if int(row0.mid) != int(row1.mid):
+            return self.reqs(n=0)
+
+        touch = ROW.MERGE(row0=row0.row, row1=row1.row)
+        if touch == (False, False, False):
+            return self.reqs(n=0)
+
+        p0 = ROW.SORT(p0=ROW.P0(row=row0.row), p1=ROW.P0(row=row1.row))[0]
+        p1 = ROW.SORT(p0=ROW.P1(row=row0.row), p1=ROW.P1(row=row1.row))[1]
+
+        hi, lo = (row0, row1) if int(row0.rid) > int(row1.rid) else (row1, row0)
+
+        self.remove(row=hi)
+        self.remove(row=lo)
+
+        mat_name = self.mat.name(mid=int(row0.mid))
+        newrow = self.insert(p0=p0, p1=p1, mat=mat_name)
+
+        array, arids = self.reqs(n=1)
+        array[int(newrow.mid)][0] = newrow.row
+        arids[int(newrow.mid)] = 1
+        return (array, arids)
+
+    def boxes(self, mid: int = None) -> NDARR:
+        """
+        (n, 6) int64 boxes (x0, y0, z0, x1, y1, z1) of all rows of one material, rid order.
+        """
+        rows = self.array[mid][:self.arids[mid]]
+        return np.concatenate((rows[:, ROW.IDS_X0[0], :3], rows[:, ROW.IDS_X1[0], :3]), axis=1).astype(np.int64)
+
+    def joinax(self, mid: int = None, axis: int = None) -> NDARR:
+        """
+        Vectorized face join of one material on one axis.
+        RETURN: nxt (n,) -> nxt[i] = rid whose min face equals the max face of rid i, else -1
+        (faces are unique per side -> every row has at most one nxt and one prev)
+        """
+        n = self.arids[mid]
+        nxt = np.full(n, -1, dtype=np.int64)
+        if n < 2:
+            return nxt
+
+        boxes = self.boxes(mid=mid)
+        mids = np.full(n, mid, dtype=np.int64)
+        loA, loB = MDX.keys(mids, boxes, axis, 0)
+        hiA, hiB = MDX.keys(mids, boxes, axis, 1)
+
+        # sort all 2n faces by key, min faces (tag 0) before max faces (tag 1) on equal keys
+        A = np.concatenate((loA, hiA))
+        B = np.concatenate((loB, hiB))
+        tag = np.concatenate((np.zeros(n, dtype=np.int8), np.ones(n, dtype=np.int8)))
+        rid = np.concatenate((np.arange(n), np.arange(n)))
+        order = np.lexsort((tag, B, A))
+        A, B, tag, rid = A[order], B[order], tag[order], rid[order]
+
+        same = (A[1:] == A[:-1]) & (B[1:] == B[:-1])
+        k = np.flatnonzero(same)
+        nxt[rid[k+1]] = rid[k]      # k = min face of rid[k], k+1 = max face of rid[k+1]
+        return nxt
+
+    def runs(self, mid: int = None, axis: int = None) -> list[tuple[POS, POS, list[int]]]:
+        """
+        Maximal merge runs of one material on one axis (chains of joinax pairs).
+        RETURN: [(p0, p1, member rids), ...] -> runs are disjoint, every run collapses into ONE box
+        """
+        nxt = self.joinax(mid=mid, axis=axis)
+        linked = nxt >= 0
+        if not linked.any():
+            return []
+
+        prev = np.full(len(nxt), -1, dtype=np.int64)
+        prev[nxt[linked]] = np.flatnonzero(linked)
+        heads = np.flatnonzero(linked & (prev < 0))
+        boxes = self.boxes(mid=mid)
+
+        out: list[tuple[POS, POS, list[int]]] = []
+        for head in heads.tolist():
+            last = head
+            members = [head]
+            while nxt[last] >= 0:
+                last = int(nxt[last])
+                members.append(last)
+            p0 = tuple(boxes[head, :3].tolist())
+            p1 = list(boxes[head, 3:].tolist())
+            p1[axis] = int(boxes[last, 3 + axis])
+            out.append((p0, tuple(p1), members))
+        return out
+
+    def mergeruns(self, mid: int = None, runs: list[tuple[POS, POS, list[int]]] = None) -> REQS:
+        """
+        Collapse disjoint runs of one material: all removes (highest rid first), then all inserts.
+        """
+        array, arids = self.reqs(n=max(1, len(runs)))
+        mat = self.mat.name(mid=mid)
+
+        # highest rid first: remove() swaps the LAST row into the hole, so pending members never move
+        members = [rid for _, _, m in runs for rid in m]
+        for rid in sorted(members, reverse=True):
+            self.remove(row=Row(mid=mid, rid=rid, row=self.array[mid][rid]))
+        for p0, p1, _ in runs:
+            newrow = self.insert(p0=p0, p1=p1, mat=mat)
+            array[mid][arids[mid]] = newrow.row
+            arids[mid] += 1
+
+        return (array, arids)
+
+    def mergeax(self, mat: str = None, axis: int = None) -> REQS:
+        """
+        Bulk merge of one material along one axis:
+        - one sort based join finds every exact face pair at once (joinax)
+        - pairs chain into runs (each row has at most one nxt/prev) -> runs are disjoint,
+          every run collapses into ONE box in a single batch of removes + inserts
+        - a run is maximal, so one pass per axis is enough
+        """
+        if mat is None:
+            raise ValueError("mergeax requires mat")
+        if axis is None:
+            raise ValueError("mergeax requires axis")
+
+        mid = int(self.mat.mid(name=mat))
+        return self.mergeruns(mid=mid, runs=self.runs(mid=mid, axis=axis))
+
+    @staticmethod
+    def score(p0: POS = None, p1: POS = None, n: int = 2, partners: int = 0) -> tuple[int, int, int]:
+        """
+        Merge candidate score, compared as a tuple (higher is better):
+        (exact face partners the merged box has, rows collapsed, volume of the merged box)
+        """
+        size = [int(p1[i]) - int(p0[i]) for i in (0,1,2)]
+        return (partners, n, size[0] * size[1] * size[2])
+
+    def mergebest(self, mat: str = None) -> REQS:
+        """
+        Best candidate merge of one material:
+        - candidates = the maximal runs of all three axes (utils.runs.Runs, built ONCE)
+        - score: a run whose merged box meets another row face to face opens the next merge
+          -> partners first, then longer runs (see score())
+        - best first: runs popped in score order join ONE batch while they touch no face the
+          batch changes (their chain and score are still exact), the first that does flushes it:
+          mergeruns, then the removed / created boxes go back to the table (only the runs around
+          them are walked / scored again), the run is queued again
+        ties break on (axis, head box) -> same world in, same world out
+        """
+        if mat is None:
+            raise ValueError("mergebest requires mat")
+
+        mid = int(self.mat.mid(name=mat))
+        array, arids = self.reqs(n=self.nrows(mid=mid))
+        table = Runs(mid=mid, boxes=self.boxes(mid=mid), runs=[[m for _, _, m in self.runs(mid=mid, axis=ax)] for ax in (0,1,2)],
+                     score=ROWS.score)
+
+        batch: list[tuple[BOX, list[BOX]]] = []
+        dirty: set[tuple[int, int]] = set()
+        while True:
+            run = table.pop()
+            if run is not None:
+                keys = table.touched(run=run)
+                if dirty.isdisjoint(keys):
+                    batch.append(table.get(run=run))
+                    dirty.update(keys)
+                    continue
+            if not batch:
+                break
+
+            runs = [(merged[:3], merged[3:], [table.rid[m] for m in members]) for merged, members in batch]
+            created, carids = self.mergeruns(mid=mid, runs=runs)
+            for i in range(carids[mid]):
+                array[mid][arids[mid]] = created[mid][i]
+                arids[mid] += 1
+
+            # removes swapped rows into the freed slots, inserts may reuse them -> read them back
+            for rid in sorted({rid for _, _, rids in runs for rid in rids} | set(created[mid][:carids[mid], *ROW.IDS_RID].tolist())):
+                if rid < self.arids[mid]:
+                    r = self.array[mid][rid]
+                    table.rid[tuple(int(v) for v in ROW.P0(row=r) + ROW.P1(row=r))] = rid
+            table.update(removed=[m for _, members in batch for m in members], created=[merged for merged, _ in batch])
+            batch, dirty = [], set()
+            if run is not None:
+                table.requeue(run=run)
+
+        return (array, arids)
+
+    def mergemat(self, mat: str = None) -> REQS:
+        """
+        Bulk merge one material on x, y, z until a full round merges nothing
+        (runs on one axis can open new exact faces on the others).
+        """
+        if mat is None:
+            raise ValueError("mergemat requires mat")
+
+        mid = int(self.mat.mid(name=mat))
+        array, arids = self.reqs(n=self.nrows(mid=mid))
+
+        merged = True
+        while merged:
+            merged = False
+            for ax in (0,1,2):
+                created, carids = self.mergeax(mat=mat, axis=ax)
+                if carids[mid] <= 0:
+                    continue
+                merged = True
+                for i in range(carids[mid]):
+                    array[mid][arids[mid]] = created[mid][i]
+                    arids[mid] += 1
+
+        return (array, arids)
+
+    @staticmethod
+    def greedy(grid: NDARR = None) -> list[tuple[int, int, int, int, int, int, int]]:
+        """
+        Greedy meshing of a 3D grid of material ids (-1 = not ours):
+        grow each free cell along axis 0, then 1, then 2 while the material stays the same.
+        RETURN: [(mid, i0, i1, j0, j1, k0, k1), ...] half open cell ranges
+        """
+        nx, ny, nz = grid.shape
+        done = grid < 0
+        out = []
+        for k, j, i in np.argwhere(~done.transpose(2, 1, 0)).tolist():
+            if done[i, j, k]:
+                continue
+            m = grid[i, j, k]
+            i1 = i + 1
+            while i1 < nx and not done[i1, j, k] and grid[i1, j, k] == m:
+                i1 += 1
+            j1 = j + 1
+            while j1 < ny and not done[i:i1, j1, k].any() and (grid[i:i1, j1, k] == m).all():
+                j1 += 1
+            k1 = k + 1
+            while k1 < nz and not done[i:i1, j:j1, k1].any() and (grid[i:i1, j:j1, k1] == m).all():
+                k1 += 1
+            done[i:i1, j:j1, k:k1] = True
+            out.append((int(m), i, i1, j, j1, k, k1))
+        return out
+
+    def remesh(self, p0: POS = None, p1: POS = None) -> REQS:
+        """
+        Replace every row lying fully inside [p0, p1) by a near minimal set of boxes:
+        - coordinate compression on the row bounds -> small grid of material ids
+        - greedy meshing with each axis as the first growth axis, keep the fewest boxes
+        - only applied when it lowers the row count; all removes, then all inserts
+        RETURN: the created rows
+        """
+        if p0 is None or p1 is None:
+            raise ValueError("remesh requires p0,p1")
+        with self.lock, self.batch():
+            return self._remesh(p0=p0, p1=p1)
+
+    def _remesh(self, p0: POS = None, p1: POS = None) -> REQS:
+        if p0 is None or p1 is None:
+            raise ValueError("remesh requires p0,p1")
+        p0, p1 = ROW.SORT(p0=p0, p1=p1)
+        lo = np.array([int(v) for v in p0], dtype=np.int64)
+        hi = np.array([int(v) for v in p1], dtype=np.int64)
+
+        inside: list[tuple[int, NDARR, NDARR]] = []     # (mid, rids, boxes)
+        for mid in range(MATERIALS.NUM):
+            boxes = self.boxes(mid=mid)
+            keep = np.flatnonzero((boxes[:, :3] >= lo).all(axis=1) & (boxes[:, 3:] <= hi).all(axis=1))
+            if keep.size:
+                inside.append((mid, keep, boxes[keep]))
+        count = sum(len(rids) for _, rids, _ in inside)
+        if count < 2:
+            return self.reqs(n=0)
+
+        allboxes = np.concatenate([b for _, _, b in inside])
+        axes = [np.unique(np.concatenate((allboxes[:, ax], allboxes[:, ax+3]))) for ax in (0,1,2)]
+        shape = tuple(len(a) - 1 for a in axes)
+        if shape[0] * shape[1] * shape[2] > ROWS.CELLS:
+            raise ValueError(f"remesh region too fragmented: {shape} cells > ROWS.CELLS")
+
+        grid = np.full(shape, -1, dtype=np.int16)
+        for mid, _, boxes in inside:
+            idx = [np.searchsorted(axes[ax % 3], boxes[:, ax]) for ax in range(6)]
+            for i0, j0, k0, i1, j1, k1 in zip(*(i.tolist() for i in idx)):
+                grid[i0:i1, j0:j1, k0:k1] = mid
+
+        best = None
+        for order in ((0,1,2), (1,2,0), (2,0,1)):
+            cells = []
+            for c in ROWS.greedy(grid=grid.transpose(order)):
+                r = [(c[1+2*t], c[2+2*t]) for t in range(3)]      # ranges on the transposed axes
+                i, j, k = (r[order.index(ax)] for ax in (0,1,2))
+                cells.append((c[0], *i, *j, *k))
+            if best is None or len(cells) < len(best):
+                best = cells
+        if len(best) >= count:
+            return self.reqs(n=0)
+
+        # highest rid first: remove() swaps the LAST row into the hole, so pending rows never move
+        for mid, rids, _ in inside:
+            for rid in sorted(rids.tolist(), reverse=True):
+                self.remove(row=Row(mid=mid, rid=rid, row=self.array[mid][rid]))
+
+        array, arids = self.reqs(n=len(best))
+        for m, i0, i1, j0, j1, k0, k1 in best:
+            q0 = (int(axes[0][i0]), int(axes[1][j0]), int(axes[2][k0]))
+            q1 = (int(axes[0][i1]), int(axes[1][j1]), int(axes[2][k1]))
+            newrow = self.insert(p0=q0, p1=q1, mat=self.mat.name(mid=m))
+            array[m][arids[m]] = newrow.row
+            arids[m] += 1
+        return (array, arids)
+
+    def mergerows(self, rows: NDARR = None) -> REQS:
+        # unchanged except mdx neighbor lookups now use _partner_row (ADJ | MDX)
+        if rows is None:
+            return self.reqs(n=0)
+
+        mids_present: set[int] = set()
+        for mid in range(rows.shape[0]):
+            for i in range(rows.shape[1]):
+                if rows[mid][i][*ROW.IDS_RID] != ROW.SENTINEL:
+                    mids_present.add(mid)
+                    break
+
+        worst = 0
+        for mid in mids_present:
+            worst += self.nrows(mid=mid)
+
+        array, arids = self.reqs(n=worst)
+
+        while True:
+            merged_this_round = 0
+
+            for ax in (0,1,2):
+                extra: list[tuple[int,int]] = []
+                for mid in mids_present:
+                    for rid in range(self.arids[mid]-1, -1, -1):
+                        extra.append((mid,rid))
+
+                seen: set[tuple[int,int]] = set()
+
+                while extra:
+                    mid,rid = extra.pop()
+                    if rid < 0 or rid >= self.arids[mid]:
+                        continue
+
+                    key = (mid,rid)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                    row0 = Row(mid=mid, rid=rid, row=self.array[mid][rid])
+                    row1 = self._partner_row(row=row0, axis=ax)
+                    if row1 is None:
+                        continue
+
+                    created, carids = self.merge2(row0=row0, row1=row1)
+                    if carids[mid] > 0:
+                        array[mid][arids[mid]] = created[mid][0]
+                        arids[mid] += 1
+                        merged_this_round += 1
+
+                        new_rid = self.arids[mid] - 1
+                        extra.append((mid, int(new_rid)))
+                        seen.discard((mid,rid))
+                        extra.append((mid,rid))
+
+            if merged_this_round == 0:
+                break
+
+        return (array, arids)
+
+    def resolve(self, mid: int = None, rid: int = None, box: tuple[int, ...] = None) -> Row | None:
+        """
+        Live row holding exactly `box` in material `mid`, or None if it is gone.
+        The rid hint is checked against the array first (the common case: nothing moved it),
+        only a stale hint costs a BVH search at p0 (+ a flush of the pending BVH jobs).
+        """
+        if 0 <= rid < self.arids[mid]:
+            row = self.array[mid][rid]
+            if tuple(int(v) for v in ROW.P0(row=row) + ROW.P1(row=row)) == box:
+                return Row(mid=mid, rid=rid, row=row)
+        hit = self._bvh_search_row(box[:3])
+        if int(hit.mid) != mid or tuple(int(v) for v in ROW.P0(row=hit.row) + ROW.P1(row=hit.row)) != box:
+            return None
+        return hit
+
+    def mergelocal(self, rows: NDARR = None) -> REQS:
+        """
+        Merge outward from the rows of a batch only (the rows an edit created):
+        - worklist of boxes, not rids -> swap removes move rids, boxes stay put
+        - each box is resolved to its live row (resolve: rid hint, else a BVH search at its p0),
+          boxes that were merged away in the meantime are skipped
+        - MDX gives the exact face neighbor per axis, the policy picks one (best score | first axis),
+          every merged box goes back on the worklist
+        cost ~ merges around the edit, not the number of rows of the materials involved
+        """
+        if rows is None:
+            return self.reqs(n=0)
+
+        work: list[tuple[int, int, tuple[int, ...]]] = []
+        for mid in range(rows.shape[0]):
+            live = rows[mid][rows[mid][:, *ROW.IDS_RID] != ROW.SENTINEL]
+            for r in live:
+                work.append((mid, int(ROW.RID(row=r)), tuple(int(v) for v in ROW.P0(row=r) + ROW.P1(row=r))))
+
+        created: list[tuple[int, NDARR]] = []
+        while work:
+            mid, rid, box = work.pop()
+            with self.lock:     # ONE step: resolve, neighbors, merge
+                hit = self.resolve(mid=mid, rid=rid, box=box)
+                if hit is None:
+                    continue
+
+                best, top = None, None
+                for ax in (0,1,2):
+                    row1 = self._partner_row(row=hit, axis=ax)
+                    if row1 is None:
+                        continue
+                    if self.policy == "axis":
+                        best = row1
+                        break
+                    p0 = ROW.SORT(p0=ROW.P0(row=hit.row), p1=ROW.P0(row=row1.row))[0]
+                    p1 = ROW.SORT(p0=ROW.P1(row=hit.row), p1=ROW.P1(row=row1.row))[1]
+                    s = ROWS.score(p0=p0, p1=p1)
+                    if top is None or s > top:
+                        best, top = row1, s
+                if best is None:
+                    continue
+                merged, marids = self.merge2(row0=hit, row1=best)
+            if marids[mid] > 0:
+                newrow = merged[mid][0]
+                created.append((mid, newrow))
+                work.append((mid, int(ROW.RID(row=newrow)), tuple(int(v) for v in ROW.P0(row=newrow) + ROW.P1(row=newrow))))
+
+        array, arids = self.reqs(n=max(1, len(created)))
+        for mid, newrow in created:
+            array[mid][arids[mid]] = newrow
+            arids[mid] += 1
+        return (array, arids)
+
+    def mergeall(self) -> REQS:
+        array, arids = self.reqs(n=self.total)
+        for mat in self.mat.names():
+            created, carids = self.mergebest(mat=mat) if self.policy == "best" else self.mergemat(mat=mat)
+            for mid in range(MATERIALS.NUM):
+                for i in range(carids[mid]):
+                    array[mid][arids[mid]] = created[mid][i]
+                    arids[mid] += 1
+        return (array, arids)
+
+    def merge(self, rows: NDARR = None, local: bool = True) -> REQS:
+        """
+        rows None -> mergeall()
+        local     -> mergelocal(rows): only the neighborhood of the given rows
+        else      -> mergerows(rows): full scan of every material present in rows
+        """
+        with self.lock, self.batch():
+            if rows is None:
+                return self.mergeall()
+            return self.mergelocal(rows=rows) if local else self.mergerows(rows=rows)
+
+    def close(self) -> None:
+        """
+        Shared storage (shm): unlink the block, the rows stay usable as a private copy.
+        Attached readers keep their mapping until they close.
+        Also shuts down the asyncio edit thread (a later aexec() starts a new one).
+        """
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+            self.pool = None
+        with self.lock:
+            if self.shared is not None:
+                self.shared.close()
+                self.array = self.shared.array
+                self.shared = None
+
+    def stats(self) -> str:
+        sizes = []
+        for mid in range(MATERIALS.NUM):
+            mat = self.mat.name(mid=mid)
+            rows = self.nrows(mid=mid)
+            for rid in range(self.arids[mid]):
+                sizes.append((rows, mat, ROW.VOLUME(row=self.array[mid][rid])))
+        volume = self.volume()
+        stats = []
+        for r, m, s in sizes:
+            stats.append({
+                "mat": m,
+                "rows": r,
+                "vol": int(s),
+                "perc": (s / volume * 100) if volume > 0 else 0.0,
+            })
+        string = "ROWS STATS:\n"
+        string += f"  TOTAL VOLUME: {volume}\n"
+        for entry in stats:
+            string += f"  MAT={entry['mat']:10s} ROWS={entry['rows']:6d} VOL={entry['vol']:12d} PERC={entry['perc']:6.2f}%\n"
+        return string
+
+    def __repr__(self) -> str:
+        return self.stats()
+
+    def __str__(self) -> str:
+        return self.stats()
@@ -0,0 +1,258 @@
+# world/shards.py
+from __future__ import annotations
+from typing import Any
+from contextlib import contextmanager
+
+import bisect
+import multiprocessing as mp
+
+from world.row import ROW
+from world.rows import ROWS
+from utils.types import POS, NDARR
+
+BOX = tuple[POS, POS]
+
+
+def serve(conn: Any = None, p0: POS = None, p1: POS = None, kwargs: dict = None) -> None:
+    """
+    Shard worker process: owns ONE ROWS over [p0, p1) and answers (name, args) requests until None.
+    Replies (True, result) or (False, exception). Edits reply created row counts per mid only,
+    the rows themselves stay in the shard.
+    """
+    rows = ROWS(p0=p0, p1=p1, **(kwargs or {}))
+    while True:
+        msg = conn.recv()
+        if msg is None:
+            break
+        name, args = msg
+        try:
+            if name == "splits":
+                out = [dict(rows.split(**a)[1]) for a in args]
+            elif name == "searches":
+                out = []
+                for pos in args:
+                    try:
+                        out.append(rows.search(pos=pos))
+                    except LookupError:
+                        out.append(None)
+            elif name == "merge":
+                out = dict(rows.merge()[1])
+            elif name in ("volume", "nrows", "boxes"):
+                out = getattr(rows, name)(**args)
+            elif name == "total":
+                out = rows.total
+            else:
+                raise ValueError(f"shard: unknown request {name!r}")
+            conn.send((True, out))
+        except Exception as e:
+            conn.send((False, e))
+    conn.close()
+
+
+class SHARDS:
+    """
+    Sharded world front-end: the x/y plane is cut into nx * ny regions, each region is owned by
+    a worker process with its own ROWS (+ BVH + MDX), so edits of different regions use different cores.
+
+    - search(pos) -> routed to the owner of pos
+    - split(pos, pos1, mat) -> the box is clipped per region, every piece goes to its owner
+      (edits straddling a border touch several shards, rows never cross a border)
+    - splits([...]) / searches([...]) -> grouped per shard, all shards work in parallel
+    - batch() -> context: split() calls are collected and sent as ONE splits() on exit
+    - merge() / volume(mat) / nrows(mat) / total -> every shard, summed
+    - search returns (mat, rid, row copy), rid is local to the owning shard
+    """
+    METHOD = "spawn"    # no fork of a threaded parent
+
+    def __init__(self, nx: int = 2, ny: int = 2, p0: POS = None, p1: POS = None,
+                 method: str = METHOD, **kwargs) -> None:
+        if nx < 1 or ny < 1:
+            raise ValueError("SHARDS(): nx and ny must be >= 1")
+        self.p0 = tuple(int(v) for v in p0) if p0 is not None else (ROW.XMIN, ROW.YMIN, ROW.ZMIN)
+        self.p1 = tuple(int(v) for v in p1) if p1 is not None else (ROW.XMAX, ROW.YMAX, ROW.ZMAX)
+        if self.p1[0] - self.p0[0] < nx or self.p1[1] - self.p0[1] < ny:
+            raise ValueError("SHARDS(): world too small for the shard grid")
+        self.nx = nx
+        self.ny = ny
+
+        # region cuts: xs[i] <= x < xs[i+1]
+        self.xs = [self.p0[0] + (self.p1[0] - self.p0[0]) * i // nx for i in range(nx + 1)]
+        self.ys = [self.p0[1] + (self.p1[1] - self.p0[1]) * j // ny for j in range(ny + 1)]
+
+        self.pending: list[dict] = []
+        self.batching = 0
+
+        ctx = mp.get_context(method)
+        self.conns = []
+        self.procs = []
+        for i in range(nx):
+            for j in range(ny):
+                q0, q1 = self.region(i=i, j=j)
+                mine, theirs = ctx.Pipe()
+                proc = ctx.Process(target=serve, args=(theirs, q0, q1, kwargs), daemon=True)
+                proc.start()
+                theirs.close()
+                self.conns.append(mine)
+                self.procs.append(proc)
+
+    # ============================================================
+    # layout
+    # ============================================================
+
+    def region(self, i: int = None, j: int = None) -> BOX:
+        return ((self.xs[i], self.ys[j], self.p0[2]), (self.xs[i+1], self.ys[j+1], self.p1[2]))
+
+    def owner(self, pos: POS = None) -> int:
+        x, y = int(pos[0]), int(pos[1])
+        if not (self.p0[0] <= x < self.p1[0] and self.p0[1] <= y < self.p1[1]):
+            raise LookupError(f"position {pos} outside the sharded world")
+        i = bisect.bisect_right(self.xs, x) - 1
+        j = bisect.bisect_right(self.ys, y) - 1
+        return i * self.ny + j
+
+    def clip(self, p0: POS = None, p1: POS = None) -> list[tuple[int, POS, POS]]:
+        # [p0, p1) -> [(shard, q0, q1), ...] pieces inside each touched region
+        p0, p1 = ROW.SORT(p0=p0, p1=p1)
+        p0 = tuple(int(v) for v in p0)
+        p1 = tuple(int(v) for v in p1)
+        i0 = max(0, bisect.bisect_right(self.xs, p0[0]) - 1)
+        i1 = min(self.nx - 1, bisect.bisect_right(self.xs, p1[0] - 1) - 1)
+        j0 = max(0, bisect.bisect_right(self.ys, p0[1]) - 1)
+        j1 = min(self.ny - 1, bisect.bisect_right(self.ys, p1[1] - 1) - 1)
+
+        out = []
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                r0, r1 = self.region(i=i, j=j)
+                q0 = tuple(max(p0[k], r0[k]) for k in (0,1,2))
+                q1 = tuple(min(p1[k], r1[k]) for k in (0,1,2))
+                if all(q0[k] < q1[k] for k in (0,1,2)):
+                    out.append((i * self.ny + j, q0, q1))
+        return out
+
+    # ============================================================
+    # transport
+    # ============================================================
+
+    def send(self, shard: int = None, name: str = None, args: Any = None) -> None:
+        self.conns[shard].send((name, args))
+
+    def recv(self, shard: int = None) -> Any:
+        ok, out = self.conns[shard].recv()
+        if not ok:
+            raise out
+        return out
+
+    def call(self, shard: int = None, name: str = None, args: Any = None) -> Any:
+        self.send(shard=shard, name=name, args=args)
+        return self.recv(shard=shard)
+
+    def scatter(self, work: dict[int, tuple[str, Any]] = None) -> dict[int, Any]:
+        # send everything first, then collect -> the shards run in parallel
+        for shard, (name, args) in work.items():
+            self.send(shard=shard, name=name, args=args)
+        return {shard: self.recv(shard=shard) for shard in work}
+
+    def broadcast(self, name: str = None, args: Any = None) -> list[Any]:
+        out = self.scatter(work={s: (name, args) for s in range(len(self.conns))})
+        return [out[s] for s in range(len(self.conns))]
+
+    # ============================================================
+    # world API
+    # ============================================================
+
+    def search(self, pos: POS = None) -> tuple[str, int, NDARR]:
+        if pos is None:
+            raise ValueError("search requires pos")
+        hit = self.call(shard=self.owner(pos=pos), name="searches", args=[pos])[0]
+        if hit is None:
+            raise LookupError("shard search returned no result")
+        return hit
+
+    def searches(self, pos: list[POS] = None) -> list[tuple[str, int, NDARR] | None]:
+        groups: dict[int, list[int]] = {}
+        for k, p in enumerate(pos):
+            groups.setdefault(self.owner(pos=p), []).append(k)
+        got = self.scatter(work={s: ("searches", [pos[k] for k in ks]) for s, ks in groups.items()})
+        out: list = [None] * len(pos)
+        for s, ks in groups.items():
+            for k, hit in zip(ks, got[s]):
+                out[k] = hit
+        return out
+
+    def split(self, pos: POS = None, pos1: POS = None, mat: str = None) -> dict[int, int]:
+        if mat is None:
+            raise ValueError("material must be specified")
+        if pos is None and pos1 is None:
+            raise ValueError("either pos or pos1 must be provided")
+        if pos is None or pos1 is None:
+            pos = pos if pos is not None else pos1
+            pos1 = (pos[0]+1, pos[1]+1, pos[2]+1)
+
+        edit = {"pos": pos, "pos1": pos1, "mat": mat}
+        if self.batching:
+            self.pending.append(edit)
+            return {}
+        return self.splits(edits=[edit])
+
+    def splits(self, edits: list[dict] = None) -> dict[int, int]:
+        """
+        edits: [{"pos": p0, "pos1": p1, "mat": mat}, ...] -> created row counts per mid, summed.
+        """
+        groups: dict[int, list[dict]] = {}
+        for e in edits:
+            for shard, q0, q1 in self.clip(p0=e["pos"], p1=e["pos1"]):
+                groups.setdefault(shard, []).append({"pos": q0, "pos1": q1, "mat": e["mat"]})
+
+        counts: dict[int, int] = {}
+        for out in self.scatter(work={s: ("splits", g) for s, g in groups.items()}).values():
+            for arids in out:
+                for mid, n in arids.items():
+                    counts[mid] = counts.get(mid, 0) + n
+        return counts
+
+    @contextmanager
+    def batch(self):
+        self.batching += 1
+        try:
+            yield self
+        finally:
+            self.batching -= 1
+            if self.batching == 0 and self.pending:
+                edits, self.pending = self.pending, []
+                self.splits(edits=edits)
+
+    def merge(self) -> dict[int, int]:
+        counts: dict[int, int] = {}
+        for arids in self.broadcast(name="merge"):
+            for mid, n in arids.items():
+                counts[mid] = counts.get(mid, 0) + n
+        return counts
+
+    def volume(self, mat: str = None) -> int:
+        return sum(self.broadcast(name="volume", args={"mat": mat}))
+
+    def nrows(self, mat: str = None) -> int:
+        return sum(self.broadcast(name="nrows", args={"mat": mat}))
+
+    @property
+    def total(self) -> int:
+        return sum(self.broadcast(name="total"))
+
+    def close(self) -> None:
+        for conn in self.conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self.procs:
+            proc.join(timeout=10)
+        for conn in self.conns:
+            conn.close()
+        self.conns, self.procs = [], []
+
+    def __enter__(self) -> "SHARDS":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
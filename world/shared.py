@@ -0,0 +1,232 @@
+# world/shared.py
+from __future__ import annotations
+from typing import Any, Callable
+
+from multiprocessing import shared_memory, resource_tracker
+import time
+
+import numpy as np
+
+from world.row import ROW
+from world.materials import Materials, MATERIALS
+from utils.types import POS, NDARR
+
+
+class SharedRows:
+    """
+    Writer side: the ROWS row storage in ONE multiprocessing.shared_memory block (ROWS(shm=True)).
+
+    - layout: header (HEADER uint64 words) | rows (MATERIALS.NUM, size, *ROW.SHAPE) ROW.DTYPE
+    - header: magic, epoch, NUM, size, world p0 (3), world p1 (3), total, row count per material
+    - seqlock: begin() makes the epoch odd before rows change, end(counts) publishes the counts
+      and makes it even again -> a reader that saw the same even epoch before and after its
+      read did not overlap a change (RowsReader.read)
+    - the owner unlinks the block on close(), attached readers keep their mapping until they close
+    """
+    MAGIC = 0x524F5753          # "ROWS"
+    HEADER = 64                 # uint64 words, keeps the rows 512 byte aligned
+    I_MAGIC = 0
+    I_EPOCH = 1
+    I_NUM = 2
+    I_SIZE = 3
+    I_P0 = 4
+    I_P1 = 7
+    I_TOTAL = 10
+    I_COUNTS = 11
+
+    def __init__(self, size: int = None, p0: POS = None, p1: POS = None, name: str = None) -> None:
+        if SharedRows.I_COUNTS + MATERIALS.NUM > SharedRows.HEADER:
+            raise ValueError("SharedRows: too many materials for the header")
+        shape = (MATERIALS.NUM, size, *ROW.SHAPE)
+        nbytes = SharedRows.HEADER * 8 + int(np.prod(shape)) * np.dtype(ROW.DTYPE).itemsize
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=nbytes)
+        self.name = self.shm.name
+
+        self.header = np.ndarray((SharedRows.HEADER,), dtype=np.uint64, buffer=self.shm.buf)
+        self.array = np.ndarray(shape, dtype=ROW.DTYPE, buffer=self.shm.buf, offset=SharedRows.HEADER * 8)
+        self.array[...] = ROW.SENTINEL
+
+        self.header[:] = 0
+        self.header[SharedRows.I_NUM] = MATERIALS.NUM
+        self.header[SharedRows.I_SIZE] = size
+        self.header[SharedRows.I_P0:SharedRows.I_P0+3] = p0
+        self.header[SharedRows.I_P1:SharedRows.I_P1+3] = p1
+        self.header[SharedRows.I_MAGIC] = SharedRows.MAGIC      # last -> readers never see a half built header
+
+    def epoch(self) -> int:
+        return int(self.header[SharedRows.I_EPOCH])
+
+    def begin(self) -> None:
+        self.header[SharedRows.I_EPOCH] += np.uint64(1)
+
+    def end(self, arids: dict[int, int] = None, total: int = None) -> None:
+        counts = self.header[SharedRows.I_COUNTS:SharedRows.I_COUNTS+MATERIALS.NUM]
+        counts[:] = [arids[mid] for mid in range(MATERIALS.NUM)]
+        self.header[SharedRows.I_TOTAL] = total
+        self.header[SharedRows.I_EPOCH] += np.uint64(1)
+
+    def close(self) -> None:
+        # the ROWS keeps using its rows as a private copy
+        self.array = self.array.copy()
+        self.header = self.header.copy()
+        try:
+            self.shm.close()
+        except BufferError:
+            pass    # a row view still points into the block -> the mapping lives until it is dropped
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def attach(name: str = None) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing block WITHOUT registering it with this process's resource tracker:
+    before Python 3.13 every attach is registered, and the tracker of a reader process started
+    on its own unlinks the block (under the writer's feet) when that reader exits.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)     # Python >= 3.13
+    except TypeError:
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class RowsReader:
+    """
+    Read only view of a ROWS(shm=True) storage from any process, attached by name, zero copies.
+
+    - counts() / total() / epoch() -> the published header
+    - view(mid) -> read only NumPy view of the live rows of one material (no copy, may tear)
+    - read(fn) -> fn(reader) under the seqlock: retried until no edit overlapped it, so fn sees
+      ONE consistent world (torn -> reads that had to be retried)
+    - rows(mid) / boxes(mid) / volume(mat) / search(pos) -> consistent reads built on read()
+    """
+    TIMEOUT = 10.0      # seconds read() keeps retrying
+    SPIN = 0.0005       # seconds between retries while an edit is running
+
+    def __init__(self, name: str = None) -> None:
+        if name is None:
+            raise ValueError("RowsReader requires the shared memory name (ROWS.shm)")
+        self.shm = attach(name=name)
+        self.name = name
+        self.header = np.ndarray((SharedRows.HEADER,), dtype=np.uint64, buffer=self.shm.buf)
+        if int(self.header[SharedRows.I_MAGIC]) != SharedRows.MAGIC:
+            self.shm.close()
+            raise ValueError(f"RowsReader: '{name}' is not a ROWS storage")
+        num = int(self.header[SharedRows.I_NUM])
+        size = int(self.header[SharedRows.I_SIZE])
+        self.array = np.ndarray((num, size, *ROW.SHAPE), dtype=ROW.DTYPE, buffer=self.shm.buf, offset=SharedRows.HEADER * 8)
+        self.array.flags.writeable = False
+        self.header.flags.writeable = False
+
+        self.mat = Materials()
+        self.p0 = tuple(int(v) for v in self.header[SharedRows.I_P0:SharedRows.I_P0+3])
+        self.p1 = tuple(int(v) for v in self.header[SharedRows.I_P1:SharedRows.I_P1+3])
+        self.reads = 0
+        self.torn = 0
+
+    # ============================================================
+    # header
+    # ============================================================
+
+    def epoch(self) -> int:
+        return int(self.header[SharedRows.I_EPOCH])
+
+    def counts(self) -> dict[int, int]:
+        counts = self.header[SharedRows.I_COUNTS:SharedRows.I_COUNTS+len(self.array)].tolist()
+        return {mid: int(n) for mid, n in enumerate(counts)}
+
+    def total(self) -> int:
+        return int(self.header[SharedRows.I_TOTAL])
+
+    def view(self, mid: int = None, n: int = None) -> NDARR:
+        return self.array[mid][:(self.counts()[mid] if n is None else n)]
+
+    # ============================================================
+    # consistent reads
+    # ============================================================
+
+    def read(self, fn: Callable[["RowsReader", dict[int, int]], Any] = None, timeout: float = TIMEOUT) -> Any:
+        """
+        fn(reader, counts) -> result, with counts the published row count per material.
+        Only results whose epoch was even and unchanged around fn are returned; fn must COPY
+        what it keeps (views change with the next edit).
+        """
+        deadline = time.perf_counter() + timeout
+        while True:
+            e0 = self.epoch()
+            if e0 % 2 == 0:
+                try:
+                    out = fn(self, self.counts())
+                except Exception:
+                    if self.epoch() == e0:
+                        raise       # a real error, not a torn read
+                else:
+                    if self.epoch() == e0:
+                        self.reads += 1
+                        return out
+            self.torn += 1
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"RowsReader: no consistent read of '{self.name}' in {timeout}s")
+            time.sleep(RowsReader.SPIN)
+
+    def rows(self, mid: int = None) -> NDARR:
+        return self.read(lambda r, counts: r.array[mid][:counts[mid]].copy())
+
+    def boxes(self, mid: int = None) -> NDARR:
+        def fn(r: RowsReader, counts: dict[int, int]) -> NDARR:
+            rows = r.array[mid][:counts[mid]]
+            return np.concatenate((rows[:, ROW.IDS_X0[0], :3], rows[:, ROW.IDS_X1[0], :3]), axis=1).astype(np.int64)
+        return self.read(fn)
+
+    def volume(self, mat: str = None) -> int:
+        mids = range(len(self.array)) if mat is None else (self.mat.mid(name=mat),)
+
+        def fn(r: RowsReader, counts: dict[int, int]) -> int:
+            total = 0
+            for mid in mids:
+                rows = r.array[mid][:counts[mid]]
+                ext = rows[:, ROW.IDS_X1[0], :3].astype(np.int64) - rows[:, ROW.IDS_X0[0], :3].astype(np.int64)
+                total += int(ext.prod(axis=1).sum())
+            return total
+        return self.read(fn)
+
+    def search(self, pos: POS = None) -> tuple[str, int, NDARR]:
+        """
+        Row containing pos (vectorized scan, no index in the reader) -> (mat, rid, row copy).
+        """
+        q = np.array([int(v) for v in pos], dtype=ROW.DTYPE)
+
+        def fn(r: RowsReader, counts: dict[int, int]) -> tuple[int, int, NDARR] | None:
+            for mid in range(len(r.array)):
+                rows = r.array[mid][:counts[mid]]
+                hit = np.flatnonzero(((rows[:, ROW.IDS_X0[0], :3] <= q) & (q < rows[:, ROW.IDS_X1[0], :3])).all(axis=1))
+                if hit.size:
+                    return (mid, int(hit[0]), rows[int(hit[0])].copy())
+            return None
+
+        found = self.read(fn)
+        if found is None:
+            raise LookupError(f"RowsReader: no row at {pos}")
+        mid, rid, row = found
+        return (self.mat.name(mid=mid), rid, row)
+
+    def close(self) -> None:
+        self.array = None
+        self.header = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> "RowsReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,96 @@
+# world/snapshot.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from world.rows import ROWS
+
+import numpy as np
+
+from world.row import ROW
+from world.materials import MATERIALS
+from utils.types import POS, NDARR
+
+
+class Snapshot:
+    """
+    Immutable view of the rows as they were at ONE edit boundary (ROWS.read_snapshot()).
+
+    - data[mid] -> read only rows of one material: a view of the live storage while no edit
+      touched that material, else the private copy the writer made before its first change
+      (copy on write per material, shared by every snapshot taken at the same version)
+    - read(mid, fn) -> fn(rows of mid): a read overlapping that first change is run again on
+      the copy (the writer copies BEFORE it writes -> the data still set after fn was unchanged)
+    - rows(mid) / boxes(mid) / volume(mat) / search(pos) -> consistent reads built on read()
+    - epoch -> ROWS.epoch when taken (edits completed so far), counts -> rows per material
+    - close() (or leaving the with block) unpins it, the copies go once no snapshot holds them
+    """
+
+    def __init__(self, rows: "ROWS" = None) -> None:
+        self.owner = rows
+        self.mat = rows.mat
+        self.epoch = rows.epoch
+        self.counts = {mid: int(n) for mid, n in rows.arids.items()}
+        self.total = int(rows.total)
+        self.data: list[NDARR | None] = []
+        for mid in range(MATERIALS.NUM):
+            view = rows.array[mid][:self.counts[mid]]
+            view.flags.writeable = False
+            self.data.append(view)
+        self.live = [True] * MATERIALS.NUM     # data[mid] still a view of the storage (no copy yet)
+
+    @property
+    def closed(self) -> bool:
+        return self.owner is None
+
+    def read(self, mid: int = None, fn: Callable[[NDARR], Any] = None) -> Any:
+        # fn must copy what it keeps: a live view changes with the next edit of the material
+        data = self.data[mid]
+        out = fn(data)
+        while self.data[mid] is not data:
+            data = self.data[mid]
+            out = fn(data)
+        return out
+
+    def rows(self, mid: int = None) -> NDARR:
+        return self.read(mid=mid, fn=lambda rows: rows.copy())
+
+    def boxes(self, mid: int = None) -> NDARR:
+        return self.read(mid=mid, fn=lambda rows: np.concatenate((rows[:, ROW.IDS_X0[0], :3], rows[:, ROW.IDS_X1[0], :3]), axis=1).astype(np.int64))
+
+    def volume(self, mat: str = None) -> int:
+        mids = range(MATERIALS.NUM) if mat is None else (self.mat.mid(name=mat),)
+        total = 0
+        for mid in mids:
+            b = self.boxes(mid=mid)
+            total += int((b[:, 3:] - b[:, :3]).prod(axis=1).sum())
+        return total
+
+    def search(self, pos: POS = None) -> tuple[str, int, NDARR]:
+        """
+        Row containing pos at the snapshot (vectorized scan) -> (mat, rid, row copy).
+        """
+        q = np.array([int(v) for v in pos], dtype=ROW.DTYPE)
+
+        def fn(rows: NDARR) -> tuple[int, NDARR] | None:
+            hit = np.flatnonzero(((rows[:, ROW.IDS_X0[0], :3] <= q) & (q < rows[:, ROW.IDS_X1[0], :3])).all(axis=1))
+            return (int(hit[0]), rows[int(hit[0])].copy()) if hit.size else None
+
+        for mid in range(MATERIALS.NUM):
+            found = self.read(mid=mid, fn=fn)
+            if found is not None:
+                return (self.mat.name(mid=mid), found[0], found[1])
+        raise LookupError(f"Snapshot: no row at {pos}")
+
+    def close(self) -> None:
+        if self.owner is not None:
+            self.owner.release(snap=self)
+            self.owner = None
+        self.data = [None] * MATERIALS.NUM
+        self.live = [False] * MATERIALS.NUM
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()